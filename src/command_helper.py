@@ -42,6 +42,8 @@ class CommandHelper:
         "load_audio": cc.PlayAudio,
         "load_music": cc.PlayAudio,
         "play_music": cc.PlayAudio,
+        "queue_music": cc.PlayAudio,
+        "music_crossfade": cc.MusicCrossfade,
         "play_sound": cc.PlayAudio,
         "play_voice": cc.PlayAudio,
         "volume_fx": cc.Volume,
@@ -168,6 +170,7 @@ class CommandHelper:
         "sprite_text": cc.SpriteText,
         "sprite_text_clear": cc.SpriteTextClear,
         "scene_with_fade": cc.SceneWithFade,
+        "scene_with_dissolve": cc.SceneWithDissolve,
         "rest": cc.Rest,
         "after": cc.AfterWithArguments,
         "after_cancel": cc.AfterCancel,
@@ -180,6 +183,7 @@ class CommandHelper:
         "remote_get": cc.RemoteGet,
         "remote_save": cc.RemoteSave,
         "remote_call": cc.RemoteCallNoArguments,
+        "remote_get_cache": cc.RemoteGetCache,
         "camera_start_shaking": cc.CameraShake,
         "camera_start_moving": cc.CameraMovement,
         "camera_stop_moving": cc.CameraStopWhere,
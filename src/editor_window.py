@@ -38,7 +38,7 @@ import archive_handler
 # from shared_components import Story
 from story_details_window import StoryDetailsWindow
 from font_sprite_properties_window import FontSpriteWindow
-from project_snapshot import ProjectSnapshot, SubPaths, FontSprite, LetterProperties
+from project_snapshot import ProjectSnapshot, SubPaths, FontSprite
 from new_project_window import ProjectFolderWindow
 from input_string_window import InputStringWindow
 from input_ask_new_folder_where import WhereNewFolderWindow
@@ -3176,33 +3176,9 @@ class OpenManager:
             if sprite_font_name in ProjectSnapshot.font_sprites:
                 # The font sprite exists, so it's OK to load its properties.
                 
-                # Convert the rect positions of the letters to a tuple, because
-                # JSON doesn't have tuples, and we need to store the rects
-                # as tuples because we will use the rects as dict keys when
-                # splitting them in the font sprite window.
-                letters: Dict = property_details.get("Letters")
-
-                # Put the kerning and rect_crop info into a LetterProperties object,
-                # and update a new dictionary with the new LetterProperties objects.
-                load_letters = {}
-                for letter, details in letters.items():
-                    rect_crop = details.get("rect_crop")
-                    kerning_rules = details.get("kerning_rules")
-                    letter_properties = LetterProperties(rect_crop=rect_crop,
-                                                        kerning_rules=kerning_rules)
-                    # New dictionary that will contain the LetterProperties
-                    load_letters[letter] = letter_properties
-                
-                # letters = {key: tuple(value.get("rect_crop")) for key, value in letters.items()}
-
-                properties = \
-                    FontSprite(
-                        width=property_details.get("Width", 0),
-                        height=property_details.get("Height", 0),
-                        padding_letters=property_details.get("PaddingLetters", 0),
-                        padding_lines=property_details.get("PaddingLines", 0),
-                        detect_letter_edges=property_details.get("DetectLetterEdges", False),
-                        letters=load_letters)
+                # Put the kerning and rect_crop info of each letter
+                # into a LetterProperties object.
+                properties = FontSprite.from_dict_data(property_details)
 
                 # Record the property of the font sprite
                 ProjectSnapshot.font_sprite_properties[sprite_font_name] \
@@ -4051,6 +4027,32 @@ class FileManager:
 
         return save_path
 
+    @staticmethod
+    def _get_font_sprite_builder_properties(image_path: Path) -> FontSprite:
+        """
+        Return the font sprite properties for a newly added font sprite.
+
+        If the font sprite was made by the font sprite builder, there will
+        be a .json file with the same name next to the image. That file
+        has the letter rects and kerning rules, so load them.
+        Otherwise, return empty font sprite properties.
+
+        :param: image_path: the path of the font sprite image being added.
+        :return: FontSprite object
+        """
+        properties_path = image_path.with_suffix(".json")
+        if not properties_path.is_file():
+            return FontSprite()
+
+        try:
+            property_details = json.loads(properties_path.read_text(encoding="utf-8"))
+            return FontSprite.from_dict_data(property_details)
+
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Could not read font sprite properties from '{properties_path.name}'.\n\n"
+                  f"Details: {e}")
+            return FontSprite()
+
     def browse_for_files(self, section_chosen: SectionChosen):
         """
         Show a file dialog and allow the user to select multiple files.
@@ -4145,7 +4147,7 @@ class FileManager:
             
             if treeview_widget == Passer.editor.treeview_font_sprites:
 
-                font_properties = FontSprite()
+                font_properties = self._get_font_sprite_builder_properties(path_object)
                 ProjectSnapshot.font_sprite_properties[file_no_extension] = font_properties
 
                         
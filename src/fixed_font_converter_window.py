@@ -933,6 +933,23 @@ class TraceToolApp:
         self.img: Image.Image
         self.img = None
 
+        # The alpha channel of the loaded image (mode 'L'), extracted once
+        # when the image is loaded so that transparency checks don't have
+        # to go through getpixel() one pixel at a time.
+        self.alpha_channel: Image.Image
+        self.alpha_channel = None
+
+        # The raw bytes of the alpha channel, one byte per pixel.
+        # alpha_rows is laid out row by row (index: y * width + x)
+        # alpha_columns is laid out column by column (index: x * height + y)
+        # so that a full row or a full column can be scanned with a single
+        # bytes slice instead of a Python loop.
+        self.alpha_rows: bytes
+        self.alpha_rows = None
+
+        self.alpha_columns: bytes
+        self.alpha_columns = None
+
         # Key: rect iid
         # Value: RectObject
         self.rects = {}
@@ -1592,6 +1609,79 @@ class TraceToolApp:
         # Generate a new sprite sheet
         self.mainwindow.event_generate("<<GenerateSpritesheet>>")        
         
+    def _load_alpha_channel(self):
+        """
+        Extract the alpha channel of the loaded image and keep its raw
+        bytes, both row by row and column by column.
+        
+        All the transparency checks in the trace tool (clicking a letter,
+        moving a rectangle's edges, auto-tracing) read from these bytes
+        instead of calling getpixel() for every pixel.
+        
+        Only RGBA images can be traced, so for other image modes,
+        the alpha data is cleared.
+        """
+        if not self.img or self.img.mode != "RGBA":
+            self.alpha_channel = None
+            self.alpha_rows = None
+            self.alpha_columns = None
+            return
+
+        self.alpha_channel = self.img.getchannel("A")
+        self.alpha_rows = self.alpha_channel.tobytes()
+
+        # A transposed copy lets us slice a whole column at once.
+        self.alpha_columns = \
+            self.alpha_channel.transpose(Image.Transpose.TRANSPOSE).tobytes()
+
+    def _row_has_opaque_pixel(self, y: int, x_from: int, x_to: int) -> bool:
+        """
+        Return whether the given row has at least one pixel
+        with an alpha greater than 0, between x_from and x_to (exclusive).
+        
+        Arguments:
+        
+        - y: the row (image coordinate) to check.
+        
+        - x_from: the first column to check.
+        
+        - x_to: the column to stop at (not checked).
+        """
+        img_width = self.img.width
+        
+        x_from = max(x_from, 0)
+        x_to = min(x_to, img_width)
+        
+        start = y * img_width
+        row = self.alpha_rows[start + x_from:start + x_to]
+        
+        # strip() removes all the fully transparent pixels; anything
+        # left over is a pixel that is not fully transparent.
+        return bool(row.strip(b"\x00"))
+
+    def _column_has_opaque_pixel(self, x: int, y_from: int, y_to: int) -> bool:
+        """
+        Return whether the given column has at least one pixel
+        with an alpha greater than 0, between y_from and y_to (exclusive).
+        
+        Arguments:
+        
+        - x: the column (image coordinate) to check.
+        
+        - y_from: the first row to check.
+        
+        - y_to: the row to stop at (not checked).
+        """
+        img_height = self.img.height
+        
+        y_from = max(y_from, 0)
+        y_to = min(y_to, img_height)
+        
+        start = x * img_height
+        column = self.alpha_columns[start + y_from:start + y_to]
+        
+        return bool(column.strip(b"\x00"))
+
     def is_transparent_pixel(self, x, y) -> bool:
         """
         Return whether a pixel with alpha 0 (100% transparent)
@@ -1605,17 +1695,11 @@ class TraceToolApp:
         Return: bool
         """
         
-        pixel = self.img.getpixel((x, y))
-
-        length = len(pixel)
-        if length == 4:
-            # Example: (120,120,120,0)
-            if pixel[3] == 0:
-                return True
-            
-        else:
+        if not self.alpha_rows:
             return False
 
+        return self.alpha_rows[y * self.img.width + x] == 0
+
     def _get_bounding_box(self,
                          x: int,
                          y: int,
@@ -1635,9 +1719,6 @@ class TraceToolApp:
         """
         
         img_width, img_height = self.img.size
-        
-        x_pos = x
-        y_pos = y
 
         img_mode = self.img.mode
         if img_mode != "RGBA":
@@ -1647,64 +1728,43 @@ class TraceToolApp:
                                  title="No Transparency")
             return
 
-        try:
-            pixel = self.img.getpixel((x, y))
-            if pixel[3] == 0:
-                print("Nothing selected")
-                return
-        except IndexError:
+        if not 0 <= x < img_width or not 0 <= y < img_height:
             # The user clicked outside of the image's coordinates.
             print("Nothing selected")
             return
 
-        # Get the left stop (alpha pixel)
-        transparent = False
-        while not transparent:
-            x_pos -= 1
-            transparent = self.is_transparent_pixel(x_pos, y_pos)
-            if x_pos == 0:
-                break
-        pixel_left = x_pos
+        if self.is_transparent_pixel(x, y):
+            print("Nothing selected")
+            return
 
-        x_pos = x
-        y_pos = y
+        # The clicked row and column, as raw alpha bytes.
+        # A fully transparent pixel is a zero byte, so finding the nearest
+        # transparent pixel in any direction is a single find() call.
+        row_start = y * img_width
+        row = self.alpha_rows[row_start:row_start + img_width]
 
-        # Get the top stop (alpha pixel)
-        transparent = False
-        while not transparent:
-            y_pos -= 1
-            transparent = self.is_transparent_pixel(x_pos, y_pos)
-            if y_pos == 0:
-                break            
-        pixel_top = y_pos
-        
-        x_pos = x
-        y_pos = y
+        column_start = x * img_height
+        column = self.alpha_columns[column_start:column_start + img_height]
 
-        # Get the right stop (alpha pixel)
-        transparent = False
-        while not transparent:
-            x_pos += 1
-            if x_pos == img_width - 1:
-                break
-            transparent = self.is_transparent_pixel(x_pos, y_pos)
+        # Get the left stop (alpha pixel)
+        # If there is no transparent pixel to the left, stop
+        # at the left edge of the image.
+        pixel_left = max(row.rfind(b"\x00", 0, x), 0)
 
+        # Get the top stop (alpha pixel)
+        pixel_top = max(column.rfind(b"\x00", 0, y), 0)
 
-        pixel_right = x_pos
-    
-        x_pos = x
-        y_pos = y
+        # Get the right stop (alpha pixel)
+        # If there is no transparent pixel to the right, stop
+        # at the last pixel of the image.
+        pixel_right = row.find(b"\x00", x + 1, img_width - 1)
+        if pixel_right == -1:
+            pixel_right = img_width - 1
 
         # Get the bottom stop (alpha pixel)
-        transparent = False
-        while not transparent:
-            y_pos += 1
-            if y_pos >= img_height - 1:
-                break            
-            transparent = self.is_transparent_pixel(x_pos, y_pos)
-
-        pixel_bottom = y_pos
-            
+        pixel_bottom = column.find(b"\x00", y + 1, img_height - 1)
+        if pixel_bottom == -1:
+            pixel_bottom = img_height - 1
             
         # print(f"{pixel_left=},{pixel_top=},{pixel_right=},{pixel_bottom=}")
 
@@ -1846,26 +1906,19 @@ class TraceToolApp:
 
         # Look for a starting opaque position.
         while not opaque_found:
-            
-            for i in range(check_from, check_to):
 
-                if direction in (Direction.UP, Direction.DOWN):
-                    pixel = self.img.getpixel((i, move_y))
+            # Is there a pixel on this row/column that is not fully transparent?
+            if direction in (Direction.UP, Direction.DOWN):
+                opaque_found = self._row_has_opaque_pixel(y=move_y,
+                                                          x_from=check_from,
+                                                          x_to=check_to)
 
-                elif direction in (Direction.LEFT, Direction.RIGHT):
-                    pixel = self.img.getpixel((move_x, i))
-                    
-  
-                # Is the pixel not fully transparent?
-                if pixel[3] > 0:
-                    # The pixel is not fully transparent.
-                    
-                    opaque_found = True
-                    
-                   # self.up_look_for_opaque = False
-                    break
-                
-            else:
+            elif direction in (Direction.LEFT, Direction.RIGHT):
+                opaque_found = self._column_has_opaque_pixel(x=move_x,
+                                                             y_from=check_from,
+                                                             y_to=check_to)
+
+            if not opaque_found:
                 # We haven't found an opaque pixel on this row.
 
                 if direction == Direction.UP:
@@ -1961,48 +2014,41 @@ class TraceToolApp:
                     break            
             
         
-            for i in range(check_from, check_to):
+            if direction in (Direction.UP, Direction.DOWN):
+                opaque_found = self._row_has_opaque_pixel(y=move_y,
+                                                          x_from=check_from,
+                                                          x_to=check_to)
 
-                if direction in (Direction.UP, Direction.DOWN):
-                    pixel = self.img.getpixel((i, move_y))
+            elif direction in (Direction.LEFT, Direction.RIGHT):
+                opaque_found = self._column_has_opaque_pixel(x=move_x,
+                                                             y_from=check_from,
+                                                             y_to=check_to)
 
-                elif direction in (Direction.LEFT, Direction.RIGHT):
-                    pixel = self.img.getpixel((move_x, i))
+            # Is there a non-transparent pixel on this row/column?
+            # If not, we've reached a row with all transparency
+            # and the loop will end.
+            if opaque_found:
+                # We've reached a non-transparent pixel
 
-                # print(pixel)
+                if direction == Direction.UP:
+                    # Move the rectangle's top higher.
+                    y0 -= 1
+                    move_y = y0
 
-                # Is the pixel non-transparent?
-                if pixel[3] > 0:
-                    # We've reached a non-transparent pixel
+                elif direction == Direction.DOWN:
+                    # Move the rectangle's bottom lower
+                    y1 += 1
+                    move_y = y1
 
-                    if direction == Direction.UP:
-                        # Move the rectangle's top higher.
-                        y0 -= 1
-                        move_y = y0
-                        break
-                    
-                    elif direction == Direction.DOWN:
-                        # Move the rectangle's bottom lower
-                        y1 += 1
-                        move_y = y1
-                        break
-
-                    elif direction == Direction.LEFT:
-                        # Move the rectangle more to the left
-                        x0 -= 1
-                        move_x = x0
-                        break
-                    
+                elif direction == Direction.LEFT:
+                    # Move the rectangle more to the left
+                    x0 -= 1
+                    move_x = x0
 
-                    elif direction == Direction.RIGHT:
-                        # Move the rectangle more to the right
-                        x1 += 1
-                        move_x = x1
-                        break                
-                    
-            else:
-                # We've reached a row with all transparency
-                opaque_found = False
+                elif direction == Direction.RIGHT:
+                    # Move the rectangle more to the right
+                    x1 += 1
+                    move_x = x1
                     
 
         x0 += self.x_offset
@@ -2050,6 +2096,151 @@ class TraceToolApp:
         
         self.show_image(selected_file)
 
+    def on_auto_trace_clicked(self):
+        """
+        Trace every letter of the loaded image in one pass, instead of
+        clicking on each letter.
+        
+        Rows of the image are grouped into lines of text (separated by fully
+        transparent rows) and each line is divided into letters (separated
+        by fully transparent columns). Each letter gets a rectangle that
+        tightly wraps its non-transparent pixels, with the line number
+        already set.
+        
+        Existing rectangles are kept. A letter that would overlap
+        an existing rectangle is skipped.
+        """
+
+        # Make sure there is a loaded source image.
+        if not self.img:
+            messagebox.showwarning(parent=self.mainwindow, 
+                                   title="No Image",
+                                   message="There is no image loaded.\n"
+                                   "Open an image first")
+            return
+
+        img_mode = self.img.mode
+        if img_mode != "RGBA":
+            messagebox.showerror(parent=self.mainwindow,
+                                 message="Only RGBA images with transparency can be traced.\n"
+                                         f"The image you have selected is of mode: {img_mode}.",
+                                 title="No Transparency")
+            return
+
+        # Deselect all rectangles; none of the new rectangles
+        # will be selected either.
+        self.active_rect_iid = None
+        self._set_rect_outline_to_black()
+
+        line_number: int
+        for line_number, letter_box in self._find_letter_boxes():
+
+            # Canvas coordinates (the image in the canvas widget is offset)
+            x0, y0, x1, y1 = (letter_box[0] + self.x_offset,
+                              letter_box[1] + self.y_offset,
+                              letter_box[2] + self.x_offset,
+                              letter_box[3] + self.y_offset)
+
+            # Don't trace over a letter that has already been traced.
+            item_iids = self.canvas_main.find_overlapping(x1=x0, y1=y0,
+                                                          x2=x1, y2=y1)
+            item_iids = [iid for iid in item_iids
+                         if iid != self.image_iid]
+            if item_iids:
+                continue
+
+            iid = self.canvas_main.create_rectangle(
+                x0, y0, x1, y1,
+                fill="",
+                outline=self.get_deselect_outline_color())
+
+            self.rects[iid] = RectObject(coordinates=(x0, y0, x1, y1),
+                                         line_number=line_number)
+
+        # Generate a new sprite sheet
+        self.mainwindow.event_generate("<<GenerateSpritesheet>>")
+
+    def _find_letter_boxes(self) -> List[Tuple[int, Tuple]]:
+        """
+        Find the bounding box of every letter in the loaded image.
+        
+        Return: a list of (line number, (x0, y0, x1, y1)) tuples, in image
+        coordinates (not canvas coordinates), from the top line to the
+        bottom line and from left to right. x1 and y1 are exclusive.
+        """
+        img_width, img_height = self.img.size
+
+        letter_boxes = []
+
+        # Find the lines of text: runs of rows that are not
+        # fully transparent.
+        empty_row = bytes(img_width)
+        rows_with_pixels = [
+            self.alpha_rows[y * img_width:(y + 1) * img_width] != empty_row
+            for y in range(img_height)]
+
+        line_runs = self._get_runs(rows_with_pixels)
+
+        for line_number, (line_top, line_bottom) in enumerate(line_runs, start=1):
+
+            # Find the letters in this line: runs of columns that
+            # are not fully transparent (within this line only).
+            empty_column = bytes(line_bottom - line_top)
+            columns_with_pixels = [
+                self.alpha_columns[x * img_height + line_top:
+                                   x * img_height + line_bottom] != empty_column
+                for x in range(img_width)]
+
+            for letter_left, letter_right in self._get_runs(columns_with_pixels):
+
+                # The line's height is the height of its tallest letter,
+                # so shrink the top and bottom to fit this letter only.
+                letter_area = self.alpha_channel.crop((letter_left,
+                                                       line_top,
+                                                       letter_right,
+                                                       line_bottom))
+                
+                # (left, top, right, bottom) of the non-zero alpha pixels
+                bounding_box = letter_area.getbbox()
+
+                letter_boxes.append((line_number,
+                                     (letter_left,
+                                      line_top + bounding_box[1],
+                                      letter_right,
+                                      line_top + bounding_box[3])))
+
+        return letter_boxes
+
+    @staticmethod
+    def _get_runs(flags: List[bool]) -> List[Tuple[int, int]]:
+        """
+        Return the (start, end) of each run of consecutive True values.
+        The end is exclusive.
+        
+        Example: [False, True, True, False, True] -> [(1, 3), (4, 5)]
+        
+        Arguments:
+        
+        - flags: a list of bools, such as whether each row of an image
+        has at least one non-transparent pixel.
+        """
+        runs = []
+        run_start = None
+
+        for index, flag in enumerate(flags):
+            if flag and run_start is None:
+                run_start = index
+                
+            elif not flag and run_start is not None:
+                runs.append((run_start, index))
+                run_start = None
+
+        # A run that reaches the end of the list.
+        if run_start is not None:
+            runs.append((run_start, len(flags)))
+
+        return runs
+
     def show_image(self, image_path: str):
         """
         Load the image from the given path and show it on the canvas widget.
@@ -2060,6 +2251,10 @@ class TraceToolApp:
 
         self.img = Image.open(image_path)
         self.photo_image = ImageTk.PhotoImage(self.img)
+
+        # Read the transparency of the whole image once, so tracing
+        # doesn't need to read pixels one at a time.
+        self._load_alpha_channel()
         
         # If there's an existing image already loaded on the canvas widget, 
         # delete it first before creating another image.
@@ -0,0 +1,551 @@
+"""
+Copyright 2023-2026 Jobin Rezai
+
+This file is part of LVNAuth.
+
+LVNAuth is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LVNAuth is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Builds a font sprite sheet from a TTF/OTF font file, instead of tracing
+a font sprite sheet by hand in the Trace Tool.
+
+The letters are rendered with Pillow (FreeType) and packed into a small
+sheet with a skyline packer. The letter rects and kerning rules are
+stored in a FontSprite object (the same object that the Font Sprite
+Properties window creates), so the sheet can be used like any other
+font sprite.
+
+Usage (command line):
+python font_sprite_builder.py my_font.ttf 24 my_font.png
+
+That creates my_font.png and my_font.json (the font sprite properties).
+When my_font.png is added to a project as a font sprite, the properties
+in my_font.json are loaded automatically.
+"""
+
+import argparse
+import json
+import math
+import string
+from pathlib import Path
+from typing import Dict, List, Tuple
+from PIL import Image, ImageDraw, ImageFont
+from project_snapshot import FontSprite
+
+
+class SkylinePacker:
+    """
+    Packs rectangles into an area with a fixed width and a growing height.
+
+    The packer keeps track of the 'skyline' (the top edge of the rectangles
+    packed so far) as a list of horizontal segments. Each new rectangle is
+    placed on the segment where its bottom would be the lowest
+    (bottom-left rule), so there are very few gaps between the rectangles.
+    """
+    def __init__(self, width: int):
+        """
+        Arguments:
+
+        - width: the width of the area to pack rectangles into.
+        """
+        self.width = width
+
+        # The height that has been used so far.
+        self.height = 0
+
+        # Each segment is [x, y, width]
+        # We start with one flat segment across the whole width.
+        self.skyline: List[List[int]]
+        self.skyline = [[0, 0, width]]
+
+    def insert(self, width: int, height: int) -> Tuple[int, int] | None:
+        """
+        Find a place for a rectangle of the given size and return its
+        top-left position (x, y), or None if it's wider than the packer.
+
+        Arguments:
+
+        - width: the width of the rectangle to pack.
+
+        - height: the height of the rectangle to pack.
+        """
+        best_index = None
+        best_x = 0
+        best_y = 0
+        best_bottom = None
+
+        for index in range(len(self.skyline)):
+            y = self._get_fit_y(index=index, width=width)
+            if y is None:
+                continue
+
+            bottom = y + height
+            if best_bottom is None or bottom < best_bottom:
+                best_index = index
+                best_x = self.skyline[index][0]
+                best_y = y
+                best_bottom = bottom
+
+        if best_index is None:
+            return None
+
+        self._add_segment(index=best_index,
+                          x=best_x,
+                          y=best_y + height,
+                          width=width)
+
+        self.height = max(self.height, best_bottom)
+
+        return best_x, best_y
+
+    def _get_fit_y(self, index: int, width: int) -> int | None:
+        """
+        Return the y position a rectangle would sit at if its left side
+        starts at the given skyline segment, or None if it doesn't fit
+        within the packer's width from there.
+
+        The rectangle sits on the highest segment that it spans.
+        """
+        x = self.skyline[index][0]
+        if x + width > self.width:
+            return None
+
+        y = 0
+        width_left = width
+
+        while width_left > 0:
+            segment_x, segment_y, segment_width = self.skyline[index]
+            y = max(y, segment_y)
+            width_left -= segment_width
+            index += 1
+
+        return y
+
+    def _add_segment(self, index: int, x: int, y: int, width: int):
+        """
+        Add the top of a newly packed rectangle to the skyline and remove
+        (or shorten) the segments that are now underneath it.
+        """
+        self.skyline.insert(index, [x, y, width])
+
+        # Shorten or remove the segments that the new rectangle covers.
+        next_index = index + 1
+        while next_index < len(self.skyline):
+            segment = self.skyline[next_index]
+            previous_segment = self.skyline[next_index - 1]
+            previous_right = previous_segment[0] + previous_segment[2]
+
+            if segment[0] >= previous_right:
+                break
+
+            overlap = previous_right - segment[0]
+            segment[0] += overlap
+            segment[2] -= overlap
+
+            if segment[2] <= 0:
+                del self.skyline[next_index]
+            else:
+                break
+
+        # Merge neighbouring segments that are at the same height.
+        merge_index = 0
+        while merge_index < len(self.skyline) - 1:
+            segment = self.skyline[merge_index]
+            next_segment = self.skyline[merge_index + 1]
+
+            if segment[1] == next_segment[1]:
+                segment[2] += next_segment[2]
+                del self.skyline[merge_index + 1]
+            else:
+                merge_index += 1
+
+
+class FontSpriteBuilder:
+    """
+    Renders the letters of a TTF/OTF font and packs them into
+    a font sprite sheet.
+
+    Every letter's rect has the same height (the font's full line height)
+    with the letter drawn on the font's baseline, because the player
+    positions every letter of a line at the same y position.
+    The width of each rect is the letter's advance width (wider if
+    the letter's pixels go past its advance, such as italic letters).
+
+    Kerning pairs are read from the font (through Pillow's text layout)
+    and turned into kerning rules. If a letter's rect is wider than
+    its advance, the kerning rules also move the letter back into place.
+    """
+
+    # The letters to render if no letters are specified.
+    DEFAULT_LETTERS = string.digits + string.ascii_letters + string.punctuation + " "
+
+    # Kerning pairs are only looked up between letters below this
+    # code point (Latin letters) unless specified otherwise, because
+    # the number of pairs grows with the square of the number of letters.
+    KERNING_MAX_CODE_POINT = 0x2B0
+
+    def __init__(self,
+                 font_path: str,
+                 font_size: int,
+                 letters: str = None,
+                 color: Tuple[int, int, int, int] = (255, 255, 255, 255),
+                 padding: int = 1,
+                 kerning_letters: str = None):
+        """
+        Arguments:
+
+        - font_path: the path to a .ttf or .otf file.
+
+        - font_size: the size of the font, in pixels.
+
+        - letters: the letters to put in the font sprite sheet.
+        Duplicate letters are ignored.
+
+        - color: the RGBA color of the letters.
+
+        - padding: transparent pixels between letters in the sheet.
+
+        - kerning_letters: the letters to look up kerning pairs for.
+        If None, all the Latin letters in 'letters' are used.
+        """
+        self.font = ImageFont.truetype(font_path, size=font_size)
+
+        if letters is None:
+            letters = FontSpriteBuilder.DEFAULT_LETTERS
+
+        # Remove duplicates, but keep the order.
+        self.letters = "".join(dict.fromkeys(letters))
+
+        self.color = color
+        self.padding = padding
+
+        if kerning_letters is None:
+            kerning_letters = "".join(
+                letter for letter in self.letters
+                if ord(letter) < FontSpriteBuilder.KERNING_MAX_CODE_POINT)
+
+        self.kerning_letters = kerning_letters
+
+        # Key: letter, Value: advance width (float)
+        self.advances: Dict[str, float]
+        self.advances = {}
+
+    def build(self) -> Tuple[Image.Image, FontSprite]:
+        """
+        Render and pack the letters.
+
+        Return: the font sprite sheet image and a FontSprite object
+        with the letter rects and kerning rules.
+        """
+
+        ascent, descent = self.font.getmetrics()
+
+        # Key: letter, Value: (left, top, right, bottom) of its pixels.
+        letter_bboxes = {letter: self.font.getbbox(letter)
+                         for letter in self.letters}
+
+        # Every letter rect shares the same top and bottom, so that the
+        # letters line up on the baseline. Some letters (accents)
+        # go above the ascent or below the descent.
+        line_top = min([0] + [bbox[1] for bbox in letter_bboxes.values()])
+        line_bottom = max([ascent + descent] + [bbox[3] for bbox in letter_bboxes.values()])
+        line_height = line_bottom - line_top
+
+        # Used for skipping letters that the font doesn't have.
+        missing_letter_image = self._get_missing_letter_image(line_top=line_top,
+                                                              line_height=line_height)
+
+        # Key: letter
+        # Value: (letter image, left overhang, right overhang)
+        letter_images = {}
+
+        for letter in self.letters:
+            advance = self._get_advance(letter)
+            bbox = letter_bboxes[letter]
+
+            # Include pixels that go past the letter's advance.
+            left = min(0, bbox[0])
+            right = max(round(advance), bbox[2])
+
+            if right - left <= 0:
+                # Zero-width letter (such as a combining mark on its own).
+                continue
+
+            letter_image = self._render_letter(letter=letter,
+                                               left=left,
+                                               line_top=line_top,
+                                               width=right - left,
+                                               height=line_height)
+
+            if not letter.isspace() \
+               and missing_letter_image is not None \
+               and letter_image.tobytes() == missing_letter_image.tobytes():
+                # The font doesn't have this letter.
+                continue
+
+            letter_images[letter] = (letter_image,
+                                     -left,
+                                     right - round(advance))
+
+        if not letter_images:
+            raise ValueError("The font has none of the given letters.")
+
+        rect_crops = self._pack_letters(letter_images=letter_images)
+
+        # Paste each letter in its packed position.
+        sheet_width = max(rect[2] for rect in rect_crops.values())
+        sheet_height = max(rect[3] for rect in rect_crops.values())
+
+        sheet = Image.new("RGBA", (sheet_width, sheet_height), (0, 0, 0, 0))
+        for letter, rect_crop in rect_crops.items():
+            sheet.paste(letter_images[letter][0], (rect_crop[0], rect_crop[1]))
+
+        overhangs = {letter: (details[1], details[2])
+                     for letter, details in letter_images.items()}
+
+        kerning_pairs = self._get_kerning_pairs(letters=[letter for letter in self.kerning_letters
+                                                         if letter in letter_images])
+
+        font_sprite = FontSprite(width=max(rect[2] - rect[0] for rect in rect_crops.values()),
+                                 height=line_height)
+
+        for letter, rect_crop in rect_crops.items():
+            kerning_rules = self._get_kerning_rules(letter=letter,
+                                                    overhangs=overhangs[letter],
+                                                    kerning_pairs=kerning_pairs)
+
+            font_sprite.add_letter(letter=letter,
+                                   rect_crop=rect_crop,
+                                   kerning_rules=kerning_rules)
+
+        return sheet, font_sprite
+
+    def save(self, image_path: str) -> Tuple[Path, Path]:
+        """
+        Build the font sprite sheet and save it as a .png, along with
+        a .json file (same name) that contains the font sprite properties.
+
+        Arguments:
+
+        - image_path: where to save the .png file.
+
+        Return: the paths of the .png file and the .json file.
+        """
+        sheet, font_sprite = self.build()
+
+        image_path = Path(image_path).with_suffix(".png")
+        properties_path = image_path.with_suffix(".json")
+
+        sheet.save(image_path)
+        properties_path.write_text(json.dumps(font_sprite._get_dict_data(),
+                                              indent=4,
+                                              ensure_ascii=False),
+                                   encoding="utf-8")
+
+        return image_path, properties_path
+
+    def _get_advance(self, letter: str) -> float:
+        """
+        Return the advance width of a letter (cached).
+        """
+        advance = self.advances.get(letter)
+        if advance is None:
+            advance = self.font.getlength(letter)
+            self.advances[letter] = advance
+
+        return advance
+
+    def _render_letter(self,
+                       letter: str,
+                       left: int,
+                       line_top: int,
+                       width: int,
+                       height: int) -> Image.Image:
+        """
+        Draw a letter on a new transparent image, on the shared baseline.
+        """
+        letter_image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+        draw = ImageDraw.Draw(letter_image)
+        draw.text((-left, -line_top), letter, font=self.font, fill=self.color)
+
+        return letter_image
+
+    def _get_missing_letter_image(self, line_top: int, line_height: int) -> Image.Image | None:
+        """
+        Render a code point that no font has, which shows the font's
+        'missing letter' image (usually an empty box).
+        Letters that render the same way are not in the font.
+        """
+        missing_letter = "\U0010FFFD"
+
+        bbox = self.font.getbbox(missing_letter)
+        left = min(0, bbox[0])
+        right = max(round(self._get_advance(missing_letter)), bbox[2])
+
+        if right - left <= 0:
+            return None
+
+        return self._render_letter(letter=missing_letter,
+                                   left=left,
+                                   line_top=line_top,
+                                   width=right - left,
+                                   height=line_height)
+
+    def _pack_letters(self, letter_images: Dict) -> Dict[str, Tuple[int, int, int, int]]:
+        """
+        Pack the letter images with a skyline packer.
+
+        Return: key: letter, value: rect_crop (left, upper, right, lower)
+        """
+        padding = self.padding
+
+        sizes = {letter: details[0].size
+                 for letter, details in letter_images.items()}
+
+        # Aim for a roughly square sheet.
+        total_area = sum((width + padding) * (height + padding)
+                         for width, height in sizes.values())
+        widest = max(width for width, height in sizes.values())
+
+        packer = SkylinePacker(width=max(widest + padding,
+                                         math.ceil(math.sqrt(total_area))))
+
+        # Taller letters first, then wider letters first, packs tighter.
+        packing_order = sorted(sizes,
+                               key=lambda letter: (sizes[letter][1], sizes[letter][0]),
+                               reverse=True)
+
+        rect_crops = {}
+        for letter in packing_order:
+            width, height = sizes[letter]
+            x, y = packer.insert(width=width + padding,
+                                 height=height + padding)
+
+            rect_crops[letter] = (x, y, x + width, y + height)
+
+        # Keep the letters in the order they were given.
+        return {letter: rect_crops[letter] for letter in letter_images}
+
+    def _get_kerning_pairs(self, letters: List[str]) -> Dict[Tuple[str, str], int]:
+        """
+        Look up the font's kerning between every pair of the given letters.
+
+        The kerning is the difference between the width of the two letters
+        drawn together and the sum of their separate advance widths.
+
+        Return: key: (previous letter, letter), value: kerning in pixels.
+        Only pairs with kerning are included.
+        """
+        kerning_pairs = {}
+
+        for previous_letter in letters:
+            previous_advance = self._get_advance(previous_letter)
+
+            for letter in letters:
+                kerning = self.font.getlength(previous_letter + letter) \
+                    - previous_advance - self._get_advance(letter)
+
+                kerning = round(kerning)
+                if kerning:
+                    kerning_pairs[(previous_letter, letter)] = kerning
+
+        return kerning_pairs
+
+    @staticmethod
+    def _get_kerning_rules(letter: str,
+                           overhangs: Tuple[int, int],
+                           kerning_pairs: Dict[Tuple[str, str], int]) -> List[Tuple]:
+        """
+        Return the kerning rules of a letter, in the same format that the
+        Font Sprite Properties window uses:
+        [(previous_letters, left_trim, right_trim), ...]
+
+        The player moves the letter by the left trim and moves the letters
+        after it by the right trim. So a kerning of -2 becomes (-2, -2).
+
+        If the letter's rect is wider than its advance (overhangs),
+        the trims also pull the letter back so its advance lines up.
+        That's applied to all previous letters with an "(Any)" rule.
+
+        Arguments:
+
+        - letter: the letter to get the kerning rules for.
+
+        - overhangs: (left overhang, right overhang), how many pixels the
+        letter's rect goes past its advance width on each side.
+
+        - kerning_pairs: key: (previous letter, letter), value: kerning.
+        """
+        overhang_left, overhang_right = overhangs
+
+        def get_trims(kerning: int) -> Tuple[int, int]:
+            left_trim = kerning - overhang_left
+            right_trim = kerning - overhang_left - overhang_right
+            return left_trim, right_trim
+
+        kerning_rules = []
+
+        # The "(Any)" rule must come first, because the player lets an
+        # "(Any)" rule override the specific rules that come before it.
+        if overhang_left or overhang_right:
+            kerning_rules.append(("(Any)",) + get_trims(0))
+
+        # Group the previous letters that have the same kerning.
+        # Key: kerning, Value: previous letters
+        previous_letters_by_kerning: Dict[int, List[str]]
+        previous_letters_by_kerning = {}
+        for (previous_letter, kerned_letter), kerning in kerning_pairs.items():
+            if kerned_letter != letter:
+                continue
+
+            previous_letters_by_kerning.setdefault(kerning, []).append(previous_letter)
+
+        for kerning, previous_letters in sorted(previous_letters_by_kerning.items()):
+            # Sorted, so the previous letters can never spell "(Any)".
+            kerning_rules.append(("".join(sorted(previous_letters)),) + get_trims(kerning))
+
+        return kerning_rules
+
+
+if __name__ == "__main__":
+    read_arguments = argparse.ArgumentParser(
+        description="Build an LVNAuth font sprite sheet from a TTF/OTF font.")
+
+    read_arguments.add_argument("font_path", help="Path to a .ttf or .otf file")
+    read_arguments.add_argument("font_size", type=int, help="Font size in pixels")
+    read_arguments.add_argument("output_path", help="Path of the .png to create")
+    read_arguments.add_argument("--letters", help="The letters to include")
+    read_arguments.add_argument("--letters-file",
+                                help="A UTF-8 text file with the letters to include")
+    read_arguments.add_argument("--color", default="255,255,255,255",
+                                help="Letter color as R,G,B,A")
+
+    arguments = read_arguments.parse_args()
+
+    letters = arguments.letters
+    if arguments.letters_file:
+        letters = Path(arguments.letters_file).read_text(encoding="utf-8").replace("\n", "")
+
+    color = tuple(int(value) for value in arguments.color.split(","))
+
+    builder = FontSpriteBuilder(font_path=arguments.font_path,
+                                font_size=arguments.font_size,
+                                letters=letters,
+                                color=color)
+
+    saved_image_path, saved_properties_path = builder.save(arguments.output_path)
+
+    print(f"Saved {saved_image_path} and {saved_properties_path}")
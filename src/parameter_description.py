@@ -78,6 +78,8 @@ class ParameterDescription:
         self.data = {"load_audio": ("Audio name",),
                      "load_music": ("Music name",), 
                      "play_music": ("Music name", "(optional) Loop playback"),
+                     "queue_music": ("Music name", ),
+                     "music_crossfade": ("Number of seconds to cross-fade", ),
                      "play_sound": ("Sound name", ),
                      "play_voice": ("Voice sound", ),
                      "volume_fx": ("Volume (0 to 100)", ),
@@ -219,6 +221,7 @@ class ParameterDescription:
                      "sprite_text_clear": ("Sprite type", "Sprite alias"),
                      
                      "scene_with_fade": ("Background color (hex)", "Fade-in speed (1 to 100)", "Fade-out speed (1 to 100)", "Number of seconds to hold", "Chapter name", "Scene name"),
+                     "scene_with_dissolve": ("Dissolve speed (1 to 100)", "Chapter name", "Scene name"),
                      "rest": ("Number of seconds to pause",),
                      "after": ("Number of seconds to elapse", "Reusable script name", "*(optional) Arguments to pass to the reusable script"),
                      "after_cancel": ("Reusable script name",),
@@ -234,6 +237,7 @@ class ParameterDescription:
                      "remote_get": ("Save slot name", "(optional) Variable name"),
                      "remote_save": ("*Key=value arguments", ),
                      "remote_call": ("Custom action name", "*(optional) Key=value arguments", ),
+                     "remote_get_cache": ("Number of seconds to re-use a value", ),
                      
                      "camera_start_shaking": ("Intensity (0.01 to 100)", "Duration in seconds (0.01 to 100)"),
                      "camera_start_moving": ("Target X", "Target Y", "Zoom (0 to 20)", "Duration in seconds (0 to 600)", "Smoothing style"),
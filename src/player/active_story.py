@@ -26,7 +26,7 @@ import sprite_definition as sd
 from file_reader import ContentType
 from audio_player import AudioPlayer
 from typing import Tuple, List
-from shared_components import MouseActionsAndCoordinates
+from shared_components import MouseActionsAndCoordinates, Passer
 from player_config_handler import PlayerConfigHandler
 from enum import Enum, auto
 from pathlib import Path
@@ -85,6 +85,16 @@ class ActiveStory:
         self.main_surface = main_surface
         
         self.camera = camera
+        
+        # Increases each time something different gets drawn on the
+        # virtual surface. The camera uses this to know whether it needs
+        # to rescale the virtual surface or whether it can reuse the
+        # previous frame's scaled image.
+        self.content_version = 0
+        
+        # What was drawn on the virtual surface in the last frame.
+        # Used for knowing when to increase content_version.
+        self.last_render_signature = None
 
         self.reader = story_reader.StoryReader(story=self,
                                                data_requester=self.data_requester,
@@ -138,7 +148,15 @@ class ActiveStory:
         
         # Used for playing all audio.
         # The audio channels will be initialized automatically as needed.
-        self.audio_player = AudioPlayer()
+        # How many sounds of each category can overlap can be changed
+        # in the visual novel's config file (vn_data).
+        self.audio_player = AudioPlayer(
+            fx_channels=self.get_audio_channels_setting(
+                "FxChannels", AudioPlayer.FX_CHANNELS),
+            voice_channels=self.get_audio_channels_setting(
+                "VoiceChannels", AudioPlayer.VOICE_CHANNELS),
+            text_channels=self.get_audio_channels_setting(
+                "TextChannels", AudioPlayer.TEXT_CHANNELS))
 
         ## Key: item name, Value: pygame image (converted and ready for use)
         ## The dictionaries below will only be populated as-requested by the story script(s).
@@ -153,6 +171,41 @@ class ActiveStory:
         self.sounds = {}
         self.music = {}
 
+    @staticmethod
+    def get_audio_channels_setting(option_name: str, default: int) -> int:
+        """
+        Return the number of audio channels to use for a category of audio,
+        from the visual novel's config file (vn_data).
+        
+        For example, to let 8 sound effects play at the same time:
+        FxChannels = 8
+        
+        Arguments:
+        
+        - option_name: 'FxChannels', 'VoiceChannels' or 'TextChannels'
+        
+        - default: the number of channels to use if the option
+        is not in the config file or is not a whole number above 0.
+        """
+        
+        if not Passer.player_config:
+            return default
+        
+        channels = Passer.player_config.get_data(option_name)
+        if not channels:
+            return default
+        
+        try:
+            channels = int(channels)
+        except ValueError:
+            print(f"{option_name} in the config file is not a whole number.")
+            return default
+        
+        if channels < 1:
+            return default
+        
+        return channels
+
     def get_visible_sprite(self,
                            content_type: ContentType,
                            general_alias: str = None,
@@ -345,6 +398,10 @@ class ActiveStory:
             
         # Elapse the seconds counter if the cover screen is animating.
         self.cover_screen_handler.update()
+        
+        # Start music cross-fades that were waiting for a track to be
+        # decoded, and keep track of queued music.
+        self.audio_player.update()
             
         # Consider the mouse not clicked anymore, just in case if it was
         # seen as clicked in the current frame. All the sprite group update()
@@ -393,6 +450,16 @@ class ActiveStory:
         sd.Groups.background_group.draw(self.virtual_surface)
         sd.Groups.object_group.draw(self.virtual_surface)
         sd.Groups.character_group.draw(self.virtual_surface)
+        
+        # Has anything changed on the virtual surface since last frame?
+        render_signature =\
+            (sd.Groups.background_group.get_draw_signature(),
+             sd.Groups.object_group.get_draw_signature(),
+             sd.Groups.character_group.get_draw_signature())
+        
+        if render_signature != self.last_render_signature:
+            self.last_render_signature = render_signature
+            self.content_version += 1
 
         ###############################################
         #if self.dialog_rectangle and self.dialog_rectangle.visible:
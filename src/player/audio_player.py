@@ -17,15 +17,15 @@ You should have received a copy of the GNU Lesser General Public License
 along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import tempfile
-import os
+import threading
 import pygame
 import file_reader
 from io import BytesIO
+from collections import OrderedDict
 from enum import Enum, auto
+from typing import Dict, List
 from shared_components import Passer
-from temp_handler import TempHandler, TempContentType
-from pathlib import Path
+from temp_handler import MusicFile
 
 
 
@@ -38,30 +38,357 @@ class AudioChannel(Enum):
 
 
 
-class AudioPlayer:
-
-    def __init__(self):
+class SoundCache:
+    """
+    Keeps decoded pygame Sound objects so that sounds which are played
+    often (such as dialogue text sounds and button clicks) don't have to be
+    copied out of the story data and decoded every time they're played.
+    
+    The least recently played sounds are removed first when the decoded
+    sounds go over the byte budget.
+    
+    Music is not cached here. Music tracks are kept as music files
+    instead (see AudioPlayer.music_files).
+    """
+    
+    # The default budget for decoded sounds (32 MB).
+    # Decoded sounds are raw samples, so they are much larger than
+    # the .ogg files they came from.
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        
+        self.max_bytes = max_bytes
+        
+        # Key: audio name, Value: pygame.mixer.Sound
+        # The most recently used sound is at the end.
+        self.sounds: OrderedDict[str, pygame.mixer.Sound]
+        self.sounds = OrderedDict()
+        
+        # Key: audio name, Value: the decoded size of the sound, in bytes.
+        self.sound_sizes: Dict[str, int]
+        self.sound_sizes = {}
+        
+        self.total_bytes = 0
+        
+        # How many times a sound was found in the cache (hits)
+        # or had to be decoded (misses).
+        self.hits = 0
+        self.misses = 0
+        
+    def __contains__(self, audio_name: str) -> bool:
+        return audio_name in self.sounds
+        
+    def get(self, audio_name: str) -> pygame.mixer.Sound | None:
+        """
+        Return the cached sound of the given name and mark it as the
+        most recently used, or None if it's not cached.
+        """
+        sound = self.sounds.get(audio_name)
+        
+        if sound is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.sounds.move_to_end(audio_name)
+            
+        return sound
+    
+    def add(self, audio_name: str, sound: pygame.mixer.Sound):
+        """
+        Cache a decoded sound, removing the least recently used sounds
+        if needed to stay within the byte budget.
+        
+        A sound that is bigger than the whole budget is not cached.
+        """
+        self.remove(audio_name)
+        
+        sound_size = self.get_sound_size(sound)
+        if sound_size > self.max_bytes:
+            return
+        
+        while self.sounds and self.total_bytes + sound_size > self.max_bytes:
+            # A sound that is still playing is not cut off; the channel
+            # it's playing in keeps its own reference to it.
+            oldest_name = next(iter(self.sounds))
+            self.remove(oldest_name)
+            
+        self.sounds[audio_name] = sound
+        self.sound_sizes[audio_name] = sound_size
+        self.total_bytes += sound_size
+        
+    def remove(self, audio_name: str):
+        """
+        Remove a sound from the cache, if it's cached.
+        """
+        if audio_name not in self.sounds:
+            return
+        
+        del self.sounds[audio_name]
+        self.total_bytes -= self.sound_sizes.pop(audio_name)
+        
+    def clear(self):
+        self.sounds.clear()
+        self.sound_sizes.clear()
+        self.total_bytes = 0
+        
+    @staticmethod
+    def get_sound_size(sound: pygame.mixer.Sound) -> int:
+        """
+        Return roughly how many bytes the decoded sound uses, based on its
+        length and the mixer's format (without copying the samples).
+        """
+        mixer_settings = pygame.mixer.get_init()
+        if not mixer_settings:
+            return 0
+        
+        frequency, sample_format, channels = mixer_settings
+        
+        # The sample format is in bits, such as -16 for signed 16-bit.
+        bytes_per_sample = abs(sample_format) // 8
+        
+        return round(sound.get_length() * frequency) * channels * bytes_per_sample
+    
+    def get_report(self) -> str:
+        """
+        Return a one-line summary of the cache, for the memory report.
+        """
+        return (f"Sound cache: {len(self.sounds)} sounds, "
+                f"{self.total_bytes / 1048576:.1f} of "
+                f"{self.max_bytes / 1048576:.1f} MB, "
+                f"{self.hits} hits, {self.misses} misses")
 
-        # Limit it to 3 audio channels (excluding the music channel)
-        # (built-in pygame music channel) - Music channel
-        # 0 - Sound FX channel
-        # 1 - Voice channel
-        # 2 - Text (letter) channel
-        pygame.mixer.set_num_channels(3)
 
-        self.channel_fx: pygame.mixer.Channel
-        self.channel_fx = pygame.mixer.Channel(0)
+class ChannelPool:
+    """
+    A group of pygame mixer channels for one category of audio
+    (FX, voice or text), so that sounds of the same category can overlap
+    instead of cutting each other off.
+    
+    When all the channels of the pool are busy, a channel is 'stolen' for
+    the new sound. The priorities are:
+    1. A channel that is already playing the same audio name (so repeating
+    the same sound, such as rapid button clicks, doesn't cut off other sounds).
+    2. The channel whose sound started playing the longest time ago.
+    """
+    def __init__(self, first_channel_id: int, number_of_channels: int):
+        """
+        Arguments:
+        
+        - first_channel_id: the pygame mixer channel id of the first
+        channel in this pool. The pool uses the channel ids after it too.
+        
+        - number_of_channels: how many channels the pool has (at least 1).
+        """
+        
+        number_of_channels = max(1, number_of_channels)
+        
+        self.channels: List[pygame.mixer.Channel]
+        self.channels = [pygame.mixer.Channel(channel_id)
+                         for channel_id in range(first_channel_id,
+                                                 first_channel_id + number_of_channels)]
+        
+        # The audio name last played in each channel (same order as channels).
+        self.channel_audio_names: List[str | None]
+        self.channel_audio_names = [None] * number_of_channels
+        
+        # When each channel last started a sound (same order as channels).
+        # It's a play counter, not a time, so it's only used for 
+        # finding the oldest sound.
+        self.channel_play_orders: List[int]
+        self.channel_play_orders = [0] * number_of_channels
+        
+        self.play_count = 0
+        
+    def play(self, sound: pygame.mixer.Sound, audio_name: str, volume: float):
+        """
+        Play a sound in a free channel of the pool (or in a stolen channel
+        if they're all busy).
+        
+        Arguments:
+        
+        - sound: the decoded sound to play.
+        
+        - audio_name: the resource/item name of the sound.
+        
+        - volume: the category's volume (0 to 1).
+        """
+        channel_index = self._get_channel_index(audio_name=audio_name)
+        channel = self.channels[channel_index]
+        
+        self.play_count += 1
+        self.channel_audio_names[channel_index] = audio_name
+        self.channel_play_orders[channel_index] = self.play_count
+        
+        # Playing a sound on a busy channel stops the sound that was
+        # playing in it.
+        channel.set_volume(volume)
+        channel.play(sound)
+        
+    def _get_channel_index(self, audio_name: str) -> int:
+        """
+        Return the index of the channel that the next sound should play in.
+        """
+        busy_indexes = []
+        
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                # A free channel.
+                return index
+            
+            busy_indexes.append(index)
+            
+        # All the channels are busy, so steal one.
+        # Prefer a channel that's playing the same audio.
+        same_audio_indexes = [index for index in busy_indexes
+                              if self.channel_audio_names[index] == audio_name]
+        if same_audio_indexes:
+            busy_indexes = same_audio_indexes
+            
+        # The sound that started the longest time ago.
+        return min(busy_indexes,
+                   key=lambda index: self.channel_play_orders[index])
+    
+    def stop(self):
+        """
+        Stop all the channels in the pool.
+        """
+        for channel in self.channels:
+            if channel.get_busy():
+                channel.stop()
+                
+    def set_volume(self, volume: float):
+        """
+        Set the volume of all the channels in the pool.
+        """
+        for channel in self.channels:
+            channel.set_volume(volume)
 
-        self.channel_voice: pygame.mixer.Channel
-        self.channel_voice = pygame.mixer.Channel(1)
 
-        self.channel_text: pygame.mixer.Channel
-        self.channel_text = pygame.mixer.Channel(2)
+class AudioPlayer:
+    
+    # The default number of mixer channels for each category of audio
+    # (excluding music, which uses pygame's built-in music channel).
+    # FX can overlap (such as rapid button clicks or ambient layers),
+    # while a new voice line or text sound replaces the previous one.
+    FX_CHANNELS = 4
+    VOICE_CHANNELS = 1
+    TEXT_CHANNELS = 1
+    
+    # Two channels are kept for cross-fading music: the new track fades in
+    # on one while the previous track fades out.
+    MUSIC_FADE_CHANNELS = 2
+    
+    # The most bytes of music files (see temp_handler.MusicFile) to keep.
+    # Music files are copies of the tracks as they are in the story
+    # (.ogg/.wav), not decoded, so this fits a good number of tracks.
+    MAX_MUSIC_FILE_BYTES = 64 * 1024 * 1024
+    
+    # How many decoded music tracks (for cross-fades) to keep at a time.
+    # Decoded music is large (about 10 MB per minute), so keep only a few.
+    MAX_PREPARED_MUSIC = 2
+
+    def __init__(self,
+                 fx_channels: int = FX_CHANNELS,
+                 voice_channels: int = VOICE_CHANNELS,
+                 text_channels: int = TEXT_CHANNELS):
+        """
+        Arguments:
+        
+        - fx_channels: how many FX sounds can play at the same time.
+        
+        - voice_channels: how many voice sounds can play at the same time.
+        
+        - text_channels: how many letter-by-letter text sounds
+        can play at the same time.
+        """
+        
+        fx_channels = max(1, fx_channels)
+        voice_channels = max(1, voice_channels)
+        text_channels = max(1, text_channels)
+
+        # The channels are numbered in this order (excluding the
+        # built-in pygame music channel):
+        # FX channels, then voice channels, then text (letter) channels,
+        # then the music cross-fade channels.
+        first_music_channel_id = fx_channels + voice_channels + text_channels
+        
+        pygame.mixer.set_num_channels(first_music_channel_id
+                                      + AudioPlayer.MUSIC_FADE_CHANNELS)
+
+        self.channel_fx: ChannelPool
+        self.channel_fx = ChannelPool(first_channel_id=0,
+                                      number_of_channels=fx_channels)
+
+        self.channel_voice: ChannelPool
+        self.channel_voice = ChannelPool(first_channel_id=fx_channels,
+                                         number_of_channels=voice_channels)
+
+        self.channel_text: ChannelPool
+        self.channel_text = ChannelPool(first_channel_id=fx_channels + voice_channels,
+                                        number_of_channels=text_channels)
+
+        # Music that has been cross-faded in is a decoded sound which
+        # plays in one of these channels instead of pygame's music stream.
+        self.channels_music: List[pygame.mixer.Channel]
+        self.channels_music = [pygame.mixer.Channel(channel_id)
+                               for channel_id in range(first_music_channel_id,
+                                                       first_music_channel_id
+                                                       + AudioPlayer.MUSIC_FADE_CHANNELS)]
+        
+        # The music channel that the current track is playing in,
+        # or None if the current track is streamed.
+        self.active_channel_music: pygame.mixer.Channel
+        self.active_channel_music = None
 
         self.loaded_music = None
-        self.loaded_fx = None
-        self.loaded_voice = None
-        self.loaded_text = None
+        
+        # Whether the current track repeats when it ends.
+        # A looping track never ends, so nothing can be queued after it.
+        self.music_looping = False
+        
+        # How long changing music tracks should cross-fade for
+        # (set with <music_crossfade>). 0 means no cross-fade.
+        self.music_crossfade_seconds = 0
+        
+        # The music tracks that have been played or queued, so playing
+        # them again doesn't copy them again.
+        # The least recently used music files are closed first when they
+        # go over MAX_MUSIC_FILE_BYTES.
+        # Key: music name, Value: MusicFile
+        self.music_files: OrderedDict[str, MusicFile]
+        self.music_files = OrderedDict()
+        
+        # Music tracks decoded in a background thread (with <load_music>
+        # or before a cross-fade), so they can play alongside the current track.
+        # Key: music name, Value: pygame.mixer.Sound
+        self.prepared_music: OrderedDict[str, pygame.mixer.Sound]
+        self.prepared_music = OrderedDict()
+        
+        # The music names being decoded in the background right now.
+        self.preparing_music = set()
+        
+        # Used when the background thread adds a decoded track.
+        self.prepared_music_lock = threading.Lock()
+        
+        # A track that should cross-fade in as soon as it has been decoded.
+        # (music name, loop music) or None
+        self.pending_music = None
+        
+        # The track to play after the current track (<queue_music>),
+        # so that there is no gap between the two tracks.
+        self.queued_music = None
+        
+        # The position of the streamed music (pygame.mixer.music.get_pos())
+        # on the last frame. pygame starts the position from 0 when a queued
+        # streamed track starts, so this is used for knowing when that happens.
+        self.music_position = 0
+        
+        # The queued decoded track, once it has been queued in the current
+        # track's channel. The queued track is still waiting to start
+        # until the channel is playing it.
+        self.queued_music_sound: pygame.mixer.Sound
+        self.queued_music_sound = None
 
         # Volume is 0 to 1 (ie: 0.5 means 50% volume)
         self._volume_music = 1
@@ -69,12 +396,9 @@ class AudioPlayer:
         self._volume_voice = 1
         self._volume_text = 1
         
-        # Full path to a music file in a temporary folder.
-        # We use a temporary folder to stream music files because it's
-        # more reliable than streaming from a BytesIO object when used
-        # with GIL and pygame-ce.
-        self.current_temp_music_path:Path
-        self.current_temp_music_path = None
+        # Decoded sounds (FX, voice, text) that have been played
+        # or preloaded with <load_audio>.
+        self.sound_cache = SoundCache()
         
     def stop_audio(self, audio_channel: AudioChannel):
         """
@@ -83,30 +407,22 @@ class AudioPlayer:
         """
 
         if audio_channel == AudioChannel.MUSIC:
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
+            self._stop_music()
 
         elif audio_channel == AudioChannel.FX:
-            if self.channel_fx:
-                self.channel_fx.stop()
+            self.channel_fx.stop()
 
         #elif audio_channel == AudioChannel.TEXT:
-            #if self.channel_text:
-                #self.channel_text.stop()
+            #self.channel_text.stop()
                 
         elif audio_channel == AudioChannel.VOICE:
-            if self.channel_voice.get_busy():
-                self.channel_voice.stop()
+            self.channel_voice.stop()
                 
         elif audio_channel == AudioChannel.ALL:
-            if self.channel_voice.get_busy():
-                self.channel_voice.stop()
+            self.channel_voice.stop()
+            self.channel_fx.stop()
 
-            if self.channel_fx.get_busy():
-                self.channel_fx.stop()
-
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
+            self._stop_music()
 
     @property
     def volume_text(self):
@@ -116,7 +432,7 @@ class AudioPlayer:
     def volume_text(self, value: float):
         self._volume_text = value
 
-        # Set the volume for the channel.
+        # Set the volume for the channels.
         self.channel_text.set_volume(value)
 
     @property
@@ -127,7 +443,7 @@ class AudioPlayer:
     def volume_sound(self, value: float):
         self._volume_sound = value
 
-        # Set the volume for the channel
+        # Set the volume for the channels
         self.channel_fx.set_volume(value)
           
     @property
@@ -138,7 +454,7 @@ class AudioPlayer:
     def volume_voice(self, value: float):
         self._volume_voice = value
 
-        # Set the volume for the channel
+        # Set the volume for the channels
         self.channel_voice.set_volume(value)
     
     @property
@@ -151,6 +467,10 @@ class AudioPlayer:
 
         # Set the volume for the channel
         pygame.mixer.music.set_volume(value)
+        
+        # and for music that has been cross-faded in.
+        for channel in self.channels_music:
+            channel.set_volume(value)
 
     def play_audio(self,
                    audio_name: str,
@@ -171,215 +491,472 @@ class AudioPlayer:
         if not audio_name:
             return
         
-        if audio_channel in (AudioChannel.FX, AudioChannel.TEXT,
-                             AudioChannel.VOICE):
-            content_type = file_reader.ContentType.AUDIO
+        if audio_channel not in (AudioChannel.FX, AudioChannel.TEXT,
+                                 AudioChannel.VOICE, AudioChannel.MUSIC):
+            return
 
-        elif audio_channel == AudioChannel.MUSIC:
-            content_type = file_reader.ContentType.MUSIC
+        if audio_channel == AudioChannel.MUSIC:
 
-        else:
+            music_file = self._get_music_file(audio_name=audio_name)
+            if not music_file:
+                return
+
+            self._play_music(audio_name=audio_name,
+                             music_file=music_file,
+                             loop_music=loop_music)
+            return
+
+        sound = self._get_sound(audio_name=audio_name)
+        if not sound:
+            return
+
+        self._play_audio_in_channel(audio_channel=audio_channel,
+                                    audio_name=audio_name,
+                                    sound=sound)
+
+    def preload_audio(self, audio_name: str):
+        """
+        Decode a sound (FX, voice, text) and keep it in the sound cache,
+        so the first time it's played, it doesn't need to be decoded.
+        
+        Used with <load_audio>.
+        
+        Arguments:
+        
+        - audio_name: the resource/item name of the sound to preload.
+        """
+        if not audio_name or audio_name in self.sound_cache:
             return
+        
+        self._load_sound(audio_name=audio_name)
 
+    def _get_sound(self, audio_name: str) -> pygame.mixer.Sound | None:
+        """
+        Return the decoded sound of the given name, from the sound cache
+        if it's there, otherwise decode it and cache it.
+        
+        Arguments:
+        
+        - audio_name: the resource/item name of the sound.
+        """
+        sound = self.sound_cache.get(audio_name)
+        if sound:
+            return sound
+        
+        return self._load_sound(audio_name=audio_name)
+    
+    def _load_sound(self, audio_name: str) -> pygame.mixer.Sound | None:
+        """
+        Decode a sound from the story data and add it to the sound cache.
+        
+        Return the new Sound object or None if the audio name wasn't found.
+        
+        Arguments:
+        
+        - audio_name: the resource/item name of the sound.
+        """
+        
         # Get the bytes of the sound along with the file extension.
         audio_data =\
-            Passer.active_story.data_requester.get_audio(content_type=content_type,
+            Passer.active_story.data_requester.get_audio(content_type=file_reader.ContentType.AUDIO,
                                                          item_name=audio_name)
 
         if not audio_data:
             return
         else:
             sound_bytes, file_extension = audio_data
+            
+        # pygame works well with BytesIO
+        # Convert the bytes sound to a BytesIO stream
+        io_bytes_data = BytesIO(sound_bytes)
 
-        if audio_channel == AudioChannel.MUSIC:
-
-            self._play_music(audio_name=audio_name,
-                             file_extension=file_extension, 
-                             bytes_data=sound_bytes,
-                             loop_music=loop_music)
-
-        else:
-            self._play_audio_in_channel(audio_channel=audio_channel,
-                                        audio_name=audio_name,
-                                        bytes_data=sound_bytes)
+        # Initialize a new sound object.
+        sound = pygame.mixer.Sound(file=io_bytes_data)
+        
+        self.sound_cache.add(audio_name=audio_name, sound=sound)
+        
+        return sound
 
-    def _play_music(self, audio_name: str, file_extension: str,
-                    bytes_data: bytes, loop_music: bool):
+    def _get_music_file(self, audio_name: str) -> MusicFile | None:
         """
-        Play a music file (.wav or .ogg) by copying it to a temp directory
-        and playing it from the temp directory.
-        
-        The reason we don't stream a music file directly from RAM is because
-        the GIL appears to get in the way when streaming a music
-        file, so sometimes the music will stop abruptly if we stream from RAM.
+        Return the music file of a track, copying the track out of the
+        story's data the first time the track is needed.
         
         Arguments:
         
-        - audio_name: the audio resource name, with no extension.
+        - audio_name: the music's resource name.
+        """
+        music_file = self.music_files.get(audio_name)
         
-        - file_extension: such as ".ogg". We use the extension to create a
-        temp file. Pygame needs the extension to know the type of audio it is.
+        if music_file:
+            self.music_files.move_to_end(audio_name)
+            return music_file
         
-        - bytes_data: the audio data
+        music_data =\
+            Passer.active_story.data_requester.get_audio_stream(content_type=file_reader.ContentType.MUSIC,
+                                                                item_name=audio_name)
+        if not music_data:
+            return
         
-        - loop_music: whether to repeat the audio after playback is finished.
+        music_stream, file_extension = music_data
+        
+        music_file = MusicFile(music_stream=music_stream,
+                               file_extension=file_extension)
         
+        self.music_files[audio_name] = music_file
         
+        # Close the least recently used music files if there are too many,
+        # but always keep the one we just made.
+        while len(self.music_files) > 1 \
+              and sum(cached_file.size for cached_file
+                      in self.music_files.values()) > AudioPlayer.MAX_MUSIC_FILE_BYTES:
+            oldest_name, oldest_music_file = self.music_files.popitem(last=False)
+            oldest_music_file.close()
+        
+        return self.music_files[audio_name]
+    
+    def _play_music(self, audio_name: str, music_file: MusicFile,
+                    loop_music: bool):
+        """
+        Play a music track (.wav or .ogg) from its music file.
+        
+        SDL opens the music file by its path, so SDL's audio thread reads
+        the track without needing Python's GIL. On Linux, nothing is written
+        to the disk (see MusicFile).
+        
+        If a music cross-fade has been set with <music_crossfade> and
+        a different track is playing, the new track is cross-faded in
+        instead. A cross-fade needs the new track decoded, so if it wasn't
+        prepared with <load_music>, it gets decoded in a background thread
+        while the current track keeps playing, and it fades in
+        once it's ready (see update()).
+        
+        Arguments:
+        
+        - audio_name: the audio resource name, with no extension.
+        
+        - music_file: the track's music file.
+        
+        - loop_music: whether to repeat the audio after playback is finished.
         """
         
-        # If the requested music is different than what's playing, 
-        # stop the music.
-        if pygame.mixer.music.get_busy() and self.loaded_music != audio_name:
-            pygame.mixer.music.stop()
-            
         # If the music channel is playing something, it's the same as what is
         # being requested, so don't interrupt it.
         # The music will need to be stopped first if the music needs to start 
         # from the beginning.
-        elif pygame.mixer.music.get_busy():
+        if self.is_music_playing() and self.loaded_music == audio_name:
+            self.pending_music = None
             return
-
-        # Get the temporary directory.
-        temp_path = TempHandler.get_temp_dir()
         
-        if not temp_path:
-            print(f"Temp directory not found: {temp_path}")
+        if self.music_crossfade_seconds > 0 and self.is_music_playing():
+            
+            with self.prepared_music_lock:
+                sound = self.prepared_music.get(audio_name)
+                
+            if sound:
+                self._crossfade_music(audio_name=audio_name,
+                                      sound=sound,
+                                      loop_music=loop_music)
+            else:
+                # Keep the current track playing until the new
+                # track has been decoded.
+                self.pending_music = (audio_name, loop_music)
+                self.prepare_music(audio_name=audio_name)
             return
-
-        # Clean up any previous music temp files, if any.
-        TempHandler.cleanup_temp_files(TempContentType.MUSIC_FILE)
-        self.current_temp_music_path = None
-
-        # Create the named temporary file.
-        temp_music = tempfile.NamedTemporaryFile(
-            delete=False, 
-            #suffix=file_extension,
-            prefix=f"lvnauth_tmp_{TempContentType.MUSIC_FILE.value}_", 
-            dir=temp_path)
         
-        temp_music.write(bytes_data)
-        temp_music.close()
-    
-        # Record the full path to the music file in the temp directory.
-        self.current_temp_music_path = temp_music.name
+        # If the requested music is different than what's playing, 
+        # stop the music.
+        self._stop_music()
     
         pygame.mixer.music.set_volume(self.volume_music)
-        pygame.mixer.music.load(self.current_temp_music_path,
-                                namehint=file_extension[1:])
+        
+        pygame.mixer.music.load(music_file.path,
+                                namehint=music_file.file_extension[1:])
+        
         self.loaded_music = audio_name
+        self.music_looping = loop_music
     
         if loop_music:
             pygame.mixer.music.play(loops=-1)
         else:
             pygame.mixer.music.play()
 
-    def _play_fx(self, audio_name: str, bytes_data: bytes):
+    def is_music_playing(self) -> bool:
+        """
+        Return whether music is playing, either streamed or
+        in a cross-fade channel.
+        """
+        if pygame.mixer.music.get_busy():
+            return True
+        
+        return bool(self.active_channel_music
+                    and self.active_channel_music.get_busy())
+    
+    def _stop_music(self):
+        """
+        Stop the current track (streamed or cross-faded in) and forget
+        about any pending or queued tracks.
+        """
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.stop()
+            
+        for channel in self.channels_music:
+            channel.stop()
+            
+        self.active_channel_music = None
+        self.pending_music = None
+        self.queued_music = None
+        self.queued_music_sound = None
+        
+    def _crossfade_music(self, audio_name: str, sound: pygame.mixer.Sound,
+                         loop_music: bool):
         """
-        Play an FX audio file from bytes data.
+        Fade out the current track while the given decoded track fades in,
+        over the <music_crossfade> number of seconds.
         
         Arguments:
         
-        - audio_name: the resource/item name of the sound to be played.
+        - audio_name: the music's resource name.
+        
+        - sound: the decoded music.
         
-        - bytes_data: the bytes representation of the wav/ogg data.
+        - loop_music: whether to repeat the new track.
         """
-
-        # Create a new text audio channel if not initialized
-        # or if the last loaded audio is different than what needs to be played.
-        if not self.channel_fx or self.loaded_fx != audio_name:
-
-            # pygame works well with BytesIO
-            # Convert the bytes sound to a BytesIO stream
-            io_bytes_data = BytesIO(bytes_data)
-
-            # Initialize a new audio channel.
-            self.channel_fx = pygame.mixer.Sound(file=io_bytes_data)
-
-        # Save the filename of the loaded .wav
-        self.loaded_fx = audio_name
-
-        # If we don't stop the existing, sound, the sound
-        # won't play until the previous sound has stopped.
-        self.channel_fx.stop()
-
-        self.channel_fx.set_volume(self.volume_sound)
-        self.channel_fx.play()
-
-    def _play_voice(self, audio_name: str, bytes_data: bytes):
+        fade_ms = int(self.music_crossfade_seconds * 1000)
+        
+        # Fade out whatever is playing now.
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(fade_ms)
+            
+        if self.active_channel_music:
+            self.active_channel_music.fadeout(fade_ms)
+            
+        # Use the music channel that isn't fading out.
+        new_channel = self.channels_music[0]
+        if new_channel is self.active_channel_music:
+            new_channel = self.channels_music[1]
+            
+        new_channel.set_volume(self.volume_music)
+        new_channel.play(sound,
+                         loops=-1 if loop_music else 0,
+                         fade_ms=fade_ms)
+        
+        self.active_channel_music = new_channel
+        self.loaded_music = audio_name
+        self.music_looping = loop_music
+        self.pending_music = None
+        
+        # A queued track belonged to the previous track.
+        self.queued_music = None
+        self.queued_music_sound = None
+        
+    def set_music_crossfade(self, seconds: float):
         """
-        Play a voice audio file from bytes data.
+        Set how many seconds music tracks should cross-fade for when
+        <play_music> changes tracks. 0 turns off cross-fading.
+        """
+        self.music_crossfade_seconds = max(0, seconds)
+        
+    def prepare_music(self, audio_name: str):
+        """
+        Decode a music track in a background thread, so it's ready to
+        cross-fade in without a hitch. Used with <load_music>.
         
         Arguments:
         
-        - audio_name: the resource/item name of the sound to be played.
+        - audio_name: the music's resource name.
+        """
+        if not audio_name:
+            return
+        
+        with self.prepared_music_lock:
+            if audio_name in self.prepared_music \
+               or audio_name in self.preparing_music:
+                return
+            
+        music_file = self._get_music_file(audio_name=audio_name)
+        if not music_file:
+            return
+            
+        with self.prepared_music_lock:
+            self.preparing_music.add(audio_name)
+        
+        decode_thread = threading.Thread(target=self._decode_music,
+                                         args=(audio_name, music_file),
+                                         daemon=True)
+        decode_thread.start()
         
-        - bytes_data: the bytes representation of the wav/ogg data.
+    def _decode_music(self, audio_name: str, music_file: MusicFile):
         """
+        Decode a music track into a pygame Sound, reading it from
+        its music file. This runs in a background thread.
+        """
+        try:
+            sound = pygame.mixer.Sound(file=music_file.path)
+        except pygame.error as e:
+            print(f"Could not prepare music '{audio_name}': {e}")
+            sound = None
+            
+        with self.prepared_music_lock:
+            self.preparing_music.discard(audio_name)
+            
+            if sound:
+                self.prepared_music[audio_name] = sound
+                
+                # Only keep the most recently prepared tracks.
+                while len(self.prepared_music) > AudioPlayer.MAX_PREPARED_MUSIC:
+                    self.prepared_music.popitem(last=False)
+                    
+    def queue_music(self, audio_name: str):
+        """
+        Play a music track right after the current track finishes,
+        with no gap between them. Used with <queue_music>.
+        
+        If no music is playing, the track plays now. If the current track
+        is looping, it never ends, so the track is not queued.
+        
+        Arguments:
+        
+        - audio_name: the music's resource name.
+        """
+        if not self.is_music_playing():
+            self.play_audio(audio_name=audio_name,
+                            audio_channel=AudioChannel.MUSIC)
+            return
+        
+        if self.music_looping:
+            print(f"Not queueing music '{audio_name}' because the current music is looping.")
+            return
+        
+        if self.active_channel_music:
+            # The current track was cross-faded in, so it's not streamed.
+            # Queue the decoded track in the same channel (once it's ready).
+            # It replaces any track that was queued before it.
+            self.queued_music = audio_name
+            self.queued_music_sound = None
+            self.prepare_music(audio_name=audio_name)
+            return
+            
+        music_file = self._get_music_file(audio_name=audio_name)
+        if not music_file:
+            return
+        
+        pygame.mixer.music.queue(music_file.path,
+                                 namehint=music_file.file_extension[1:])
+        
+        self.queued_music = audio_name
+        self.music_position = pygame.mixer.music.get_pos()
+        
+    def update(self):
+        """
+        Called once per frame.
+        
+        Start a pending cross-fade once its track has been decoded, and
+        keep track of which track is playing when a queued track starts.
+        """
+        
+        if self.pending_music:
+            audio_name, loop_music = self.pending_music
+            
+            with self.prepared_music_lock:
+                sound = self.prepared_music.get(audio_name)
+                still_preparing = audio_name in self.preparing_music
+                
+            if sound:
+                self._crossfade_music(audio_name=audio_name,
+                                      sound=sound,
+                                      loop_music=loop_music)
+                
+            elif not still_preparing:
+                # The track couldn't be decoded, so stream it
+                # without a cross-fade.
+                self.pending_music = None
+                self._stop_music()
+                self.play_audio(audio_name=audio_name,
+                                audio_channel=AudioChannel.MUSIC,
+                                loop_music=loop_music)
+                
+        if not self.queued_music:
+            return
+        
+        if self.queued_music_sound:
+            # The queued decoded track is in the channel. It becomes the
+            # current track once the channel has started playing it.
+            if self.active_channel_music.get_sound() is self.queued_music_sound:
+                self._on_queued_music_started()
+            
+        elif self.active_channel_music:
+            # A queued decoded track.
+            with self.prepared_music_lock:
+                sound = self.prepared_music.get(self.queued_music)
+                
+            if not sound:
+                return
+            
+            if self.active_channel_music.get_busy():
+                # It starts when the current track ends.
+                self.active_channel_music.queue(sound)
+                self.queued_music_sound = sound
+            else:
+                # The current track finished before the queued
+                # track was ready.
+                self.active_channel_music.set_volume(self.volume_music)
+                self.active_channel_music.play(sound)
+                self._on_queued_music_started()
+            
+        else:
+            # A queued streamed track. Its position starts from 0,
+            # so if the position went back, the queued track has started.
+            music_position = pygame.mixer.music.get_pos()
+            
+            if music_position < self.music_position:
+                self._on_queued_music_started()
+            else:
+                self.music_position = music_position
+            
+    def _on_queued_music_started(self):
+        """
+        Make the queued track the current track, now that it has started.
+        """
+        self.loaded_music = self.queued_music
+        
+        # Queued tracks play once.
+        self.music_looping = False
+        
+        self.queued_music = None
+        self.queued_music_sound = None
 
-        # Create a new text audio channel if not initialized
-        # or if the last loaded audio is different than what needs to be played.
-        if not self.channel_voice or self.loaded_voice != audio_name:
-
-            # pygame works well with BytesIO
-            # Convert the bytes sound to a BytesIO stream
-            io_bytes_data = BytesIO(bytes_data)
-
-            # Initialize a new audio channel.
-            self.channel_voice = pygame.mixer.Sound(file=io_bytes_data)
-
-        # Save the filename of the loaded .wav
-        self.loaded_voice = audio_name
-
-        # If we don't stop the existing, sound, the sound
-        # won't play until the previous sound has stopped.
-        self.channel_voice.stop()
-
-        self.channel_voice.set_volume(self.volume_voice)
-        self.channel_voice.play()
-
-    def _play_audio_in_channel(self, audio_channel: AudioChannel, audio_name: str, bytes_data: bytes):
+    def _play_audio_in_channel(self, audio_channel: AudioChannel, audio_name: str,
+                               sound: pygame.mixer.Sound):
         """
-        Play an audio file from bytes data, in a specific audio channel.
+        Play a decoded sound in the channel pool of a specific category.
 
         Music is not played in this method; music is using pygame's built-in music module.
 
         Arguments:
 
-        - audio_channel: the audio channel to play bytes_data in.
+        - audio_channel: the category of the sound (FX, voice, text).
         
         - audio_name: the resource/item name of the sound to be played.
         
-        - bytes_data: the bytes representation of the wav/ogg data.
+        - sound: the decoded sound (usually from the sound cache).
         """
 
         if audio_channel == AudioChannel.FX:
-            channel = self.channel_fx
+            channel_pool = self.channel_fx
             volume = self.volume_sound
 
         elif audio_channel == AudioChannel.VOICE:
-            channel = self.channel_voice
+            channel_pool = self.channel_voice
             volume = self.volume_voice
 
         elif audio_channel == AudioChannel.TEXT:
-            channel = self.channel_text
+            channel_pool = self.channel_text
             volume = self.volume_text
 
         else:
             return
 
-        # If the requested audio is different than what's playing, stop the existing audio.
-        if channel.get_busy() and self.loaded_text != audio_name:
-            channel.stop()
-
-        # pygame works well with BytesIO
-        # Convert the bytes sound to a BytesIO stream
-        io_bytes_data = BytesIO(bytes_data)
-
-        # Initialize a new sound object.
-        sound = pygame.mixer.Sound(file=io_bytes_data)
-
-        # Save the filename of the loaded .wav/.ogg
-        self.loaded_text = audio_name
-
-        channel.set_volume(volume)
-        channel.play(sound)
+        channel_pool.play(sound=sound,
+                          audio_name=audio_name,
+                          volume=volume)
@@ -17,6 +17,7 @@ You should have received a copy of the GNU Lesser General Public License
 along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import math
 import pygame
 import random
 from enum import Enum, auto
@@ -91,6 +92,24 @@ class Camera:
         # prevent unnecessary transform.smoothscale(), because it can be
         # a CPU intense process.
         self.last_buffer_size = (0, 0)
+        
+        # What scaling_buffer currently holds: the compositor's content
+        # version, the source rect (as a tuple) and the scaled size.
+        # If these are the same in the next frame, the buffer already has
+        # the right image in it, so there's no need to scale it again.
+        # None means the buffer needs to be scaled in the next frame.
+        self.last_buffer_key = None
+        
+        # When True, a zoom/pan animation will use pygame.transform.scale,
+        # which is faster but blockier than smoothscale. Once the camera
+        # stops moving, the final frame gets smoothscaled.
+        # Set by <camera_quality_fast_while_moving> and
+        # <camera_quality_smooth_always>.
+        self.fast_scale_while_moving = False
+        
+        # Whether scaling_buffer was last drawn with the fast (blocky)
+        # scale, so we know to smoothscale it once the camera settles.
+        self.buffer_is_fast_scaled = False
 
     def start_move(self,
                    target_x: int=None,
@@ -340,7 +359,9 @@ class Camera:
                 self.stop_shake()
 
     def apply(self,
-              virtual_surface: pygame.Surface, main_surface: pygame.Surface):
+              virtual_surface: pygame.Surface,
+              main_surface: pygame.Surface,
+              content_version: int = None):
         """
         Blit virtual_surface (the scaled/zoomed/panned surface) onto the
         main display surface.
@@ -356,6 +377,12 @@ class Camera:
         place.
         
         - main_surface: the main display surface - what the user sees.
+        
+        - content_version: a number from the compositor (ActiveStory) that
+        changes whenever something different has been drawn on
+        virtual_surface. If the content version and the camera's
+        position/zoom are the same as last frame, the previously scaled
+        buffer is reused. If None, the buffer is scaled every frame.
 
         If the zoom level is 1.0, no scaling is done. At that point,
         virtual_surface is just blitted onto main_surface, without CPU
@@ -414,8 +441,26 @@ class Camera:
             return
     
         # -- Zoom logic (when zoom != 1.0) --
-        curr_w = int(round(VIRTUAL_RES[0] * self.zoom))
-        curr_h = int(round(VIRTUAL_RES[1] * self.zoom))
+        
+        # Instead of scaling the entire virtual surface (which, at a zoom
+        # of 3.0 on a 1920x1080 window, would mean scaling to 5760x3240
+        # every frame and then blitting most of it off-screen), we only
+        # scale the part of the virtual surface that will actually be
+        # visible in the window. That way, the cost of zooming stays about
+        # the same, regardless of the zoom level.
+        source_rect = self._get_visible_source_rect(virtual_size=VIRTUAL_RES)
+        
+        # Nothing from the virtual surface is visible? (the camera has been
+        # panned completely away from the virtual surface)
+        if source_rect.width <= 0 or source_rect.height <= 0:
+            main_surface.fill((0, 0, 0))
+            return
+    
+        # The size that the visible part of the virtual surface needs to be
+        # scaled to. This will be about the size of the window (or smaller
+        # if the camera is near an edge or is zoomed out).
+        curr_w = max(1, int(round(source_rect.width * self.zoom)))
+        curr_h = max(1, int(round(source_rect.height * self.zoom)))
         current_size = (curr_w, curr_h)
     
         # Buffer Memory Management (only create new surfaces when size changes)
@@ -424,28 +469,62 @@ class Camera:
             # Create a new surface, the size is different from last time.
             self.scaling_buffer = pygame.Surface(current_size, pygame.SRCALPHA)
             self.last_buffer_size = current_size
-    
-        # Draw virtual_surface to the buffer *every frame*; 
-        # not just when size changes, because other changes could have occurred
-        # in the virtual_surface (dialogue text, other types of animations, etc.)
-        pygame.transform.smoothscale(virtual_surface,
-                                     current_size,
-                                     self.scaling_buffer)
+            
+            # The new buffer is empty, so it must be drawn on.
+            self.last_buffer_key = None
+            
+        # Use the fast (blocky) scale while the camera is moving, if
+        # that's been requested.
+        use_fast_scale =\
+            self.fast_scale_while_moving and self.is_animating_zoom_pan
+            
+        # Does the buffer need to be scaled in this frame?
+        # It doesn't if nothing new has been drawn on the virtual surface
+        # and the camera is looking at the same area as last frame.
+        # Shaking doesn't matter here, because it only changes where the
+        # buffer gets blitted, not what's in it.
+        buffer_key = (content_version, tuple(source_rect), current_size)
+        
+        if content_version is None \
+           or buffer_key != self.last_buffer_key \
+           or (self.buffer_is_fast_scaled and not use_fast_scale):
+            
+            # A subsurface shares its pixels with virtual_surface, so no
+            # pixel data gets copied here.
+            visible_area = virtual_surface.subsurface(source_rect)
+            
+            if use_fast_scale:
+                pygame.transform.scale(visible_area,
+                                       current_size,
+                                       self.scaling_buffer)
+            else:
+                # Either the camera has settled or fast scaling isn't
+                # being used, so draw the smooth version.
+                pygame.transform.smoothscale(visible_area,
+                                             current_size,
+                                             self.scaling_buffer)
+                
+            self.buffer_is_fast_scaled = use_fast_scale
+            self.last_buffer_key = buffer_key
     
         # Calculate Position using Effective Zoom (prevents wobble)
         # This math ensures that the "center" of the zoom doesn't jitter 
         # or wobble as the image resizes.
         
         # Calculate the real horizontal/vertical zoom by dividing the rounded 
-        # width/height by the original width/height. This tells us exactly how 
+        # width/height by the source width/height. This tells us exactly how 
         # much the pixels were stretched after rounding to an integer        
-        eff_zoom_x = curr_w / float(VIRTUAL_RES[0])
-        eff_zoom_y = curr_h / float(VIRTUAL_RES[1])
+        eff_zoom_x = curr_w / float(source_rect.width)
+        eff_zoom_y = curr_h / float(source_rect.height)
     
         # Calculate the X and Y coordinates to draw at.
-        # This keeps the final render centered.   
-        render_x = (self.screen_width / 2) - (self.x * eff_zoom_x)
-        render_y = (self.screen_height / 2) - (self.y * eff_zoom_y)
+        # This keeps the final render centered. The source rect's left/top
+        # is subtracted from the camera's position because the buffer
+        # starts at the source rect, not at the virtual surface's (0, 0).
+        render_x = (self.screen_width / 2) \
+            - ((self.x - source_rect.left) * eff_zoom_x)
+        render_y = (self.screen_height / 2) \
+            - ((self.y - source_rect.top) * eff_zoom_y)
     
         # Apply Shake to the Zoomed View
         if self.shake_timer > 0:
@@ -473,6 +552,41 @@ class Camera:
         # rendering artifacts        
         main_surface.blit(self.scaling_buffer, (round(render_x), round(render_y)))
 
+    def _get_visible_source_rect(self, virtual_size: tuple) -> pygame.Rect:
+        """
+        Return the area of the virtual surface that will be visible in the
+        window at the camera's current position and zoom level.
+        
+        The camera's x/y is the point on the virtual surface that shows up
+        in the center of the window. At a zoom level of 2.0, half of the
+        window's width/height is visible, and so on.
+        
+        The returned rect is widened to whole pixels (floor for the
+        left/top, ceil for the right/bottom) so that partially visible pixels
+        at the edges of the window still get drawn, and it's clipped to the
+        virtual surface so that it can be used for a subsurface.
+        
+        Arguments:
+        
+        - virtual_size: the width/height of the virtual surface.
+        """
+        
+        # How much of the virtual surface fits in the window at this zoom.
+        view_w = self.screen_width / self.zoom
+        view_h = self.screen_height / self.zoom
+        
+        # The edges of the visible area, in virtual surface coordinates.
+        left = math.floor(self.x - (view_w / 2))
+        top = math.floor(self.y - (view_h / 2))
+        right = math.ceil(self.x + (view_w / 2))
+        bottom = math.ceil(self.y + (view_h / 2))
+        
+        source_rect = pygame.Rect(left, top, right - left, bottom - top)
+        
+        # Don't go outside the virtual surface; a subsurface must be
+        # fully inside its parent surface.
+        return source_rect.clip(pygame.Rect((0, 0), virtual_size))
+
 
         
 #"""
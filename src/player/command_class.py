@@ -123,6 +123,12 @@ class SceneWithFade(NamedTuple):
     fade_hold_seconds: int
     chapter_name: str
     scene_name: str
+
+
+class SceneWithDissolve(NamedTuple):
+    dissolve_speed: int
+    chapter_name: str
+    scene_name: str
     
     
 @dataclass
@@ -292,6 +298,10 @@ class PlayAudioLoop(NamedTuple):
     loop: str
 
 
+class MusicCrossfade(NamedTuple):
+    number_of_seconds: float
+
+
 class DialogTextSound(NamedTuple):
     audio_name: str
     
@@ -449,6 +459,12 @@ class RemoteCallWithArguments(NamedTuple):
     # <remote_call: some custom action name, character_name=some name, time=daytime>
     remote_command: str
     arguments: str
+
+
+class RemoteGetCache(NamedTuple):
+    # Example:
+    # <remote_get_cache: 60>
+    number_of_seconds: float
     
     
 
@@ -30,6 +30,15 @@ class FadeDirection(Enum):
     FADE_OUT = auto()
 
 
+class CoverType(Enum):
+    # Cover the screen with a solid color (<scene_with_fade>)
+    COLOR = auto()
+    
+    # Cover the screen with a snapshot of the outgoing scene
+    # (<scene_with_dissolve>)
+    SNAPSHOT = auto()
+
+
 class CoverScreenHandler:
     """
     Handles fading in and fading out the entire screen.
@@ -49,10 +58,21 @@ class CoverScreenHandler:
 
         # The size of the 'cover' surface will be the same
         # size as the main surface, because it will cover the entire pygame window.
+        # The surface has no per-pixel alpha; it gets filled with a solid
+        # color once when the fade starts and the fade is done by changing
+        # the surface's alpha value, so each frame is a single blit.
         width = self.main_surface_rect.width
         height = self.main_surface_rect.height
-        self.cover_surface = pygame.Surface((width, height),
-                                            flags=pygame.SRCALPHA).convert_alpha()
+        self.cover_surface = pygame.Surface((width, height)).convert()
+
+        # Whether the cover is a solid color or a snapshot
+        # of the outgoing scene.
+        self.cover_type = CoverType.COLOR
+
+        # Used for snapshot covers (cross-dissolves).
+        # The snapshot of the outgoing scene gets taken the next time
+        # the screen is drawn, so it contains everything that's shown.
+        self.snapshot_pending = False
 
         # Default to fade-in.
         # This will get overwritten in the start_fading_screen() method
@@ -150,9 +170,17 @@ class CoverScreenHandler:
             return
 
         # Initialize
+        self.cover_type = CoverType.COLOR
+        self.snapshot_pending = False
         self.fade_in_speed_incremental = fade_in_speed_incremental
         self.fade_out_speed_incremental = fade_out_speed_incremental
         self.color = pygame.Color(hex_color)
+
+        # Fill the cover surface once. The fade value gets applied
+        # as the surface's alpha value when it's drawn.
+        self.cover_surface.fill(color=(self.color.r,
+                                       self.color.g,
+                                       self.color.b))
         self.current_fade_value = initial_fade_value
         self.chapter_name = chapter_name
         self.scene_name = scene_name
@@ -163,6 +191,53 @@ class CoverScreenHandler:
         # So the main draw method knows to draw the cover surface.
         self.is_cover_animating = True
 
+    def start_dissolving_screen(self,
+                                dissolve_speed_incremental: float,
+                                chapter_name: str,
+                                scene_name: str):
+        """
+        Take a snapshot of the current screen, play a specific scene
+        and then gradually fade out the snapshot, so that the outgoing
+        scene cross-dissolves into the new scene.
+        
+        The outgoing scene is not rendered again during the dissolve; only
+        the snapshot is blitted over the new scene.
+
+        Arguments:
+        
+        - dissolve_speed_incremental: the snapshot's fade-out will increment
+        by this much (a float value)
+        
+        - chapter_name: the chapter the scene is in that we need to run
+        
+        - scene_name: the scene we need to run, which will be shown
+        underneath the snapshot
+        """
+
+        # Already fading in or fading out? return
+        if self.is_busy_fading():
+            return
+
+        # Initialize
+        self.cover_type = CoverType.SNAPSHOT
+        self.fade_in_speed_incremental = dissolve_speed_incremental
+        self.fade_out_speed_incremental = dissolve_speed_incremental
+        self.color = None
+        self.chapter_name = chapter_name
+        self.scene_name = scene_name
+        self.hold_seconds_at_full_opacity = 0
+        self.elapsed_full_opacity_seconds = 0
+
+        # The snapshot will be taken the next time the screen gets drawn.
+        # Until then, consider the cover fully opaque and waiting to play
+        # the new scene (the same state as a fully faded-in color cover).
+        self.snapshot_pending = True
+        self.current_fade_value = 255
+        self.fade_direction = FadeDirection.FADE_IN
+
+        # So the main draw method knows to draw the cover surface.
+        self.is_cover_animating = True
+
     def stop_fading_screen(self):
         """
         Stop drawing the cover surface.
@@ -204,6 +279,11 @@ class CoverScreenHandler:
                                                    self.fade_out_speed_incremental]):
             return
 
+        # Waiting for a snapshot of the outgoing scene? Don't play the
+        # new scene until we have the snapshot.
+        if self.snapshot_pending:
+            return
+
         if self.fade_direction == FadeDirection.FADE_IN:
 
             # Have we reached fully opacity?
@@ -272,11 +352,18 @@ class CoverScreenHandler:
         if not self.is_cover_animating:
             return
 
-        # Fill the cover surface with the latest fade value.
-        self.cover_surface.fill(color=(self.color.r,
-                                       self.color.g,
-                                       self.color.b,
-                                       self.current_fade_value))
+        # Take a snapshot of the outgoing scene? This is done only once,
+        # after everything else has been drawn on the main surface.
+        if self.snapshot_pending:
+            self.cover_surface.blit(self.main_surface, (0, 0))
+            self.snapshot_pending = False
+
+            # The snapshot is already on the screen, so there's
+            # nothing else to draw for this frame.
+            return
+
+        # Apply the latest fade value to the pre-filled cover surface.
+        self.cover_surface.set_alpha(int(self.current_fade_value))
 
         # Draw the cover surface on pygame's main surface.
         self.main_surface.blit(self.cover_surface, self.main_surface_rect)
@@ -193,6 +193,19 @@ class DialogRectangle:
         self.rect_destination = None
         self.rect = None
 
+        # The working surface that the dialog rectangle and its text
+        # get drawn on. It's created once per destination size.
+        self.surface: pygame.Surface
+        self.surface = None
+
+        # Pre-rendered rectangles (background + border), so we don't have to
+        # call pygame.draw.rect() on every animation frame.
+        # Key: (width, height, draw_border) tuple
+        # Value: pygame.Surface with the rectangle drawn at full opacity.
+        # Smaller (animated) sizes get assembled from these surfaces by
+        # blitting its corners and edges (see _blit_rectangle_frame()).
+        self.rectangle_frames = {}
+
         # The audio name to play for each letter
         # when using letter-by-letter non-gradual animation.
         self.text_sound_name = None
@@ -548,10 +561,13 @@ class DialogRectangle:
 
         # Make the surface the same size as the rectangle should be
         # once the animation is finished. We will draw the rectangle
-        # on this surface.
-        self.surface = pygame.Surface((self.rect_destination.width,
-                                       self.rect_destination.height),
-                                      pygame.SRCALPHA).convert_alpha()
+        # on this surface. Re-use the existing surface if it's already
+        # the right size (for example: when the dialog is shown again).
+        if self.surface is None \
+           or self.surface.get_size() != self.rect_destination.size:
+            self.surface = pygame.Surface((self.rect_destination.width,
+                                           self.rect_destination.height),
+                                          pygame.SRCALPHA).convert_alpha()
 
         # Set the destination rectangle, based on the given anchor parameter.
         if self.anchor == AnchorRectangle.MID_BOTTOM:
@@ -645,7 +661,14 @@ class DialogRectangle:
         Draw the dialog rectangle based on the current animation rectangle.
         """
         if self.visible:
-            self.main_screen.blit(self.surface, self.rect)
+            # Only blit the part of the surface that the animation allows
+            # so far. The surface is always the size of the destination
+            # rectangle, but during scale animations, the rectangle is only
+            # drawn in the top-left part of the surface.
+            self.main_screen.blit(self.surface,
+                                  self.rect,
+                                  area=(0, 0,
+                                        self.rect.width, self.rect.height))
 
     def clear_text(self):
         """
@@ -970,20 +993,16 @@ class DialogRectangle:
                 # Below applies to all scale-up/down type rectangle animations. It's a continuation of that.
                 # ---------------
 
-                # Don't create a new surface if there is no outro animation.
+                # Don't move the rectangle if there is no outro animation.
                 if self.outro_animation != RectangleOutroAnimation.NO_ANIMATION:
                 
-                    # We're making the width/height of the rectangle bigger, so preserve its center so
-                    # the animation happens from 'inside-out', because it's centered.
+                    # We're making the width/height of the rectangle smaller, so preserve its center so
+                    # the animation happens from 'outside-in', because it's centered.
                     self.rect.center = self.rect_destination.center
 
-                    # Make the surface that we're about to draw the rectangle in, the same as that the animation allows so far.
-                    # For this type of animation, the surface is actually used to show the animation. For each frame,
-                    # we need to initialize a new Surface to match the size the animation allows so far, so that the rectangle
-                    # that gets drawn on the Surface will be fully transparent. If we had left the Surface at its normal size,
-                    # the gradual rectangle drawing would happen on a regular-size black Surface. So to avoid a black surface
-                    # from getting displayed, we resize the Surface to match the dimensions we need in the animation.
-                    self.surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA).convert_alpha()
+                    # We don't need a new Surface for each frame. The rectangle gets assembled
+                    # in the top-left part of the existing surface and draw() only blits
+                    # the part of the surface that the animation allows so far.
 
         
   
@@ -992,24 +1011,15 @@ class DialogRectangle:
             # ---------------            
         
             # Re-draw rectangle
-            # We use self.rect to tell pygame.draw.rect() how big we want the rectangle, because the x and y co-ordinates
-            # of self.rect are 0,0 (in relation to the surface that it's being drawn to). If we use self.animation_rect, then
-            # the x,y of self.animation_rect is probably not 0,0, because self.animation_rect defines where we want the rectangle 
-            # to finally end up,
-            # so we'll only get a cropped rectangle if we were to use self.animation_rect. That's why we use self.rect.
-            # Even though self.rect defines the full size of the rectangle, at this point self.surface is only the size that 
-            # the animation has allowed it to be, so even if self.rect is larger than self.surface, the rectangle will still 
-            # only show the same size as self.surface, which is fine in our case, because it's a gradual animation.
+            # We use the width/height of self.rect to know how big the rectangle needs to be.
+            # The rectangle gets drawn at 0,0 on self.surface (relative to the surface),
+            # and draw() blits self.surface at self.rect's location on the main screen.
 
             # Re-draw rectangle based on its latest animation position.
             # Don't redraw the rectangle if there is no outro animation.
             if self.outro_animation != RectangleOutroAnimation.NO_ANIMATION:
                 self.redraw_rectangle()
 
-            # pygame.draw.rect(self.surface, (self.r, self.g, self.b, self.fade_current_value), self.rect, self.width)
-            
-             
-                
                 #pygame.display.flip()
         
 
@@ -1046,8 +1056,8 @@ class DialogRectangle:
         if not self.animating_intro or not self.visible:
             return
 
-        # Clear the surface. The fourth zero is the alpha (opacity).
-        self.surface.fill((0, 0, 0, 0))
+        # No need to clear the surface here, because redraw_rectangle()
+        # clears it before drawing the rectangle.
 
         if self.intro_animation == RectangleIntroAnimation.NO_ANIMATION:
             # No animation, just show the dialog rectangle right away.
@@ -1083,12 +1093,8 @@ class DialogRectangle:
 
                 self.intro_complete = True
 
-            # Re-draw rectangle
-            pygame.draw.rect(self.surface, (self.bg_color.r,
-                                            self.bg_color.g,
-                                            self.bg_color.b,
-                                            self.fade_current_value),
-                            self.rect, self.width)
+            # The rectangle gets re-drawn below. The fade itself is
+            # done with the surface's alpha value (see redraw_rectangle()).
 
         elif self.intro_animation in (RectangleIntroAnimation.SCALE_UP_HEIGHT_THEN_WIDTH,
                                       RectangleIntroAnimation.SCALE_UP_WIDTH_THEN_HEIGHT,
@@ -1249,7 +1255,7 @@ class DialogRectangle:
 
     def redraw_rectangle(self):
         """
-        Re-draw the dialog rectangle based on its latest animation position
+        Re-draw the dialog rectangle based on its latest animation size
         and its latest fade value.
         
         self.surface is already the size of the destination rectangle,
@@ -1258,65 +1264,250 @@ class DialogRectangle:
         We use self.rect to tell self.surface where to be blit (in the draw
         method, not in this method).
         
-        self.rect's left and X is likely not going to be at zero
-        because it is constantly being animated, relative to the
-        main screen.
-        
         We need to draw the rectangle at X=0, Y=0 onto self.surface,
         relative to self.surface, not the main screen.
         
-        Below, we're going to re-draw the rectangle so its shown with its
-        newest animation location. We're going to pass in a copy of self.rect
-        but with its X and Y at zero.
+        The rectangle (background + border) is only rendered once with
+        pygame.draw.rect() at the destination size (see
+        _get_rectangle_frame()). Here we just blit that pre-rendered
+        rectangle onto self.surface at the size the animation allows so far
+        and we apply the fade value as the surface's alpha, instead of
+        re-drawing the rectangle with a new color.
         """
         
         animated_rect = self.rect.copy()
         animated_rect.x = 0
         animated_rect.y = 0
 
+        # Clear the surface, because the rectangle may have gotten smaller
+        # and so that any previous dialog text gets cleared.
+        # The fourth zero is the alpha (opacity).
+        self.surface.fill((0, 0, 0, 0))
+
+        # If the outro is being animated, don't draw the border
+        # because the border fade value can be different from the dialog's 
+        # opacity, which can look odd if the two fades don't match. Plus, it 
+        # won't update the rect properly on the last frame.
+        draw_border = not self.animating_outro \
+            and not self.outro_complete \
+            and self.border_alpha > 0 \
+            and self.border_width > 0
+
+        frame = self._get_rectangle_frame(draw_border=draw_border)
+
+        if not self._blit_rectangle_frame(frame=frame,
+                                          width=animated_rect.width,
+                                          height=animated_rect.height,
+                                          draw_border=draw_border):
+
+            # The animated size is too small to be assembled from the
+            # pre-rendered rectangle, so draw it directly.
+            self._draw_rectangle(surface=self.surface,
+                                 rect=animated_rect,
+                                 draw_border=draw_border)
+
+        # Apply the fade value. The pre-rendered rectangle already has
+        # the dialog's final opacity (self.alpha), so the surface's alpha
+        # is the fade value relative to the final opacity.
+        if self.alpha > 0 and self.fade_current_value < self.alpha:
+            surface_alpha = int(255 * max(self.fade_current_value, 0)
+                                / self.alpha)
+        else:
+            surface_alpha = 255
+
+        self.surface.set_alpha(surface_alpha)
+
+    def _get_rectangle_frame(self, draw_border: bool) -> pygame.Surface:
+        """
+        Return a surface with the rectangle (background and border, if any)
+        drawn at the full size of self.surface and at full opacity.
+        
+        We use the size of self.surface rather than self.rect_destination,
+        because the destination rectangle gets smaller during scale-down
+        outro animations.
+        
+        The surface is only rendered the first time a specific size
+        is needed; after that, it's returned from self.rectangle_frames.
+        
+        Arguments:
+        
+        - draw_border: whether the border should be drawn on the rectangle.
+        """
+
+        width, height = self.surface.get_size()
+        size_key = (width, height, draw_border)
+
+        frame = self.rectangle_frames.get(size_key)
+        if frame:
+            return frame
+
+        frame = pygame.Surface((width, height),
+                               pygame.SRCALPHA).convert_alpha()
+        frame.fill((0, 0, 0, 0))
+
+        self._draw_rectangle(surface=frame,
+                             rect=frame.get_rect(),
+                             draw_border=draw_border)
+
+        self.rectangle_frames[size_key] = frame
+
+        return frame
+
+    def _get_frame_slice_size(self, draw_border: bool) -> int:
+        """
+        Return the width/height of the corner pieces of a pre-rendered
+        rectangle. Everything between the corners (edges and center)
+        is the same on every row/column, so only the corners need to be
+        preserved when the rectangle is shown at a smaller size.
+        
+        Arguments:
+        
+        - draw_border: whether the border is drawn on the rectangle.
+        """
+
+        if draw_border:
+            return max(self.border_radius_rounded_corners,
+                       self.border_width,
+                       1)
+        else:
+            return max(self.border_radius_rounded_corners, 1)
+
+    def _blit_rectangle_frame(self,
+                              frame: pygame.Surface,
+                              width: int,
+                              height: int,
+                              draw_border: bool) -> bool:
+        """
+        Blit a pre-rendered rectangle onto self.surface at the given size.
+        
+        This works like a nine-slice: the four corners are kept as they are
+        and the edges and center are cropped to fit the given size.
+        The edges and center of the pre-rendered rectangle are the same on
+        every row/column, so cropping gives the same result as drawing the
+        rectangle at the smaller size with pygame.draw.rect().
+        
+        Return True if the rectangle was blitted or False if the size is
+        too small (or too big) to be assembled from the pre-rendered
+        rectangle, in which case it should be drawn directly.
+        
+        Arguments:
+        
+        - frame: the pre-rendered rectangle (from _get_rectangle_frame())
+        
+        - width: the width the rectangle should be shown at.
+        
+        - height: the height the rectangle should be shown at.
+        
+        - draw_border: whether the pre-rendered rectangle has a border.
+        """
+
+        frame_width, frame_height = frame.get_size()
+
+        if width <= 0 or height <= 0:
+            # Nothing to show yet.
+            return True
+
+        if width > frame_width or height > frame_height:
+            return False
+
+        # Full size? Copy the whole pre-rendered rectangle.
+        # We use BLEND_RGBA_ADD on the cleared surface so that the pixels
+        # (including their alpha values) get copied as they are, instead of
+        # being alpha-blended.
+        if width == frame_width and height == frame_height:
+            self.surface.blit(frame, (0, 0),
+                              special_flags=pygame.BLEND_RGBA_ADD)
+            return True
+
+        slice_size = self._get_frame_slice_size(draw_border=draw_border)
+
+        # The rectangle needs to be at least the size of two corners,
+        # otherwise the rounded corners would get smaller too.
+        if width < slice_size * 2 or height < slice_size * 2:
+            return False
+
+        right_x = frame_width - slice_size
+        bottom_y = frame_height - slice_size
+
+        # Top-left corner, top edge, left edge and center.
+        self.surface.blit(frame, (0, 0),
+                          area=(0, 0,
+                                width - slice_size, height - slice_size),
+                          special_flags=pygame.BLEND_RGBA_ADD)
+
+        # Top-right corner and right edge.
+        self.surface.blit(frame, (width - slice_size, 0),
+                          area=(right_x, 0,
+                                slice_size, height - slice_size),
+                          special_flags=pygame.BLEND_RGBA_ADD)
+
+        # Bottom-left corner and bottom edge.
+        self.surface.blit(frame, (0, height - slice_size),
+                          area=(0, bottom_y,
+                                width - slice_size, slice_size),
+                          special_flags=pygame.BLEND_RGBA_ADD)
+
+        # Bottom-right corner.
+        self.surface.blit(frame, (width - slice_size, height - slice_size),
+                          area=(right_x, bottom_y,
+                                slice_size, slice_size),
+                          special_flags=pygame.BLEND_RGBA_ADD)
+
+        return True
+
+    def _draw_rectangle(self,
+                        surface: pygame.Surface,
+                        rect: pygame.Rect,
+                        draw_border: bool):
+        """
+        Draw the dialog rectangle (and its border, if needed) at full
+        opacity using pygame.draw.rect().
+        
+        Arguments:
+        
+        - surface: the surface to draw the rectangle on.
+        
+        - rect: the size of the rectangle, relative to the surface.
+        
+        - draw_border: whether the border should be drawn.
+        """
+
         # Draw the dialog rectangle
-        pygame.draw.rect(surface=self.surface,
+        pygame.draw.rect(surface=surface,
                          color=(self.bg_color.r,
                                 self.bg_color.g,
                                 self.bg_color.b,
-                                self.fade_current_value),
-                         rect=animated_rect,
+                                self.alpha),
+                         rect=rect,
                          width=0,
                          border_radius=self.border_radius_rounded_corners)
 
-        # If the outro is being animated, don't draw the border
-        # because the border fade value can be different from the dialog's 
-        # opacity, which can look odd if the two fades don't match. Plus, it 
-        # won't update the rect properly on the last frame.
-        if not self.animating_outro and not self.outro_complete:
-            
-            # We're not doing an outro animation, so it's OK to draw the border.
-            if self.border_alpha > 0 and self.border_width > 0:
-                
-                # The radius shouldn't be larger than half the 
-                # smallest side (width or height). Otherwise, the border
-                # will be larger than the rectangle and it will look odd.
-                max_border_radius =\
-                    min(animated_rect.width, animated_rect.height) // 2
+        if draw_border:
                 
-                # Apply the border size clamp
-                applied_radius =\
-                    int(min(self.border_radius_rounded_corners,
-                            max_border_radius))
-                
-                # Ensure we don't try to draw a border thicker than the 
-                # available space
-                # For example: a 1px high rect cannot have a 4px wide border
-                actual_width =\
-                    min(self.border_width,
-                        max_border_radius if max_border_radius > 0 else 1)                
+            # The radius shouldn't be larger than half the 
+            # smallest side (width or height). Otherwise, the border
+            # will be larger than the rectangle and it will look odd.
+            max_border_radius =\
+                min(rect.width, rect.height) // 2
+            
+            # Apply the border size clamp
+            applied_radius =\
+                int(min(self.border_radius_rounded_corners,
+                        max_border_radius))
             
-                pygame.draw.rect(
-                    surface=self.surface,
-                    color=(self.border_color.r,
-                           self.border_color.g,
-                           self.border_color.b,
-                           self.border_alpha),
-                    rect=animated_rect,
-                    width=actual_width,
-                    border_radius=applied_radius)
+            # Ensure we don't try to draw a border thicker than the 
+            # available space
+            # For example: a 1px high rect cannot have a 4px wide border
+            actual_width =\
+                min(self.border_width,
+                    max_border_radius if max_border_radius > 0 else 1)                
+        
+            pygame.draw.rect(
+                surface=surface,
+                color=(self.border_color.r,
+                       self.border_color.g,
+                       self.border_color.b,
+                       self.border_alpha),
+                rect=rect,
+                width=actual_width,
+                border_radius=applied_radius)
@@ -18,7 +18,7 @@ along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from enum import Enum
-from io import BytesIO
+from io import BytesIO, RawIOBase, SEEK_SET, SEEK_CUR, SEEK_END
 from pathlib import Path
 from re import search
 from typing import NamedTuple, Tuple
@@ -63,6 +63,67 @@ def extract_header_size_ranges(range_part: str):
         return result.groupdict()
 
 
+class BytesRangeReader(RawIOBase):
+    """
+    A read-only, seekable file-like object over a part of the .lvna data.
+    
+    The .lvna data is already in memory, so reading is only a copy from
+    the memoryview into the caller's buffer; nothing is written to disk
+    and the audio data is not duplicated.
+    
+    Arguments:
+    
+    - view: a memoryview of the bytes range to read.
+    """
+    def __init__(self, view: memoryview):
+        super().__init__()
+        
+        self.view = view
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            new_position = offset
+        elif whence == SEEK_CUR:
+            new_position = self.position + offset
+        elif whence == SEEK_END:
+            new_position = len(self.view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        if new_position < 0:
+            raise ValueError(f"Negative seek position: {new_position}")
+
+        self.position = new_position
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        # Copy as much as fits in the buffer, without going past the
+        # end of the audio range.
+        size = min(len(buffer), len(self.view) - self.position)
+        if size <= 0:
+            return 0
+
+        buffer[:size] = self.view[self.position:self.position + size]
+        self.position += size
+
+        return size
+
+    def close(self):
+        # Release the memoryview (the .lvna data itself stays loaded).
+        self.view = memoryview(b"")
+        super().close()
+
+
 class FileReader:
     """
     Reads a compiled .lvna file and stores the story's scripts,
@@ -150,17 +211,16 @@ class FileReader:
 
             return bytes_range
 
-    def get_audio(self,
-                  content_type: ContentType,
-                  item_name: str) -> Tuple[bytes, str]:
+    def _get_audio_location(self,
+                            content_type: ContentType,
+                            item_name: str) -> Tuple[BytesRange, str] | None:
         """
-        Return the bytes of a specific audio, based on a given name,
+        Return the bytes range of a specific audio in the .lvna file,
         along with the extension of the audio.
         
-        Example: (bytes data.., ".ogg")
+        Example: (BytesRange(from_bytes=8, to_bytes=3000), ".ogg")
         
-        The caller of this method needs the extension so that we can let
-        pygame know the hint of the extension.
+        Return None if the audio name was not found.
         """
 
         # Audio names and byte ranges
@@ -180,11 +240,57 @@ class FileReader:
                 # such as '157434-217093', to a namedtuple with int values.
                 data_range = self._extract_range(data_range=data_range)
 
-                # Get the audio as bytes
-                bytes_audio =\
-                    self.view[data_range.from_bytes:data_range.to_bytes].tobytes()
+                return (data_range, file_extension)
+
+    def get_audio(self,
+                  content_type: ContentType,
+                  item_name: str) -> Tuple[bytes, str]:
+        """
+        Return the bytes of a specific audio, based on a given name,
+        along with the extension of the audio.
+        
+        Example: (bytes data.., ".ogg")
+        
+        The caller of this method needs the extension so that we can let
+        pygame know the hint of the extension.
+        """
+
+        audio_location = self._get_audio_location(content_type=content_type,
+                                                  item_name=item_name)
+        if audio_location:
+            data_range, file_extension = audio_location
+
+            # Get the audio as bytes
+            bytes_audio =\
+                self.view[data_range.from_bytes:data_range.to_bytes].tobytes()
+
+            return (bytes_audio, file_extension)
+
+    def get_audio_stream(self,
+                         content_type: ContentType,
+                         item_name: str) -> Tuple["BytesRangeReader", str]:
+        """
+        Return a file-like object that reads a specific audio straight
+        from the .lvna data (no copy of the audio is made), along with the
+        extension of the audio.
+        
+        Example: (BytesRangeReader object, ".ogg")
+        
+        Used for music: the stream is copied into a MusicFile for
+        pygame.mixer.music, or decoded in a background thread
+        for cross-fades.
+        """
+
+        audio_location = self._get_audio_location(content_type=content_type,
+                                                  item_name=item_name)
+        if audio_location:
+            data_range, file_extension = audio_location
+
+            audio_stream = \
+                BytesRangeReader(
+                    self.view[data_range.from_bytes:data_range.to_bytes])
 
-                return (bytes_audio, file_extension)
+            return (audio_stream, file_extension)
 
     def get_sprite(self,
                    content_type: ContentType,
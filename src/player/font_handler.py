@@ -37,6 +37,9 @@ from typing import Dict, List, Tuple, TYPE_CHECKING
 from enum import Enum, auto
 from shared_components import Passer
 import time
+from collections import OrderedDict
+from bisect import bisect_right
+from kerning_table import compile_kerning_table
 
 if TYPE_CHECKING:
     # Only gets imported for type checking
@@ -63,22 +66,22 @@ class Letter:
         # opacity = 100
     
         self.rect = rect
+        
+        # The surface is the font's cached glyph surface, which is shared
+        # by every letter that uses the same glyph, so it must not be
+        # changed directly. The letter's opacity is applied when the
+        # letter is drawn (see draw_on()), so fades don't copy the surface.
         self.surface = surface
-        self.surface_original = surface.copy()
         self.opacity = opacity
         self.is_space = is_space
         self.previous_letter = previous_letter
 
-        # Apply the given opacity to the letter image.
-        # If the opacity is 255, it won't make a difference to have this line,
-        # but if the opacity is less than 255, we need to apply it here.
-        if opacity < 255:
-            self.surface.fill((255, 255, 255, opacity), None, pygame.BLEND_RGBA_MULT)
-
     def set_opacity(self, opacity: int):
         """
-        Set the new opacity level using the original letter (which always has
-        an opacity of 255) as its source image.
+        Set the new opacity level of the letter.
+        
+        The letter's surface isn't changed here. The opacity gets used
+        as the surface's alpha when the letter is drawn.
         """
 
         if opacity > 255:
@@ -87,13 +90,33 @@ class Letter:
         elif opacity < 0:
             opacity = 0
             
-        if self.opacity == opacity:
-            return
-        
         self.opacity = opacity
 
-        self.surface = self.surface_original.copy()
-        self.surface.fill((255, 255, 255, self.opacity), None, pygame.BLEND_RGBA_MULT)
+    def draw_on(self, destination: pygame.Surface):
+        """
+        Blit the letter onto the given surface, at the letter's opacity.
+        
+        The surface alpha of the shared glyph surface is set just for this
+        blit (it's combined with the glyph's per-pixel alpha) and then
+        restored, so no faded copy of the letter needs to be created.
+        
+        Arguments:
+        
+        - destination: the surface to blit the letter onto (the dialog
+        rectangle's surface or a sprite's image).
+        """
+        
+        # Fully transparent? There is nothing to draw.
+        if self.opacity <= 0:
+            return
+        
+        elif self.opacity >= 255:
+            destination.blit(self.surface, self.rect)
+            return
+        
+        self.surface.set_alpha(self.opacity)
+        destination.blit(self.surface, self.rect)
+        self.surface.set_alpha(255)
 
     def increase_opacity_by(self, increment_by: int):
         """
@@ -462,12 +485,277 @@ class FontLetterDelayHandler:
     
 
 
+class TypewriterReveal:
+    """
+    Shows letter-by-letter (non-fading) dialog text by rendering all the
+    letters once and revealing them with clip rects, instead of updating
+    and blitting each letter every frame.
+    
+    The time at which each letter appears (including the punctuation delays
+    set by <font_text_delay_punc>) is worked out once, when the reveal
+    starts. On each frame, the number of visible letters is found from the
+    elapsed time (a binary search), so the cost per frame doesn't grow with
+    the length of the text.
+    """
+    
+    # The delay per letter in fast-mode (the user clicked to speed up
+    # the text) or when no text delay has been set.
+    # Same as FontLetterDelayHandler.
+    FAST_LETTER_DELAY = 0.012
+    
+    def __init__(self):
+        
+        self.is_active = False
+        
+        # The number of letters the reveal was started with.
+        # If more letters get added, the reveal needs to start again.
+        self.letter_count = 0
+        
+        # The number of letters (from the start of the letters list)
+        # that are visible so far.
+        self.visible_count = 0
+        
+        # Seconds elapsed since the reveal started.
+        self.elapsed = 0.0
+        
+        # Seconds accumulated in fast-mode, for showing letters
+        # at the fast-mode speed.
+        self.fast_mode_time = 0.0
+        
+        # Index: letter index
+        # Value: seconds after the start of the reveal, when the letter
+        # should become visible. Letters that were already visible
+        # when the reveal started have a value of 0.
+        self.reveal_times = []
+        
+        # The area of each line of text.
+        self.line_rects: List[pygame.Rect] = []
+        
+        # Index: letter index, Value: the line index that the letter is on.
+        self.letter_lines = []
+        
+        # All the letters, fully opaque, rendered once.
+        self.text_surface: pygame.Surface
+        self.text_surface = None
+        
+    def start(self,
+              letters: List[Letter],
+              start_index: int,
+              delay_handler: FontLetterDelayHandler):
+        """
+        Work out when each letter should appear and where the lines are.
+        
+        Arguments:
+        
+        - letters: the letters of the dialog text.
+        
+        - start_index: the letter to start revealing from (the gradual
+        letter cursor position). Letters before it that are already fully
+        opaque (such as text before <no_clear>) stay visible.
+        
+        - delay_handler: for the text delay and the punctuation delays.
+        """
+        
+        letter_count = len(letters)
+        
+        # Skip letters that are already visible.
+        start_index = max(0, min(start_index, letter_count))
+        while start_index < letter_count and letters[start_index].opacity >= 255:
+            start_index += 1
+            
+        letter_delay = delay_handler.font_text_delay or self.FAST_LETTER_DELAY
+        
+        reveal_times = [0.0] * letter_count
+        
+        # The time of the last letter that was shown.
+        current_time = 0.0
+        
+        # Spaces that are waiting to be shown with the next letter.
+        pending_spaces = []
+        
+        for index in range(start_index, letter_count):
+            letter = letters[index]
+            
+            # Spaces don't have a delay, they appear with the next letter.
+            if letter.is_space:
+                pending_spaces.append(index)
+                continue
+            
+            current_time += letter_delay
+            reveal_times[index] = current_time
+            
+            for space_index in pending_spaces:
+                reveal_times[space_index] = current_time
+            pending_spaces.clear()
+            
+            # Should there be a pause after this letter? (ie: after a ".")
+            if index + 1 < letter_count:
+                current_time += delay_handler.get_font_after_letter_delay(
+                    letters[index + 1].previous_letter)
+                
+        # Trailing spaces appear after one more letter delay.
+        for space_index in pending_spaces:
+            reveal_times[space_index] = current_time + letter_delay
+            
+        self.reveal_times = reveal_times
+        
+        # Group the letters into lines (consecutive letters with the same Y).
+        self.line_rects = []
+        self.letter_lines = []
+        
+        line_y = None
+        for letter in letters:
+            if letter.rect.y != line_y:
+                line_y = letter.rect.y
+                self.line_rects.append(letter.rect.copy())
+            else:
+                self.line_rects[-1].union_ip(letter.rect)
+                
+            self.letter_lines.append(len(self.line_rects) - 1)
+            
+        self.letter_count = letter_count
+        self.visible_count = start_index
+        self.elapsed = 0.0
+        self.fast_mode_time = 0.0
+        self.text_surface = None
+        self.is_active = True
+        
+    def update(self,
+               delta: float,
+               letters: List[Letter],
+               fast_mode: bool) -> bool:
+        """
+        Advance the reveal by the elapsed time and make the newly
+        visible letters opaque.
+        
+        Arguments:
+        
+        - delta: the number of seconds elapsed since the last frame.
+        
+        - letters: the letters of the dialog text.
+        
+        - fast_mode: whether the user has clicked to speed up the text.
+        Fast-mode doesn't wait for punctuation delays.
+        
+        Return: True if all the letters are now visible.
+        """
+        
+        letter_count = len(letters)
+        
+        # Were all the letters made opaque by something else?
+        # (ie: the user clicked twice to show the text instantly)
+        if letter_count and letters[-1].opacity >= 255:
+            self.visible_count = letter_count
+            return True
+        
+        previous_count = self.visible_count
+        
+        if fast_mode:
+            self.fast_mode_time += delta
+            
+            # Show one letter (plus any spaces before it)
+            # per fast-mode delay.
+            while self.fast_mode_time >= self.FAST_LETTER_DELAY \
+                  and self.visible_count < letter_count:
+                self.fast_mode_time -= self.FAST_LETTER_DELAY
+                
+                while self.visible_count < letter_count \
+                      and letters[self.visible_count].is_space:
+                    self.visible_count += 1
+                    
+                self.visible_count = min(self.visible_count + 1, letter_count)
+                
+            # Continue from here if fast-mode stops being used.
+            if self.visible_count:
+                self.elapsed = max(self.elapsed,
+                                   self.reveal_times[self.visible_count - 1])
+        else:
+            self.elapsed += delta
+            
+            self.visible_count = max(self.visible_count,
+                                     bisect_right(self.reveal_times, self.elapsed))
+            
+        if self.visible_count > previous_count:
+            
+            # Keep the letters' opacity in sync with what's visible,
+            # so the rest of the text handling (<no_clear>, fast-mode)
+            # sees the same state as with per-letter animation.
+            for index in range(previous_count, self.visible_count):
+                letters[index].set_opacity(255)
+                
+            # Play the text sound for the letters shown in this frame.
+            # In fast-mode, only for every 3rd letter, to help prevent 
+            # audio problems.
+            should_play = not fast_mode or any(index % 3 == 0 for index in
+                                               range(previous_count, self.visible_count))
+            if should_play:
+                Passer.active_story.audio_player.play_audio(
+                    audio_name=Passer.active_story.dialog_rectangle.text_sound_name,
+                    audio_channel=audio_player.AudioChannel.TEXT)
+                
+        return self.visible_count >= letter_count
+    
+    def stop(self):
+        """
+        Stop the reveal and release the rendered text.
+        """
+        self.is_active = False
+        self.text_surface = None
+        
+    def draw(self,
+             destination: pygame.Surface,
+             letters: List[Letter]):
+        """
+        Blit the visible part of the text onto the given surface:
+        each line that is fully visible, and the current line up to
+        the last visible letter.
+        
+        Arguments:
+        
+        - destination: the dialog rectangle's surface.
+        
+        - letters: the letters of the dialog text.
+        """
+        
+        # Render all the letters once, fully opaque.
+        if self.text_surface is None \
+           or self.text_surface.get_size() != destination.get_size():
+            
+            self.text_surface = pygame.Surface(destination.get_size(),
+                                               pygame.SRCALPHA)
+            for letter in letters:
+                self.text_surface.blit(letter.surface, letter.rect)
+                
+        if not self.visible_count:
+            return
+        
+        last_visible_index = min(self.visible_count, len(letters)) - 1
+        current_line = self.letter_lines[last_visible_index]
+        
+        # The lines before the current line are fully visible.
+        for line_rect in self.line_rects[:current_line]:
+            destination.blit(self.text_surface, line_rect, area=line_rect)
+            
+        # The current line is visible up to the last visible letter.
+        line_rect = self.line_rects[current_line]
+        visible_rect = pygame.Rect(line_rect.left,
+                                   line_rect.top,
+                                   letters[last_visible_index].rect.right - line_rect.left,
+                                   line_rect.height)
+        
+        destination.blit(self.text_surface, visible_rect, area=visible_rect)
+
+
 class FontAnimation:
     """
     Controls the opacity level of font sprites
     (intro of dialog text)
     """
     
+    # Whether letter-by-letter (non-fading) dialog text uses TypewriterReveal
+    # instead of updating each letter's opacity with FontLetterDelayHandler.
+    use_typewriter_reveal = True
+    
     def __init__(self,
                  reset_sudden_text_finished_flag_method,
                  start_animation_type: FontAnimationShowingType = FontAnimationShowingType.SUDDEN,
@@ -528,6 +816,10 @@ class FontAnimation:
         # and calculations.
         self.letter_delay_handler = FontLetterDelayHandler(self.sprite_mode)
         
+        # Reveals letter-by-letter (non-fading) dialog text with clip rects.
+        # Not used for sprite text.
+        self.typewriter = TypewriterReveal()
+        
         # Deals with the <no_clear> command
         self.no_clear_handler = NoClearHandler(self)
 
@@ -1014,6 +1306,30 @@ class FontAnimation:
             # frame rates.
             if not self.letter_delay_handler.start_time:
                 self.letter_delay_handler.start_time = time.perf_counter()
+                
+            if self.use_typewriter_reveal and not self.sprite_mode:
+                
+                # Start the reveal if it hasn't started yet or if
+                # more letters have been added since it started.
+                if not self.typewriter.is_active \
+                   or self.typewriter.letter_count != len(self.letters):
+                    self.typewriter.start(letters=self.letters,
+                                          start_index=self.gradual_letter_cursor_position,
+                                          delay_handler=self.letter_delay_handler)
+                    
+                finished = self.typewriter.update(delta=AnimationSpeed.delta,
+                                                  letters=self.letters,
+                                                  fast_mode=self.faster_text_mode)
+                
+                # Record where the cursor is, in case we need to resume
+                # from there due to a <no_clear> command.
+                self.gradual_letter_cursor_position =\
+                    min(self.typewriter.visible_count, len(self.letters) - 1)
+                
+                if finished:
+                    self.stop_intro_animation()
+                    
+                return True
 
             # Advance the dialogue by 1 or more letters to catch up with
             # the wait-time delay.
@@ -1106,6 +1422,8 @@ class FontAnimation:
         """
         self.is_start_animating = False
         self.faster_text_mode = False
+        
+        self.typewriter.stop()
 
         # Now that the text intro animation has stopped,
         # check if we should skip clearing the text the next time
@@ -1164,6 +1482,111 @@ class LetterProperties:
         # [("abcd", -1, 0), ("efgh", -5, 2)]
         self.kerning_rules = kerning_rules
 
+class Glyph:
+    """
+    Stores the image and the measurements of a single letter,
+    cut out of a font spritesheet once, when the font is loaded.
+    
+    An object of this class gets stored in a FontSprite object and is
+    shared (read-only) by every Letter that shows the same letter.
+    
+    - surface (pygame.Surface)
+    The letter's image, ready for blitting.
+    
+    - width, height (int)
+    The size of the letter's image.
+    
+    - edge_left, edge_right (int)
+    The first and last X positions (from the letter's bounding rect)
+    that have non-transparent pixels. Used with DetectLetterEdges.
+    
+    - offset_left (int)
+    How far left to shift the letter so its pixels start at the text
+    cursor (edge_left with DetectLetterEdges, otherwise 0).
+    
+    - advance (int)
+    How far the next letter starts from this letter, before letter
+    padding and kerning (edge_right with DetectLetterEdges, otherwise
+    the letter's width). Spaces always use their full width.
+    """
+    def __init__(self,
+                 surface: pygame.Surface,
+                 detect_letter_edges: bool,
+                 is_space: bool,
+                 metrics: Dict = None):
+        """
+        Arguments:
+        
+        - surface: the letter's image.
+        
+        - detect_letter_edges: the font's DetectLetterEdges setting.
+        
+        - is_space: whether the letter is a space character.
+        
+        - metrics: the letter's measurements, baked by the story compiler
+        ("Width", "Height", "EdgeLeft", "EdgeRight", "Advance").
+        If None (stories compiled before metrics were baked), the letter's
+        pixels are measured here instead.
+        """
+        
+        self.surface = surface
+        
+        self.width, self.height = surface.get_size()
+        
+        if metrics:
+            self.edge_left = metrics.get("EdgeLeft")
+            self.edge_right = metrics.get("EdgeRight")
+            self.advance = metrics.get("Advance")
+            
+        else:
+            # Get the rect without any transparent parts.
+            rect_opaque = surface.get_bounding_rect(min_alpha=1)
+            
+            self.edge_left = rect_opaque.left
+            self.edge_right = rect_opaque.right
+            
+            if detect_letter_edges and not is_space:
+                self.advance = self.edge_right
+            else:
+                self.advance = self.width
+                
+        if detect_letter_edges and not is_space:
+            self.offset_left = self.edge_left
+        else:
+            self.offset_left = 0
+
+
+class PositionedGlyph:
+    """
+    A letter that has been positioned by the text layout stage
+    (ActiveFontHandler.layout_text), ready to be turned into a Letter.
+    
+    - glyph (Glyph)
+    The font's cached letter image and measurements.
+    
+    - x, y (int)
+    The position of the letter, relative to the dialog rectangle
+    (or the sprite, for sprite text).
+    
+    - is_space (bool)
+    
+    - previous_letter (str)
+    The letter before this one, used for punctuation delays.
+    """
+    def __init__(self,
+                 glyph: Glyph,
+                 x: int,
+                 y: int,
+                 is_space: bool,
+                 previous_letter: str):
+        
+        self.glyph = glyph
+        self.x = x
+        self.y = y
+        self.is_space = is_space
+        self.previous_letter = previous_letter
+
+
 class FontSprite:
     """
     Keeps the font name and the full font spritesheet.
@@ -1240,6 +1663,85 @@ class FontSprite:
         # Key: letter (str)
         # Value: LetterProperties object
         self.letters = new_letters
+        
+        # Key: (previous letter, letter)
+        # Value: (left trim, right trim)
+        # The previous letter can be "(Any)", which is the fallback
+        # when there is no rule for the specific previous letter.
+        self.kerning_table = {}
+        
+        # The kerning table compiled by the story compiler (if any), as a
+        # list of [previous letter, letter, left trim, right trim].
+        compiled_kerning_table = font_properties.get("KerningTable")
+        
+        if compiled_kerning_table is not None:
+            for previous_letter, letter, left_trim, right_trim in compiled_kerning_table:
+                self.kerning_table[(previous_letter, letter)] = (left_trim, right_trim)
+        else:
+            # The story was compiled before kerning tables were baked.
+            self.kerning_table = compile_kerning_table(
+                {letter: letter_properties.kerning_rules
+                 for letter, letter_properties in self.letters.items()})
+            
+        # Key: letter, Value: dict of letter measurements,
+        # baked by the story compiler. None for older stories.
+        self.letter_metrics = font_properties.get("LetterMetrics")
+        
+        # Key: letter (str)
+        # Value: Glyph object
+        self.glyphs = {}
+        
+        self._build_glyph_cache()
+        
+    def _build_glyph_cache(self):
+        """
+        Cut out every letter from the full font spritesheet once
+        and measure its edges.
+        
+        Purpose: so that showing dialogue text doesn't need to crop,
+        convert and measure a new surface for every letter of every line.
+        """
+        
+        # If the spritesheet already has per-pixel alpha, the letters
+        # can be subsurfaces of it (no copying of pixel data).
+        # Otherwise, convert each letter once so it has per-pixel alpha.
+        spritesheet_has_alpha =\
+            bool(self.full_font_spritesheet.get_flags() & pygame.SRCALPHA)
+        
+        # Letter measurements baked by the story compiler (if any).
+        letter_metrics = self.letter_metrics or {}
+        
+        letter_details: LetterProperties
+        for letter, letter_details in self.letters.items():
+            
+            # The rect here is not a normal pygame rect. It's a tuple like this:
+            # (left, top, right, lower)
+            left, top, right, lower = letter_details.rect_crop
+            
+            # The rect area that we want to crop to get the letter.
+            letter_rect = pygame.Rect(left, top, right - left, lower - top)
+            
+            try:
+                letter_surface = self.full_font_spritesheet.subsurface(letter_rect)
+            except ValueError:
+                logging.warning(f"Could not get letter {letter} - beyond font spritesheet boundries.")
+                continue
+            
+            if not spritesheet_has_alpha:
+                letter_surface = letter_surface.convert_alpha()
+                
+            self.glyphs[letter] =\
+                Glyph(surface=letter_surface,
+                      detect_letter_edges=self.detect_letter_edges,
+                      is_space=letter == " ",
+                      metrics=letter_metrics.get(letter))
+            
+    def get_glyph(self, letter: str) -> Glyph | None:
+        """
+        Return the cached Glyph object of the given letter
+        or None if the font doesn't have the letter.
+        """
+        return self.glyphs.get(letter)
 
     def get_letter_trims(self,
                          letter: str,
@@ -1257,86 +1759,37 @@ class FontSprite:
         letter is in this variable. If the value is "(Any)", it means
         the kerning rule will apply regardless of the previous letter.
         """
-        letter_properties: LetterProperties
-        letter_properties = self.letters.get(letter)
-        
-        if not letter_properties or previous_letter is None:
+        if previous_letter is None:
             return (0, 0)
-
-        # kerning_rules will look like this:
-        # [('tes', -2, 0), ('(Any)', 1, 0), ('a', -2, 0)]
-        # or
-        # ('(Any)', 1, 0)
-
-        left_trim = 0
-        right_trim = 0
         
-        for rule in letter_properties.kerning_rules:
-            previous_letters = rule[0]
-
-            if previous_letters == "(Any)":
-                left_trim = rule[1]
-                right_trim = rule[2]                
-            else:
-                for prev_letter in previous_letters:
-                    if prev_letter == previous_letter:
-                        left_trim = rule[1]
-                        right_trim = rule[2]                        
-                        break
-
-        return (left_trim, right_trim)
+        trims = self.kerning_table.get((previous_letter, letter))
+        if trims is None:
+            trims = self.kerning_table.get(("(Any)", letter), (0, 0))
+            
+        return trims
 
     def get_letter(self,
                    letter: str,
                    dialog_surface: pygame.Surface = None) -> pygame.Surface:
         """
-        Slice a letter from the full font spritesheet and return it
-        as a subsurface of the given dialog surface.
+        Return the image of a letter from the font's glyph cache.
         
         Arguments:
         
         - letter: the single character letter that we want the font sprite for.
         
-        - dialog_surface: the surface where the font spritesheets will appear
-        on. The letter that gets returned in this method will have
-        dialog_surface as its parent.
+        - dialog_surface: no longer used. The letters are cut out
+        of the full font spritesheet when the font is loaded.
         
-        Return: letter subsurface. The parent of the subsurface will be the
-        full size font spritesheet surface.
+        Return: the letter's surface. It's shared by all the letters that
+        use it, so it must not be changed directly.
         """
-
-        # Get the letter's properties
-        letter_details: LetterProperties
-        letter_details = self.letters.get(letter)
+        glyph = self.glyphs.get(letter)
         
-        if not letter_details:
-            return        
-
-        # Get the rect of the requested letter.
-        # The rect here is not a normal pygame rect. It's a tuple like this:
-        # (left, top, right, lower)
-        rect_letter = letter_details.rect_crop
-
-
-        left, top, right, lower = rect_letter
-
-        # The .subsurface method will need the width and height of the
-        # area, not the right and lower coordinates.
-        width = right - left
-        height = lower - top
-
-        # The rect area that we want to crop to get the letter.
-        letter_rect = pygame.Rect(left, top, width, height)
-
-        # Get the subsurface of the requested letter.
-        try:
-            sub_surface_letter = \
-                self.full_font_spritesheet.subsurface(letter_rect).convert_alpha()
-        except ValueError:
-            logging.warning(f"Could not get letter {letter} - beyond font spritesheet boundries.")
+        if not glyph:
             return
-
-        return sub_surface_letter
+        
+        return glyph.surface
 
 class ActiveFontHandler:
     """
@@ -1347,6 +1800,9 @@ class ActiveFontHandler:
     The rules of the current dialog text are in this object too, such as
     whether fading-in is enabled, sudden-mode, or regular gradual mode.
     """
+    
+    # The maximum number of sprite text renderings to keep per sprite.
+    SPRITE_TEXT_CACHE_SIZE = 8
 
     def __init__(self, story, sprite_object: SpriteObject = None):
 
@@ -1383,6 +1839,33 @@ class ActiveFontHandler:
 
         # List of Letter class objects.
         self.letters_to_blit = []
+        
+        # The fully opaque letters at the start of letters_to_blit get
+        # baked into this surface, so they can be drawn with one blit.
+        # Letters that are still fading in are blitted individually.
+        self.baked_text_surface: pygame.Surface
+        self.baked_text_surface = None
+        
+        # The number of letters (from the start of letters_to_blit)
+        # that have been baked into baked_text_surface.
+        self.baked_letter_count = 0
+        
+        # Sprite text only.
+        # Each line of text that has been added since the text was last
+        # cleared, as (font name, line text, start x, start y).
+        # Used as the key of sprite_text_cache.
+        self.sprite_text_runs = []
+        
+        # Sprite text only.
+        # Key: tuple of sprite_text_runs
+        # Value: (sprite image without text, sprite image with the text)
+        self.sprite_text_cache = OrderedDict()
+        
+        # Sprite text only.
+        # The last sprite text that was rendered:
+        # (sprite image without text, letters signature, rendered surface)
+        # Used for redrawing only the letters that changed.
+        self.last_sprite_text_render = None
 
         # This will be a FontSprite object.
         self.current_font: FontSprite
@@ -1493,129 +1976,211 @@ class ActiveFontHandler:
                     # We're only interested in the X value.
                     return x
 
-    def add_letter(self,
-                   letter_subsurface: pygame.Surface,
-                   is_space: bool,
-                   previous_letter: str,
-                   left_trim: int = 0,
-                   right_trim: int = 0):
+    def add_letter(self, positioned_glyph: PositionedGlyph):
         """
-        Add an individual subsurface letter to the list of letters
-        that should be displayed.
-        
-        Also, calculate where the next letter, after this one,
-        should be positioned.
+        Add a letter, which has already been positioned by layout_text(),
+        to the list of letters that should be displayed.
         
         Arguments:
         
-        - letter_subsurface: the surface that has the letter image.
-        
-        - is_space: the Letter class needs to know if it's a space character
-        or not because space characters don't have a fade effect in gradual
-        text mode, no text delay, and they don't have a text sound.
-        
-        - previous_letter: the str letter that was blitted prior to this one.
-        We need this to check whether we should apply a delay to this new letter
-        due to <font_text_delay_punc>. For example, if <font_text_delay_punc>
-        gets used with "." and now we're on the letter *after* the ".",
-        there might need to be a delay.
-        
-        - left_trim: used for positioning the current letter that is about
-        to be added. It's used for nudging its position. A negative value
-        will move it more to the left, a positive value will move it more
-        to the right, and a value of 0 (zero) won't nudge the letter
-        that we're about to add.
-        
-        - right_trim: used for positioning the next letter (the letter after
-        the one we're going to be adding now). A negative value will move the
-        next letter more the left, a positive value will move the next letter
-        more to the right, and a value of 0 (zero) won't nudge the next letter.
+        - positioned_glyph: the glyph and its position, relative to the
+        dialog rectangle (or the sprite, for sprite text).
         """
-
-        rect = letter_subsurface.get_rect()
         
-        # Get the rect without any transparent parts.
-        rect_opague = letter_subsurface.get_bounding_rect(min_alpha=1)
+        glyph = positioned_glyph.glyph
         
-        if self.current_font.detect_letter_edges:
-
-            if is_space:
-                pixel_edge_left = 0
-                pixel_edge_right = rect.width
-            else:
-                # Record the last non-transparent pixel on the right
-                # of the letter.
-                pixel_edge_right = rect_opague.right
-
-                #pixel_edge_right =\
-                    #self._get_letter_right_edge(letter_surface=letter_subsurface,
-                                                #rect_to_check=rect)
-
-                # Record the first non-transparent pixel on the left
-                # of the letter
-                pixel_edge_left = rect_opague.left
-
-                #pixel_edge_left =\
-                    #self._get_letter_left_edge(letter_surface=letter_subsurface,
-                                               #rect_to_check=rect)
-            
-        # First letter being added? Default the X and Y
-        # positions to the default.
-        if not self.letters_to_blit:
-            self.next_letter_x_position = self.default_x_position
-            self.next_letter_y_position = self.default_y_position
-
-
-        # Position the new letter to where a non-transparent pixel starts?
-        if self.current_font.detect_letter_edges:
-
-            # Position the new letter to show starting at
-            # where a non-transparent pixel starts in the new letter.
-            self.next_letter_x_position -= pixel_edge_left
-
-        # Position the X and Y of the letter that is about to be added
-        # to the blit list.
-        rect.x = self.next_letter_x_position
-        rect.y = self.next_letter_y_position
-
-        # Add left trim (if any) to the letter that is about to be added.
-        # This is used for positioning the letter a little to the left (negative int)
-        # or a little to the right (positive int). In other words, it's used for letter nudging.
-        rect.x += left_trim
+        rect = pygame.Rect(positioned_glyph.x,
+                           positioned_glyph.y,
+                           glyph.width,
+                           glyph.height)
         
         # Get the starting opacity level based on the
         # font animation for the dialog text.
         opacity: int = self.font_animation.get_start_opacity_level()
 
         letter = Letter(rect=rect,
-                        surface=letter_subsurface,
+                        surface=glyph.surface,
                         opacity=opacity,
-                        is_space=is_space,
-                        previous_letter=previous_letter)
+                        is_space=positioned_glyph.is_space,
+                        previous_letter=positioned_glyph.previous_letter)
         
         self.letters_to_blit.append(letter)
-
-        # Calculate where the next letter should be positioned.
-        if not self.current_font.detect_letter_edges:
-            # Position the next letter to show at the end of the current surface,
-            # without taking the letter's non-transparent pixel data into consideration.
-            self.next_letter_x_position += rect.width + self.current_font.padding_letters
-        else:
-            # Position the next letter, taking the current letter's 
-            # last non-transparent pixel into consideration (pixel_edge_right).
-            self.next_letter_x_position += pixel_edge_right + self.current_font.padding_letters
+        
+    def _get_wrap_right_edge(self) -> int | None:
+        """
+        Return the X position that dialog text should not go past,
+        before wrapping to the next line, or None if the text shouldn't wrap.
+        
+        Only dialog rectangle text wraps. The right margin is the same
+        as the left margin (the X start position of the text).
+        Sprite text doesn't wrap, because it has no width to wrap against.
+        """
+        if self.sprite_object:
+            return
+        
+        dialog_rectangle = getattr(self.story, "dialog_rectangle", None)
+        if not dialog_rectangle:
+            return
+        
+        return dialog_rectangle.width_rectangle - self.default_x_position
+        
+    def layout_text(self,
+                    line_text: str,
+                    wrap_right_edge: int = None) -> List[PositionedGlyph]:
+        """
+        Position all the letters of the given line in one pass, using
+        the font's cached glyph measurements and kerning table.
+        
+        The layout starts at the current text 'cursor'
+        (next_letter_x_position, next_letter_y_position), and the cursor
+        is left after the last letter when it's done.
+        
+        Nothing is drawn or created here, other than the positions;
+        add_letter() turns the positioned glyphs into letters.
+        
+        Arguments:
+        
+        - line_text: the string to lay out.
+        
+        - wrap_right_edge: if a letter goes past this X position, the word
+        that the letter is in moves to the next line. If a single word is
+        wider than a whole line, it wraps at the letter instead.
+        None means don't wrap.
+        
+        Return: a list of PositionedGlyph objects.
+        """
+        
+        font = self.current_font
+        line_height = font.height + font.padding_lines
+        
+        positioned_glyphs = []
+        
+        # Where the text cursor is.
+        x = self.next_letter_x_position
+        y = self.next_letter_y_position
+        
+        # First letter of the dialog text? Start at the default position.
+        if not self.letters_to_blit:
+            x = self.default_x_position
+            y = self.default_y_position
             
-        # Add right trim padding so the next letter starts
-        # a bit to the left (negative int)
-        # or a bit to the right (positive int)
-        # In other words, this is used for nudging the position of the next letter.
-        self.next_letter_x_position += right_trim
+        # The index (in positioned_glyphs) of the first letter of the 
+        # current word and the cursor's X position before that letter.
+        # Used for moving a whole word to the next line.
+        word_start_index = 0
+        word_start_x = x
+        
+        # The index (in positioned_glyphs) of the first letter 
+        # of the current line.
+        line_start_index = 0
+        
+        # If the text starts partway through a line (after <continue>),
+        # even the first word can be moved to the next line.
+        line_started_midway = x != self.default_x_position
+        
+        # Used for letter kerning
+        previous_letter = None
+        
+        for letter in line_text:
+            
+            glyph = font.get_glyph(letter=letter)
+            
+            # The font doesn't have this letter.
+            if not glyph:
+                continue
+            
+            is_space = letter == " "
+            
+            # Get the amount of padding/kerning to use for the letter,
+            # based on the kerning rules and the previous letter.
+            left_trim, right_trim =\
+                font.get_letter_trims(letter=letter,
+                                      previous_letter=previous_letter)
+            
+            if is_space:
+                # The next word starts after this space.
+                word_start_index = len(positioned_glyphs) + 1
+                word_start_x = None
+                
+            elif word_start_x is None:
+                # First letter of a new word.
+                word_start_x = x
+                
+            # Where the letter's pixels start and end.
+            pixel_edge_left = glyph.offset_left
+            pixel_edge_right = glyph.advance
+                
+            # Does the letter go past the right edge?
+            # (spaces never wrap, they can hang past the edge)
+            if wrap_right_edge is not None \
+               and not is_space \
+               and x - pixel_edge_left + left_trim + pixel_edge_right > wrap_right_edge:
+                
+                can_move_word = word_start_index > line_start_index \
+                    or (word_start_index == line_start_index and line_started_midway)
+                
+                if can_move_word:
+                    # Move the current word (the letters of it laid out 
+                    # so far) to the start of the next line.
+                    move_x = self.default_x_position - word_start_x
+                    
+                    for positioned_glyph in positioned_glyphs[word_start_index:]:
+                        positioned_glyph.x += move_x
+                        positioned_glyph.y += line_height
+                        
+                    line_start_index = word_start_index
+                    
+                elif len(positioned_glyphs) > line_start_index:
+                    # The word is wider than a whole line, so wrap 
+                    # from this letter.
+                    move_x = self.default_x_position - x
+                    
+                    line_start_index = len(positioned_glyphs)
+                    word_start_index = line_start_index
+                    
+                else:
+                    # The letter is the first one on its line,
+                    # so there's nowhere better to put it.
+                    move_x = None
+                    
+                if move_x is not None:
+                    x += move_x
+                    y += line_height
+                    word_start_x = self.default_x_position
+                    line_started_midway = False
+                
+            # Position the new letter to show starting at
+            # where a non-transparent pixel starts in the new letter.
+            x -= pixel_edge_left
+            
+            # Add left trim (if any), used for nudging the letter.
+            positioned_glyphs.append(
+                PositionedGlyph(glyph=glyph,
+                                x=x + left_trim,
+                                y=y,
+                                is_space=is_space,
+                                previous_letter=previous_letter))
+            
+            # Position the next letter after this letter (or after the
+            # letter's last non-transparent pixel, with DetectLetterEdges).
+            x += pixel_edge_right + font.padding_letters
+            
+            # Add right trim so the next letter is nudged.
+            x += right_trim
+            
+            # Keep track of the previous letter for kerning purposes.
+            previous_letter = letter
+            
+        self.next_letter_x_position = x
+        self.next_letter_y_position = y
+        
+        return positioned_glyphs
         
     def process_text(self, line_text: str):
         """
-        Get the letter sprites for the letters in the given string
-        and add them to a list so they can be blitted later,
-        all while following the font kerning rules.
+        Lay out the letters of the given string (following the font kerning
+        rules and wrapping at the dialog rectangle's width) and add them
+        to a list so they can be blitted later.
         
         Arguments:
         
@@ -1630,40 +2195,26 @@ class ActiveFontHandler:
             else:
                 subject_name = "dialog rectangle"
             raise ValueError(f"No font defined for '{subject_name}'")
-
-        # Used for letter kerning
-        previous_letter = None
-
-        # Read the line we've been given, line by line.
-        for letter in self.read_next_letter(line_text=line_text):
-
-            # print("Read letter:", letter)
-            logging.info(f"Read letter: {letter}")
-
-            # Now get the letter surface (the cropped image of the letter)
-            letter_surface =\
-                self.current_font.get_letter(letter=letter)
-
-            # Get the amount of padding/kerning to use for the letter
-            # that we're going to blit soon, based on the kerning rules
-            # and the previous letter.
-            left_trim, right_trim =\
-                self.current_font.get_letter_trims(letter=letter,
-                                                   previous_letter=previous_letter)
-
-            # Was the letter sprite found?
-            if letter_surface:
-                # Yes, it was found. Add it to the list of letters that
-                # should be displayed in the dialog rectangle.
-                self.add_letter(letter_subsurface=letter_surface,
-                                is_space=(letter == " "),
-                                previous_letter=previous_letter,
-                                left_trim=left_trim,
-                                right_trim=right_trim)
-                
-                # Keep track of the previous letter for kerning purposes.
-                previous_letter = letter                
+        
+        if self.sprite_object:
+            # Record the font, text and where the line starts,
+            # for the sprite text cache.
+            if self.letters_to_blit:
+                start_position = (self.next_letter_x_position,
+                                  self.next_letter_y_position)
+            else:
+                start_position = (self.default_x_position,
+                                  self.default_y_position)
                 
+            self.sprite_text_runs.append((self.current_font.font_name,
+                                          line_text) + start_position)
+        
+        positioned_glyphs =\
+            self.layout_text(line_text=line_text,
+                             wrap_right_edge=self._get_wrap_right_edge())
+        
+        for positioned_glyph in positioned_glyphs:
+            self.add_letter(positioned_glyph=positioned_glyph)
         
         # Keep track of where the end of the line is for the X position.
         # Used for restoring the X position when <continue> is reached.
@@ -1688,27 +2239,6 @@ class ActiveFontHandler:
         if self.adjusted_y:
             self.next_letter_y_position -= self.adjusted_y
             self.adjusted_y = 0
-        
-
-    def read_next_letter(self, line_text):
-        """
-        The story doesn't currently contain a command to run, so
-        the read_story() method wants us to show the text now as dialog text.
-                
-        While text is being displayed, the main non-background story reader
-        should not be allowed to progress. Only background story readers
-        should be allowed to progress. But background story readers should
-        not be allowed to display dialog text, because imagine what would
-        happen if 15 background story readers tried to show dialog text.
-        """
-
-        # At this point, we're not reading a command, because the method,
-        # read_story(), called our method here (read_dialogue_text()), since
-        # there are no commands (so far) to parse.
-
-        # Loop through each individual letter
-        for letter in line_text:
-            yield letter
 
     def clear_letters(self):
         """
@@ -1731,6 +2261,12 @@ class ActiveFontHandler:
                 return
             
             self.letters_to_blit.clear()
+            
+            # The baked letters are no longer needed.
+            self.baked_text_surface = None
+            self.baked_letter_count = 0
+            
+            self.sprite_text_runs.clear()
 
             # Reset flag which indicates that all the text in sudden-mode
             # has already been blitted (to prevent repeated letter blittings in sudden-mode
@@ -1771,35 +2307,32 @@ class ActiveFontHandler:
                 
             else:
                 # Not a dialog rectangle.
-                # We're about to draw text on a sprite.
-                
-                # Reset the original image with the 'actual' original image
-                # that doesn't contain any text drawn on it.
-                self.sprite_object.original_image = \
-                    self.sprite_object.get_original_image_without_text()
-
-                # We're going to draw text on the sprite's surface.
-                surface_to_draw_on = self.sprite_object.original_image
-
-                # surface_to_draw_on = self.sprite_object.image
+                # We're about to draw text on a sprite, which is done
+                # below in _draw_sprite_text(), after animating.
+                surface_to_draw_on = None
             
             # Animate any gradual text animations (gradual letter fades or 
             # letter by letter).
             # Get a value indicating whether an animation took place or not.
             animated_this_frame = self.font_animation.animate()            
 
-            # Used inside the loop below; meant for sudden-mode
-            blitted_a_letter = False
-
             # Blit letters onto the newly (re)drawn dialog rectangle
             # or onto the sprite object.
-            letter: Letter
-            for letter in self.letters_to_blit:
-                surface_to_draw_on.blit(letter.surface,
-                                        letter.rect)
-
-                # Meant for sudden-mode, used later in this method.
+            # Meant for sudden-mode, used later in this method.
+            if self.sprite_object:
+                blitted_a_letter = self._draw_sprite_text()
+                
+            elif self.font_animation.typewriter.is_active:
+                # Letter-by-letter text, revealed with clip rects.
+                self.font_animation.typewriter.draw(
+                    destination=surface_to_draw_on,
+                    letters=self.letters_to_blit)
+                
                 blitted_a_letter = True
+                
+            else:
+                blitted_a_letter =\
+                    self._draw_letters(surface_to_draw_on=surface_to_draw_on)
 
             """
             If we blitted letter(s) and the font mode is sudden-mode,
@@ -1907,6 +2440,214 @@ class ActiveFontHandler:
                     # the text on a sprite object.
                     self.sudden_text_drawn_already = True
 
+    def _draw_letters(self, surface_to_draw_on: pygame.Surface) -> bool:
+        """
+        Blit the letters onto the given surface.
+        
+        Letters that are fully opaque (starting from the first letter)
+        are baked into one surface the first time they're drawn, so on the
+        next frames they're drawn with a single blit. Only the letters
+        that are still being animated are blitted one by one.
+        
+        The baked surface is only re-created when the letters are cleared,
+        when the surface to draw on changes size, or if a letter that was
+        baked is no longer fully opaque (for example, faded in again).
+        
+        Arguments:
+        
+        - surface_to_draw_on: the dialog rectangle's surface or the
+        sprite's image (for sprite text).
+        
+        Return: True if there were letters to blit.
+        """
+        
+        if not self.letters_to_blit:
+            return False
+        
+        # Do we need to (re)create the baked surface?
+        if self.baked_text_surface is None \
+           or self.baked_text_surface.get_size() != surface_to_draw_on.get_size() \
+           or self.baked_letter_count > len(self.letters_to_blit) \
+           or any(letter.opacity < 255
+                  for letter in self.letters_to_blit[:self.baked_letter_count]):
+            
+            self.baked_text_surface =\
+                pygame.Surface(surface_to_draw_on.get_size(), pygame.SRCALPHA)
+            self.baked_letter_count = 0
+            
+        # Bake the letters that have become fully opaque since the last
+        # frame. They won't change again until the text gets cleared.
+        letter: Letter
+        while self.baked_letter_count < len(self.letters_to_blit):
+            letter = self.letters_to_blit[self.baked_letter_count]
+            
+            if letter.opacity < 255:
+                break
+            
+            letter.draw_on(self.baked_text_surface)
+            self.baked_letter_count += 1
+            
+        if self.baked_letter_count:
+            surface_to_draw_on.blit(self.baked_text_surface, (0, 0))
+            
+        # Blit the letters that are still being animated.
+        for letter in self.letters_to_blit[self.baked_letter_count:]:
+            letter.draw_on(surface_to_draw_on)
+            
+        return True
+
+    def _get_letters_signature(self) -> Tuple:
+        """
+        Return what each letter looks like and where it is,
+        for comparing one rendering of sprite text with another.
+        """
+        return tuple((letter.surface, letter.rect.x, letter.rect.y)
+                     for letter in self.letters_to_blit)
+    
+    def _render_sprite_text(self,
+                            base_image: pygame.Surface) -> pygame.Surface:
+        """
+        Return a new surface of the sprite's image (without text) with
+        the current letters drawn on it.
+        
+        If the previous rendering was on the same image, only the area
+        of the letters that changed gets redrawn (for example, the last
+        digit of a counter), instead of drawing every letter again.
+        
+        Arguments:
+        
+        - base_image: the sprite's image without any text on it.
+        """
+        
+        letters_signature = self._get_letters_signature()
+        
+        previous_render = self.last_sprite_text_render
+        
+        if not previous_render or previous_render[0] is not base_image:
+            # Draw all the letters.
+            rendered_surface = base_image.copy()
+            
+            for letter in self.letters_to_blit:
+                letter.draw_on(rendered_surface)
+                
+        else:
+            # Only redraw where the letters have changed.
+            _, previous_signature, previous_surface = previous_render
+            
+            rendered_surface = previous_surface.copy()
+            
+            dirty_rect = None
+            
+            for index in range(max(len(previous_signature), len(letters_signature))):
+                
+                previous_letter = previous_signature[index] \
+                    if index < len(previous_signature) else None
+                
+                new_letter = letters_signature[index] \
+                    if index < len(letters_signature) else None
+                
+                if previous_letter == new_letter:
+                    continue
+                
+                for changed_letter in (previous_letter, new_letter):
+                    if not changed_letter:
+                        continue
+                    
+                    letter_surface, x, y = changed_letter
+                    letter_rect = letter_surface.get_rect(topleft=(x, y))
+                    
+                    if dirty_rect:
+                        dirty_rect.union_ip(letter_rect)
+                    else:
+                        dirty_rect = letter_rect
+                        
+            if dirty_rect:
+                dirty_rect = dirty_rect.clip(rendered_surface.get_rect())
+                
+                # Restore the sprite's image where the letters changed
+                # (a blit onto a fully transparent area copies the pixels
+                # as-is) and redraw the letters only in that area.
+                rendered_surface.fill((0, 0, 0, 0), dirty_rect)
+                rendered_surface.blit(base_image, dirty_rect, area=dirty_rect)
+                
+                rendered_surface.set_clip(dirty_rect)
+                
+                for letter in self.letters_to_blit:
+                    if letter.rect.colliderect(dirty_rect):
+                        letter.draw_on(rendered_surface)
+                        
+                rendered_surface.set_clip(None)
+                
+        self.last_sprite_text_render =\
+            (base_image, letters_signature, rendered_surface)
+        
+        return rendered_surface
+    
+    def _draw_sprite_text(self) -> bool:
+        """
+        Draw the letters on the sprite (for sprite text).
+        
+        When all the letters are fully shown, the sprite's image with text
+        is taken from a cache (keyed by the font, text and position of each
+        line of text), so switching between texts that have been shown
+        before (such as button labels) doesn't draw any letters. Otherwise,
+        it's rendered with _render_sprite_text().
+        
+        While letters are still being animated, they're drawn on a new copy
+        of the sprite's image every time.
+        
+        Return: True if there were letters to blit.
+        """
+        
+        if not self.letters_to_blit:
+            return False
+        
+        sprite = self.sprite_object
+        
+        # The sprite's image without any text on it.
+        base_image = sprite.original_image_before_text
+        
+        still_animating = any(letter.opacity < 255
+                              for letter in self.letters_to_blit)
+        
+        if still_animating:
+            # Reset the original image with the 'actual' original image
+            # that doesn't contain any text drawn on it, and draw
+            # the letters on it.
+            sprite.original_image = sprite.get_original_image_without_text()
+            
+            for letter in self.letters_to_blit:
+                letter.draw_on(sprite.original_image)
+                
+            return True
+        
+        cache_key = tuple(self.sprite_text_runs)
+        
+        cached_render = self.sprite_text_cache.get(cache_key)
+        
+        # Only use the cached image if it was drawn on the sprite's
+        # current image (the sprite could have been swapped or flipped).
+        if cached_render and cached_render[0] is base_image:
+            self.sprite_text_cache.move_to_end(cache_key)
+            rendered_surface = cached_render[1]
+        else:
+            rendered_surface = self._render_sprite_text(base_image=base_image)
+            
+            self.sprite_text_cache[cache_key] = (base_image, rendered_surface)
+            
+            # Remove the least recently used rendering.
+            if len(self.sprite_text_cache) > self.SPRITE_TEXT_CACHE_SIZE:
+                self.sprite_text_cache.popitem(last=False)
+                
+        # The rendered surface is shared with the cache, so it must not
+        # be drawn on directly (effects are applied to copies of it).
+        sprite.original_image = rendered_surface
+        
+        # The image has changed, so any effects need to be re-applied.
+        sprite.reset_applied_effects()
+        
+        return True
+
     def set_active_font(self, font_name):
         """
         Set the font that will be used for displaying the next letter.
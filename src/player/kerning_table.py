@@ -0,0 +1,74 @@
+"""
+Copyright 2023-2026 Jobin Rezai
+
+This file is part of LVNAuth.
+
+LVNAuth is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LVNAuth is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Compiles font sprite kerning rules into a lookup table.
+
+Used by both the story compiler (editor), which bakes the table into
+the .lvna file, and the player's font handler, for stories that were
+compiled before kerning tables were baked.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+
+def compile_kerning_table(kerning_rules_by_letter: Dict[str, Iterable]) \
+        -> Dict[Tuple[str, str], Tuple[int, int]]:
+    """
+    Compile the kerning rules of all the letters into one dictionary,
+    so that getting the trims of a letter is a single lookup.
+
+    The rules are read in order and a later matching rule wins over
+    an earlier one. So an "(Any)" rule replaces the specific
+    previous-letter rules that came before it, but not the ones
+    that come after it.
+
+    Arguments:
+
+    - kerning_rules_by_letter: key: letter, value: the letter's kerning
+    rules, such as: [('tes', -2, 0), ('(Any)', 1, 0), ('a', -2, 0)]
+
+    Return: key: (previous letter, letter), value: (left trim, right trim)
+    The previous letter can be "(Any)", which is the fallback
+    when there is no rule for the specific previous letter.
+    """
+
+    kerning_table = {}
+
+    for letter, kerning_rules in kerning_rules_by_letter.items():
+
+        # Key: previous letter, Value: (left trim, right trim)
+        letter_trims = {}
+
+        for rule in kerning_rules:
+            previous_letters = rule[0]
+            trims = (rule[1], rule[2])
+
+            if previous_letters == "(Any)":
+                # This rule overrides all the rules before it.
+                letter_trims.clear()
+                letter_trims["(Any)"] = trims
+            else:
+                for previous_letter in previous_letters:
+                    letter_trims[previous_letter] = trims
+
+        for previous_letter, trims in letter_trims.items():
+            kerning_table[(previous_letter, letter)] = trims
+
+    return kerning_table
@@ -175,6 +175,14 @@ class Main:
                 story_info.get("StoryTitle"),
                 story_info.get("Episode"))
 
+        # Keep <remote_save> key/values in a journal file next to the
+        # visual novel's config file, so the story doesn't wait for the
+        # server and the key/values are kept if the server can't be reached.
+        if web_enabled:
+            Passer.web_handler.start_remote_save_journal(
+                journal_file_path=Passer.player_config.config_file_path.with_name(
+                    "vn_remote_saves"))
+
     def begin(self):
         """
         Show the launch window and then start the pygame loop.
@@ -363,7 +371,8 @@ class Main:
     
                 
                 camera.apply(virtual_surface=virtual_surface,
-                             main_surface=main_surface)
+                             main_surface=main_surface,
+                             content_version=story.content_version)
                 
                 story.on_render_dialog_rectangle(main_surface)
                 
@@ -511,6 +520,22 @@ class Main:
                 # Show a 'copied' text in the draft rectangle
                 # so that the user knows it's been copied to the clipboard.
                 Passer.active_story.draft_rectangle.temporary_text = "Copied sprite locations!"
+
+        # m key
+        elif key_pressed == pygame.K_m:
+            """
+            Copy a report of how much memory the current scene's sprite
+            images are using, to the clipboard.
+            """
+            memory_report = sd.get_memory_report()
+            
+            # Include the decoded sounds that are cached.
+            memory_report += "\n" + \
+                Passer.active_story.audio_player.sound_cache.get_report()
+            
+            scrap.put_text(memory_report)
+            
+            Passer.active_story.draft_rectangle.temporary_text = "Copied memory report!"
  
 
 if __name__ == "__main__":
@@ -0,0 +1,417 @@
+"""
+Copyright 2023-2026 Jobin Rezai
+
+This file is part of LVNAuth.
+
+LVNAuth is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LVNAuth is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import json
+from pathlib import Path
+from threading import Thread, Lock, Event, Condition
+from response_code import ServerResponseCode
+from typing import Callable, Dict, List, Tuple
+
+
+class RemoteSaveJournal:
+    """
+    Keeps <remote_save> key/values in a local journal file until the
+    server has received them.
+
+    Each <remote_save> gets appended to the journal file (one JSON object
+    per line) on the main thread, so the story can continue right away.
+    A worker thread sends everything that's in the journal to the server
+    as one request and removes it from the journal once the server has
+    saved it. If the server can't be reached, the worker thread tries
+    again later, waiting longer after each failed attempt. If the server
+    refuses the key/values, they're moved out of the journal into a
+    '.rejected' file next to it (so they don't hold up later saves) and
+    the refusal is reported with rejected_method.
+
+    The journal file is in the same folder as the visual novel, next to
+    the visual novel's config file, so saves that didn't reach the server
+    before the player was closed get sent the next time the visual novel
+    is played.
+    """
+
+    # The number of seconds to wait before trying again after the first
+    # failed attempt. This doubles after each failed attempt.
+    INITIAL_RETRY_SECONDS = 2
+
+    # The longest number of seconds to wait between attempts.
+    MAX_RETRY_SECONDS = 300
+
+    # Responses that mean the server might accept the data later.
+    RETRY_RESPONSES = (ServerResponseCode.CONNECTION_ERROR,
+                       ServerResponseCode.SSL_ERROR,
+                       ServerResponseCode.UNKNOWN)
+
+    def __init__(self,
+                 journal_file_path: Path,
+                 vn_name: str,
+                 send_method: Callable[[Dict], Tuple[ServerResponseCode,
+                                                     object]],
+                 rejected_method: Callable[[ServerResponseCode, object],
+                                           None] = None):
+        """
+        Arguments:
+
+        - journal_file_path: the full path to the journal file.
+
+        - vn_name: the visual novel name. All visual novels in the same
+        folder share the same journal file, so each entry records which
+        visual novel it's for, and only this visual novel's entries
+        get sent.
+
+        - send_method: the method that sends key/values to the server's
+        remote_save address. It's run on the journal's worker thread
+        and it needs to return the server's response code and response text.
+
+        - rejected_method: the method to run when the server refuses
+        key/values. It's run on the journal's worker thread with the
+        server's response code and response text.
+        """
+
+        self.journal_file_path = journal_file_path
+        self.vn_name = vn_name
+        self.send_method = send_method
+        self.rejected_method = rejected_method
+
+        # Used for making sure the journal file and self.entries don't get
+        # changed by the main thread and the worker thread at the same time.
+        self.lock = Lock()
+
+        # Used for waking up threads that are waiting for key/values
+        # to be sent (see wait_until_sent()).
+        self.sent_condition = Condition(self.lock)
+
+        # The number of attempts to send the journal that didn't succeed.
+        # A thread that is waiting for key/values to be sent stops waiting
+        # when this changes, so it doesn't wait for a server that can't
+        # be reached.
+        self.failed_attempts = 0
+
+        # Set when there is something new to send to the server.
+        self.wake_event = Event()
+
+        # The worker thread that sends the journal to the server.
+        # It's started the first time the journal needs to be sent.
+        self.worker: Thread
+        self.worker = None
+
+        # All the entries in the journal file (for all visual novels).
+        # Each entry is a dict with the keys: id, vn_name, vn_data
+        self.entries: List[Dict] = []
+
+        # The id to give to the next entry.
+        self.next_id = 1
+
+        self._load()
+
+    def _load(self):
+        """
+        Read the entries from the journal file, if it exists.
+
+        A line that can't be read (for example: if the player was closed
+        while it was being written) gets skipped.
+        """
+
+        if not self.journal_file_path.is_file():
+            return
+
+        with self.journal_file_path.open("r", encoding="utf-8") as f:
+
+            for line in f:
+
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    print(f"Skipping unreadable remote save journal line: {line}")
+                    continue
+
+                if not isinstance(entry, dict) \
+                   or not isinstance(entry.get("vn_data"), dict):
+                    continue
+
+                self.entries.append(entry)
+
+        if self.entries:
+            self.next_id = max(entry.get("id", 0) for entry in self.entries) + 1
+
+    def get_pending_count(self) -> int:
+        """
+        Return the number of this visual novel's entries that haven't
+        been received by the server yet.
+        """
+
+        with self.lock:
+            return len(self._get_pending_entries())
+
+    def has_pending_key(self, save_key: str) -> bool:
+        """
+        Return whether the given key has been saved with <remote_save>
+        but hasn't been received by the server yet.
+
+        Arguments:
+
+        - save_key: the key name (for example: "favcolor")
+        """
+
+        with self.lock:
+            return self._has_pending_key(save_key)
+
+    def _has_pending_key(self, save_key: str) -> bool:
+        """
+        Return whether the given key is in one of this visual novel's
+        entries. The caller needs to hold self.lock
+        """
+        return any(save_key in entry.get("vn_data")
+                   for entry in self._get_pending_entries())
+
+    def wait_until_sent(self, save_key: str):
+        """
+        Wait until the server has received the given key's journal entries,
+        so a <remote_get> that comes after a <remote_save> of the same key
+        gets the new value from the server.
+
+        Stop waiting if an attempt to send the journal doesn't succeed,
+        so we don't wait for a server that can't be reached.
+
+        This method is run from a web worker thread, never the main thread.
+
+        Arguments:
+
+        - save_key: the key name (for example: "favcolor")
+        """
+
+        with self.sent_condition:
+
+            if not self._has_pending_key(save_key):
+                return
+
+            failed_attempts = self.failed_attempts
+
+            # Send the journal now, in case the worker thread is
+            # waiting to try again later.
+            self.flush()
+
+            self.sent_condition.wait_for(
+                lambda: not self._has_pending_key(save_key)
+                or self.failed_attempts != failed_attempts)
+
+    def _get_pending_entries(self) -> List[Dict]:
+        """
+        Return this visual novel's entries.
+        The caller needs to hold self.lock
+        """
+        return [entry for entry in self.entries
+                if entry.get("vn_name") == self.vn_name]
+
+    def append(self, vn_data: Dict):
+        """
+        Add <remote_save> key/values to the end of the journal file
+        and wake up the worker thread so it sends them to the server.
+
+        This method is run from the main thread. The line is written to
+        the disk before this method returns, so the key/values won't be
+        lost if the player closes before the server receives them.
+
+        Arguments:
+
+        - vn_data: the key/values to save on the server.
+        Example: {"favcolor": "Blue", "favpet": "Cat"}
+        """
+
+        if not vn_data:
+            return
+
+        with self.lock:
+
+            entry = {"id": self.next_id,
+                     "vn_name": self.vn_name,
+                     "vn_data": vn_data}
+
+            self.next_id += 1
+
+            with self.journal_file_path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.entries.append(entry)
+
+        self.flush()
+
+    def flush(self):
+        """
+        Wake up the worker thread so it sends the journal to the server.
+        Start the worker thread if it hasn't been started yet.
+        """
+
+        if not self.worker:
+            self.worker = Thread(target=self._run, daemon=True)
+            self.worker.start()
+
+        self.wake_event.set()
+
+    def _run(self):
+        """
+        Send this visual novel's entries to the server, whenever there
+        are new entries or when it's time to try again.
+
+        This method is executed on a worker thread (secondary thread).
+        """
+
+        # The number of seconds to wait before trying again.
+        # None means there's nothing to try again, so wait for new entries.
+        retry_seconds = None
+
+        while True:
+
+            self.wake_event.wait(timeout=retry_seconds)
+            self.wake_event.clear()
+
+            with self.lock:
+                pending_entries = self._get_pending_entries()
+
+            if not pending_entries:
+                retry_seconds = None
+                continue
+
+            # Send all the pending key/values in one request.
+            # If the same key was saved more than once, the newest value
+            # is kept.
+            vn_data = {}
+            for entry in pending_entries:
+                vn_data |= entry.get("vn_data")
+
+            response_code, response_text = self.send_method(vn_data)
+
+            if response_code == ServerResponseCode.SUCCESS:
+
+                self._remove_entries(
+                    entry_ids={entry.get("id") for entry in pending_entries})
+
+                retry_seconds = None
+
+                # Were more entries added while we were sending?
+                # Send those too.
+                if self.get_pending_count():
+                    self.wake_event.set()
+
+            elif response_code in self.RETRY_RESPONSES:
+
+                # The server couldn't be reached. Keep the entries
+                # and try again later, waiting longer each time.
+                self._on_attempt_failed()
+
+                if retry_seconds is None:
+                    retry_seconds = self.INITIAL_RETRY_SECONDS
+                else:
+                    retry_seconds = min(retry_seconds * 2,
+                                        self.MAX_RETRY_SECONDS)
+
+            else:
+
+                # The server refused the data (for example: a license
+                # problem or an error in a remote script). Sending the same
+                # data again won't help, and it would get merged into every
+                # later save, so move it out of the journal.
+                self._reject_entries(entries=pending_entries)
+                retry_seconds = None
+
+                if self.rejected_method:
+                    self.rejected_method(response_code, response_text)
+
+                if self.get_pending_count():
+                    self.wake_event.set()
+
+    def _reject_entries(self, entries: List[Dict]):
+        """
+        Move entries that the server refused from the journal file to the
+        end of the rejected file, so they can still be looked at later.
+
+        Arguments:
+
+        - entries: the entries that the server refused.
+        """
+
+        rejected_path =\
+            self.journal_file_path.with_name(
+                self.journal_file_path.name + ".rejected")
+
+        with self.lock:
+            with rejected_path.open("a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._remove_entries(entry_ids={entry.get("id") for entry in entries})
+
+    def _on_attempt_failed(self):
+        """
+        Record that an attempt to send the journal didn't succeed and
+        let the threads that are waiting for key/values to be sent
+        stop waiting.
+        """
+
+        with self.sent_condition:
+            self.failed_attempts += 1
+            self.sent_condition.notify_all()
+
+    def _remove_entries(self, entry_ids: set):
+        """
+        Remove entries that the server has received and re-write the
+        journal file with the entries that are left.
+
+        The journal file is written to a temporary file first and then
+        replaces the journal file, so the journal file is never left
+        half-written.
+
+        Arguments:
+
+        - entry_ids: the ids of the entries to remove.
+        """
+
+        with self.lock:
+
+            self.entries = [entry for entry in self.entries
+                            if entry.get("id") not in entry_ids]
+
+            # The server has received these key/values, so threads that
+            # are waiting for them can continue.
+            self.sent_condition.notify_all()
+
+            if not self.entries:
+                # Nothing left to send, so the journal file is not needed.
+                self.journal_file_path.unlink(missing_ok=True)
+                return
+
+            temp_path =\
+                self.journal_file_path.with_name(
+                    self.journal_file_path.name + ".tmp")
+
+            with temp_path.open("w", encoding="utf-8") as f:
+                for entry in self.entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, self.journal_file_path)
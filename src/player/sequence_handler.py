@@ -16,14 +16,175 @@ GNU Lesser General Public License for more details.
 You should have received a copy of the GNU Lesser General Public License
 along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
 """
+import copy
+import math
+import pygame
 import sprite_definition as sd
 from animation_speed import AnimationSpeed
-from typing import List, Set, Tuple
+from typing import Dict, List, Set, Tuple
 from sprite_definition import Groups, SpriteGroup
 from shared_components import Passer
 from file_reader import ContentType
 
 
+class SequenceAtlas:
+    """
+    Packs the images of a sequence animation into one shared surface
+    (a texture atlas), once, when the sequence is created.
+    
+    Each frame is then a subsurface (a rect region) of the atlas, so
+    frames don't need their own full-size surfaces, and frames that have
+    identical pixels share the same region of the atlas.
+    
+    Purpose: during sequence playback, a frame change only needs to
+    point the visible sprite to a different region of the atlas.
+    """
+    
+    # Transparent gap between packed frames, so that smooth scaling
+    # doesn't bleed the edge pixels of neighbouring frames.
+    PADDING = 1
+    
+    def __init__(self, frame_surfaces: Dict[str, pygame.Surface]):
+        """
+        Arguments:
+        
+        - frame_surfaces: key: sprite name, value: the sprite's image
+        (without text or effects) to pack into the atlas.
+        """
+        
+        # The packed surface that holds all the frames.
+        self.surface: pygame.Surface
+        self.surface = None
+        
+        # Key: sprite name
+        # Value: pygame.Rect of where the frame is in the atlas.
+        self.frame_rects = {}
+        
+        # Key: sprite name
+        # Value: subsurface of the atlas for the frame.
+        self.frame_surfaces = {}
+        
+        # Key: (sprite name, flip horizontal, flip vertical)
+        # Value: a flipped copy of the frame.
+        # Only used if a sequence is played on a flipped sprite.
+        self.flipped_frames = {}
+        
+        self._pack(frame_surfaces=frame_surfaces)
+        
+    def _pack(self, frame_surfaces: Dict[str, pygame.Surface]):
+        """
+        Shelf-pack the given surfaces into one atlas surface.
+        
+        The distinct images are sorted by height (tallest first)
+        and placed left-to-right in rows (shelves). A new shelf is
+        started when the next image doesn't fit in the current shelf.
+        """
+        
+        # Key: (size, pixel bytes), Value: sprite names that
+        # have those exact pixels.
+        # Identical frames (a common thing in sequences, such as
+        # holding a pose for a few frames) only get packed once.
+        unique_images = {}
+        
+        for sprite_name, surface in frame_surfaces.items():
+            key = (surface.get_size(),
+                   pygame.image.tobytes(surface, "RGBA"))
+            
+            unique_images.setdefault(key, []).append(sprite_name)
+            
+        # Key: sprite name of the first frame with the image.
+        # Value: rect in the atlas
+        packed_rects = {}
+        
+        packing_order = sorted(unique_images.values(),
+                               key=lambda names:
+                               frame_surfaces[names[0]].get_height(),
+                               reverse=True)
+        
+        total_area = sum(frame_surfaces[names[0]].get_width()
+                         * frame_surfaces[names[0]].get_height()
+                         for names in packing_order)
+        
+        widest = max(frame_surfaces[names[0]].get_width()
+                     for names in packing_order)
+        
+        # Aim for a roughly square atlas, but it must be at least
+        # as wide as the widest frame.
+        atlas_width = max(widest, math.ceil(math.sqrt(total_area)))
+        
+        shelf_x = 0
+        shelf_y = 0
+        shelf_height = 0
+        
+        for names in packing_order:
+            width, height = frame_surfaces[names[0]].get_size()
+            
+            # Doesn't fit in the current shelf? Start a new shelf.
+            if shelf_x and shelf_x + width > atlas_width:
+                shelf_y += shelf_height + self.PADDING
+                shelf_x = 0
+                shelf_height = 0
+                
+            packed_rects[names[0]] = pygame.Rect(shelf_x, shelf_y,
+                                                 width, height)
+            
+            shelf_x += width + self.PADDING
+            shelf_height = max(shelf_height, height)
+            
+        atlas_height = max(1, shelf_y + shelf_height)
+        
+        self.surface = pygame.Surface((atlas_width, atlas_height),
+                                      flags=pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        
+        for names in packing_order:
+            rect = packed_rects[names[0]]
+            
+            # Blitting onto a fully transparent surface copies
+            # the pixels as-is (including the alpha values).
+            self.surface.blit(frame_surfaces[names[0]], rect)
+            
+            frame_surface = self.surface.subsurface(rect)
+            
+            for sprite_name in names:
+                self.frame_rects[sprite_name] = rect
+                self.frame_surfaces[sprite_name] = frame_surface
+                
+    def get_frame(self,
+                  sprite_name: str,
+                  flip_horizontal: bool = False,
+                  flip_vertical: bool = False) -> pygame.Surface | None:
+        """
+        Return the frame's surface from the atlas.
+        
+        Arguments:
+        
+        - sprite_name: the sprite name of the frame.
+        
+        - flip_horizontal, flip_vertical: whether the frame needs to be
+        flipped compared to how it was packed. Flipped frames are
+        created once and then cached.
+        """
+        frame_surface = self.frame_surfaces.get(sprite_name)
+        
+        if frame_surface is None:
+            return
+        
+        elif not flip_horizontal and not flip_vertical:
+            return frame_surface
+        
+        key = (sprite_name, flip_horizontal, flip_vertical)
+        
+        flipped_frame = self.flipped_frames.get(key)
+        if flipped_frame is None:
+            flipped_frame = pygame.transform.flip(frame_surface,
+                                                  flip_horizontal,
+                                                  flip_vertical)
+            self.flipped_frames[key] = flipped_frame
+            
+        return flipped_frame
+
+
 
 class SequenceHandler:
     def __init__(self):
@@ -68,6 +229,31 @@ class SequenceHandler:
         # This is optional.
         self.sprite_name_after_stop:str = None
         
+        # The frame images of the sequence, packed into one surface
+        # when the sequence is created.
+        self.atlas: SequenceAtlas
+        self.atlas = None
+        
+        # Key: sprite name
+        # Value: (flipped horizontally, flipped vertically)
+        # The flip state of each frame when it was packed into the atlas,
+        # so we know whether a frame needs flipping to match the sprite
+        # that's playing the sequence.
+        self.frame_flips = {}
+        
+        # The visible sprite that is showing the sequence's frames
+        # and the key it currently has in the sprite group's dictionary.
+        # Frames are changed on this sprite in-place.
+        self.player_sprite: sd.SpriteObject
+        self.player_sprite = None
+        self.player_key:str = None
+        
+        # Key: sprite name
+        # Value: the hidden frame sprite whose dictionary slot is
+        # currently being used by the player sprite. It gets its slot
+        # back when the player sprite moves on to the next frame.
+        self.displaced_sprites = {}
+        
     @property
     def sprite_type(self) -> ContentType:
         return self._sprite_type
@@ -153,8 +339,190 @@ class SequenceHandler:
             
             self.sprite_type = sprite_type
             
+            self._create_atlas(sprite_group=sprite_group)
+            
             return True
         
+    def _create_atlas(self, sprite_group: SpriteGroup):
+        """
+        Pack the sequence's frame images into one atlas surface
+        and point the hidden frame sprites to their region of the atlas.
+        
+        Purpose: this is done once, when the sequence is created, so that
+        changing frames during playback doesn't need to swap sprites.
+        """
+        
+        self.player_sprite = None
+        self.player_key = None
+        self.displaced_sprites.clear()
+        self.frame_flips.clear()
+        
+        frame_sprites = {image_name: sprite_group.sprites[image_name]
+                         for image_name in self.frame_image_names}
+        
+        self.atlas = SequenceAtlas(
+            frame_surfaces={image_name: sprite.original_image_before_text
+                            for image_name, sprite in frame_sprites.items()})
+        
+        sprite: sd.SpriteObject
+        for image_name, sprite in frame_sprites.items():
+            
+            self.frame_flips[image_name] = (sprite.flipped_horizontally,
+                                            sprite.flipped_vertically)
+            
+            # Only hidden sprites that have no text and no effects
+            # can give up their own surface for the atlas region, because
+            # their images are all the same surface.
+            if (sprite.visible
+                    or sprite.pending_show
+                    or sprite.image is not sprite.original_image_before_text
+                    or sprite.original_image is not sprite.original_image_before_text):
+                continue
+            
+            sprite.set_base_image(
+                base_image=self.atlas.get_frame(sprite_name=image_name))
+            
+    def _get_sprite_group(self) -> SpriteGroup | None:
+        """
+        Return the sprite group that the sequence's frames come from.
+        """
+        group_mapping = {ContentType.CHARACTER: Groups.character_group,
+                         ContentType.OBJECT: Groups.object_group,
+                         ContentType.DIALOGUE_SPRITE: Groups.dialog_group,}
+        
+        return group_mapping.get(self.sprite_type)
+    
+    def _can_change_frame_in_place(self,
+                                   sprite_group: SpriteGroup,
+                                   frame_sprite: sd.SpriteObject) -> bool:
+        """
+        Return whether the sprite that's showing the sequence can have
+        its frame changed in-place, using the atlas.
+        
+        If not, the frame has to be shown the regular way (by swapping
+        sprites with _sprite_show).
+        """
+        player = self.player_sprite
+        
+        if not player or not self.atlas:
+            return False
+        
+        # Has the player sprite been swapped out or hidden
+        # by something other than this sequence?
+        elif sprite_group.sprites.get(self.player_key) is not player:
+            return False
+        
+        elif not (player.visible or player.pending_show) or player.pending_hide:
+            return False
+        
+        elif player.general_alias != frame_sprite.general_alias:
+            return False
+        
+        elif frame_sprite.name not in self.atlas.frame_surfaces:
+            return False
+        
+        # Sprite text gets drawn on the sprite's image, so the
+        # regular swap is needed to re-draw the text on the new frame.
+        elif (player.has_font_handler()
+              and player.active_font_handler.letters_to_blit):
+            return False
+        
+        return True
+    
+    def _show_frame(self, image_name: str):
+        """
+        Show the given frame of the sequence.
+        
+        If possible, the visible sprite gets pointed to the frame's region
+        in the atlas (no sprite swap, no argument parsing, no copying).
+        Otherwise, the frame is shown using the regular sprite swap.
+        
+        Arguments:
+        
+        - image_name: the sprite name of the frame to show.
+        """
+        
+        sprite_group = self._get_sprite_group()
+        if not sprite_group:
+            return
+        
+        frame_sprite: sd.SpriteObject
+        frame_sprite = sprite_group.sprites.get(image_name)
+        if not frame_sprite:
+            return
+        
+        # Is the frame already being shown by the player sprite?
+        elif frame_sprite is self.player_sprite:
+            return
+        
+        # The frame sprite is already visible by itself.
+        # Same as _sprite_show, there is nothing to show, but it will
+        # show the next frames.
+        elif frame_sprite.visible and not frame_sprite.pending_hide:
+            self.displaced_sprites.clear()
+            self.player_sprite = frame_sprite
+            self.player_key = image_name
+            return
+        
+        if not self._can_change_frame_in_place(sprite_group=sprite_group,
+                                               frame_sprite=frame_sprite):
+            
+            # Show the frame by swapping sprites (the regular way).
+            # The slots of any displaced sprites stay as they are now,
+            # the same way a regular swap leaves the old sprite in its slot.
+            self.displaced_sprites.clear()
+            
+            main_reader =\
+                Passer.active_story.reader.get_main_story_reader()
+            
+            main_reader._sprite_show(arguments=image_name,
+                                     sprite_type=self.sprite_type)
+            
+            # The newly swapped-in sprite will show the next frames.
+            shown_sprite = sprite_group.sprites.get(image_name)
+            if shown_sprite and (shown_sprite.visible or shown_sprite.pending_show):
+                self.player_sprite = shown_sprite
+                self.player_key = image_name
+            else:
+                self.player_sprite = None
+                self.player_key = None
+                
+            return
+        
+        player = self.player_sprite
+        
+        # Give the slot that the player sprite is leaving back to the 
+        # sprite that used to be there. If the player sprite was the 
+        # original owner of the slot, leave a hidden copy of it there, 
+        # just like a regular swap leaves the old sprite behind.
+        previous_owner = self.displaced_sprites.pop(self.player_key, None)
+        if previous_owner is None:
+            previous_owner = copy.copy(player)
+            previous_owner.rect = player.rect.copy()
+            previous_owner.visible = False
+            previous_owner.pending_show = False
+            previous_owner.pending_hide = False
+            
+        sprite_group.sprites[self.player_key] = previous_owner
+        
+        # Take the frame sprite's slot (this keeps the frame's draw order,
+        # same as a regular swap).
+        self.displaced_sprites[image_name] = frame_sprite
+        sprite_group.sprites[image_name] = player
+        
+        player.name = image_name
+        self.player_key = image_name
+        
+        # Does the frame need to be flipped to match the player sprite?
+        packed_horizontal, packed_vertical = self.frame_flips.get(image_name,
+                                                                  (False, False))
+        
+        player.set_base_image(
+            base_image=self.atlas.get_frame(
+                sprite_name=image_name,
+                flip_horizontal=player.flipped_horizontally != packed_horizontal,
+                flip_vertical=player.flipped_vertically != packed_vertical))
+        
     def stop(self):
         """
         Set flag to stop the sequential animation.
@@ -314,13 +682,8 @@ class SequenceHandler:
                 new_image_name =\
                     self.frame_image_names[self.current_frame_index]
                 
-                # Show a character sprite by setting 
-                # its visibility flag to True.
-                main_reader =\
-                    Passer.active_story.reader.get_main_story_reader()
-                
-                main_reader._sprite_show(arguments=new_image_name,
-                                         sprite_type=self.sprite_type)            
+                # Show the frame, in-place if possible.
+                self._show_frame(image_name=new_image_name)
 
 
 class SequenceGroup:
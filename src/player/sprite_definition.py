@@ -23,6 +23,7 @@ import command_class as cc
 from shared_components import Passer, ManualUpdate, MouseActionsAndCoordinates
 from typing import Tuple
 from enum import Enum, auto
+from collections import OrderedDict
 from datetime import datetime
 from animation_speed import AnimationSpeed
 from tint_handler import TintHandler, TintStyle
@@ -133,6 +134,9 @@ class SpriteMouseStatus(Enum):
 
 class SpriteObject:
 
+    # The maximum number of bytes of tinted images to keep per sprite.
+    TINT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
     def __init__(self,
                  name: str,
                  image: pygame.Surface,
@@ -162,18 +166,26 @@ class SpriteObject:
         self.calculated_pos_moving_y:float
         self.calculated_pos_moving_y = 0
 
-        # We need a copy of the image before we apply any text to it, 
+        # We need the image before we apply any text to it, 
         # so that we don't blit the same text over and over again.
         # We're going to eventually copy this image to self.original_image
         # in the drawing loop. We will use the rect self.original_rect below.
-        self.original_image_before_text = image.copy()
+        
+        # Note: self.image, self.original_image and 
+        # self.original_image_before_text all start off as the *same* surface
+        # (no copies), so a loaded sprite only costs one surface in memory.
+        # These surfaces must be treated as read-only. Anything that needs
+        # to draw on an image (sprite text, tint, fade) must work on a copy,
+        # which is what get_original_image_with_text() and
+        # get_original_image_without_text() return (copy-on-write).
+        self.original_image_before_text = image
 
         # This will hold the original image, but may contain text.
         # The actual 100% original is in self.original_image_before_text
         # but this below is the second original which may or may not contain
         # text drawn on it. If there is no text drawn on it, then it will be
         # exactly the same as self.original_image_before_text
-        self.original_image = image.copy()
+        self.original_image = image
         self.original_rect = self.original_image.get_rect()
         
         # Initialize a recording of half the size of the sprite's 
@@ -219,6 +231,16 @@ class SpriteObject:
         
         self.tint_handler = TintHandler()
 
+        # Tinted images, so that a tint level that has been used before
+        # (for example: when a character is dimmed and un-dimmed again)
+        # doesn't need to be tinted again.
+        # Key: (TintStyle, tint value) tuple
+        # Value: (sprite image before the tint, sprite image with the tint)
+        # The tinted images are shared with self.image, so they must not
+        # be drawn on directly.
+        self.tint_cache = OrderedDict()
+        self.tint_cache_bytes = 0
+
         # If any object has this flag set, the story script will not
         # continue to be read until the flag below has been set to False (for *all* sprite objects).
         self.wait_for_movement = False
@@ -300,12 +322,47 @@ class SpriteObject:
         self.on_mouse_leave_run_script: cc.SpriteStopRunScriptWithArguments = None
         self.on_mouse_click_run_script: cc.SpriteStopRunScriptWithArguments = None
         
-        # Deals with showing/hiding sprite text
-        self.active_font_handler =\
-            font_handler.ActiveFontHandler(story=Passer.active_story,
-                                           sprite_object=self)        
+        # Used for pixel-accurate mouse hit testing, so that the transparent
+        # parts of a sprite (such as the corners of a rotated button)
+        # don't count as the mouse being over the sprite.
+        # The mask is created from self.image the first time it's needed
+        # and is only re-created when self.image has been replaced
+        # (scaled, rotated, flipped, etc.)
+        self.hit_mask: pygame.mask.Mask = None
+        
+        # The image surface that hit_mask was created from.
+        self.hit_mask_image: pygame.Surface = None
+        
+        # Deals with showing/hiding sprite text.
+        # Most sprites never show any text, so the font handler only gets
+        # created the first time it's needed (see the active_font_handler
+        # property).
+        self._active_font_handler: font_handler.ActiveFontHandler = None
 
         self.visible = False
+        
+    @property
+    def active_font_handler(self) -> "font_handler.ActiveFontHandler":
+        """
+        Return the sprite's font handler (used for sprite text),
+        creating it if this is the first time it's needed.
+        """
+        if self._active_font_handler is None:
+            self._active_font_handler =\
+                font_handler.ActiveFontHandler(story=Passer.active_story,
+                                               sprite_object=self)
+            
+        return self._active_font_handler
+    
+    def has_font_handler(self) -> bool:
+        """
+        Return whether a font handler has been created for this sprite
+        (in other words, whether sprite text has ever been used on it).
+        
+        Use this instead of checking the active_font_handler property,
+        because reading the property creates a font handler.
+        """
+        return self._active_font_handler is not None
 
     def _refresh_half_size_dimensions(self):
         """
@@ -352,7 +409,7 @@ class SpriteObject:
         """
 
         # This sprite has no text? return
-        if not self.active_font_handler:
+        if not self.has_font_handler():
             return
         elif not self.active_font_handler.letters_to_blit:
             return
@@ -365,7 +422,10 @@ class SpriteObject:
 
         # Get the original image that has no text blitted on it.
         # We might need to apply a scale/rotation/fade to it later.
-        self.original_image = self.get_original_image_without_text()
+        # The image is shared, not copied, because text is never drawn
+        # on it directly (it's drawn on a copy or a cached rendering).
+        self.reset_applied_effects()
+        self.original_image = self.original_image_before_text
 
         ## If self.image wasn't replaced by any of the scale/rotation/fade
         ## method calls here, then replace self.image with the original image now.
@@ -749,22 +809,27 @@ class SpriteObject:
             # Toggle vertical value
             self.flipped_vertically = not self.flipped_vertically
 
-        if all([horizontal, vertical]):
-            self.image = pygame.transform.flip(self.image, True, True)
-            self.original_image = pygame.transform.flip(self.original_image, True, True)
-            self.original_image_before_text = pygame.transform.flip(self.original_image_before_text, True, True)
-        elif horizontal:
-            self.image = pygame.transform.flip(self.image, True, False)
-            self.original_image = pygame.transform.flip(self.original_image, True, False)
-            self.original_image_before_text = pygame.transform.flip(self.original_image_before_text, True, False)
-        elif vertical:
-            self.image = pygame.transform.flip(self.image, False, True)
-            self.original_image = pygame.transform.flip(self.original_image, False, True)
-            self.original_image_before_text = pygame.transform.flip(self.original_image_before_text, False, True)
-        else:
+        if not any([horizontal, vertical]):
             # No flips have occurred, so there is no need to request a screen-update.
             return
         
+        # The three images may be the same surface (they're only copied
+        # when text or an effect is applied), so flip each distinct surface
+        # once and keep them shared.
+        # Key: id of the surface before flipping, Value: flipped surface
+        flipped_surfaces = {}
+        
+        def flip_shared(surface: pygame.Surface) -> pygame.Surface:
+            if id(surface) not in flipped_surfaces:
+                flipped_surfaces[id(surface)] =\
+                    pygame.transform.flip(surface, horizontal, vertical)
+            return flipped_surfaces[id(surface)]
+        
+        self.image = flip_shared(self.image)
+        self.original_image = flip_shared(self.original_image)
+        self.original_image_before_text =\
+            flip_shared(self.original_image_before_text)
+        
         # Update a recording of half the size of the sprite's 
         # width/height, for use when setting centerx and centery during 
         # a movement animation.        
@@ -941,7 +1006,10 @@ class SpriteObject:
         # Note: it's important to do the fading animation last because otherwise
         # the faded image will get overwritten with the original image in the other animations.
         self._animate_movement()
-        self.active_font_handler.draw()
+        
+        # Only sprites that have had sprite text will have a font handler.
+        if self.has_font_handler():
+            self.active_font_handler.draw()
         self._animate_scaling()
         self._animate_rotation()
         self.tint_handler.animate_tint()
@@ -949,21 +1017,75 @@ class SpriteObject:
         
         self._apply_still_effects()
         
+        # Note: mouse events are checked by the sprite's group
+        # (SpriteGroup.update()), after all the sprites have been updated.
         
-        self._handle_mouse_events()
+    def has_mouse_scripts(self) -> bool:
+        """
+        Return whether a reusable script has been set to run for at least
+        one of the mouse events (enter, leave, click) on this sprite.
         
-    def _handle_mouse_events(self):
+        Purpose: sprites with no mouse scripts don't need to be hit tested.
+        """
+        return any((self.on_mouse_enter_run_script,
+                    self.on_mouse_leave_run_script,
+                    self.on_mouse_click_run_script))
+        
+    def get_hit_mask(self) -> pygame.mask.Mask:
+        """
+        Return a mask of the opaque pixels of the displayed image.
+        
+        The mask is cached and is only re-created when self.image has been
+        replaced with a different surface, which happens whenever the sprite
+        is scaled, rotated, flipped, tinted, etc.
+        """
+        if self.hit_mask_image is not self.image:
+            
+            # The default threshold (127) means a pixel has to be at least
+            # half opaque to count as part of the sprite.
+            self.hit_mask = pygame.mask.from_surface(self.image)
+            self.hit_mask_image = self.image
+            
+        return self.hit_mask
+    
+    def is_point_on_sprite(self, point: Tuple[int, int]) -> bool:
+        """
+        Return whether the given screen point is on an opaque pixel
+        of this sprite.
+        
+        Arguments:
+        
+        - point: the x, y position to check, such as the mouse position.
+        """
+        
+        # Do the cheap rect check first.
+        if not self.rect.collidepoint(point):
+            return False
+        
+        # Convert the point so that it's relative to the sprite's image.
+        x = point[0] - self.rect.x
+        y = point[1] - self.rect.y
+        
+        return bool(self.get_hit_mask().get_at((x, y)))
+        
+    def handle_mouse_events(self, mouse_over_sprite: bool):
         """
         Check the following mouse events and if any of the events are
         occurring, check if the current sprite should run a reusable script
         for a specific mouse event.
         
         The events are: on_mouse_enter, on_mouse_leave, on_mouse_click
+        
+        Arguments:
+        
+        - mouse_over_sprite: whether the mouse pointer is on an opaque
+        pixel of this sprite. The sprite's group works this out using
+        its hit grid (MouseHitGrid) and is_point_on_sprite().
         """
         
         # Is the mouse pointer inside the current sprite?
         if MouseActionsAndCoordinates.MOUSE_POS:
-            if self.rect.collidepoint(MouseActionsAndCoordinates.MOUSE_POS):
+            if mouse_over_sprite:
                 # The mouse pointer is inside the current sprite.
                 
                 
@@ -1810,10 +1932,25 @@ class SpriteObject:
 
         replaced_image = False
 
-
         # Should we consider copying the original image to self.image?
         # The caller of this method may have already done this, which is
         # why we check here.
+        if not skip_copy_original_image \
+           and not self.is_dirty_with_rotate_or_scale():
+
+            # The tint is applied to the original image (with sprite text, 
+            # if any), so we can re-use a previously tinted image, if we
+            # have one for this tint value.
+            self.image = self._get_tinted_original_image(tint_values)
+
+            # Record the tint value that is now applied to the sprite
+            # so that we can check in the next frame if we need to reapply
+            # the tint effect again or not.
+            self.tint_handler.applied_tint_value = tint_values[0]
+
+            # So the caller knows the displayed image was altered.
+            return True
+
         if not skip_copy_original_image:
 
             # Yes, we should consider copying the original image to self.image
@@ -1827,33 +1964,18 @@ class SpriteObject:
             sprite text (if any), and that same method will also rotate/scale 
             right after it's done getting the original image.
             """
-            
-            
-            # Is the image touched with a scale or rotate effect?
-            # (regardless if there's a gradual animation or not)
-            if self.is_dirty_with_rotate_or_scale():
-                
-                # The scale or rotate effect is eligible to this sprite.
-                # So get the original image (with sprite text, if any)
-                # and reapply the scale and/or rotation effect, before
-                # we tint the image a few lines later.
-                self._scale_or_rotate_sprite()
-            else:
-                
-                # No scale or rotation necessary, just get the original image
-                # with sprite text (if any), before we apply a tint effect.
-                self.image = self.get_original_image_with_text()
-                
+
+            # The scale or rotate effect is eligible to this sprite.
+            # So get the original image (with sprite text, if any)
+            # and reapply the scale and/or rotation effect, before
+            # we tint the image a few lines later.
+            self._scale_or_rotate_sprite()
 
             # So the caller knows the displayed image was altered.
             replaced_image = True
             
         # Apply the tint values to the displayed sprite.
-        # We use RGB here, instead of RGBA, to keep the alpha channel as-is.
-        if self.tint_handler.tint_style == TintStyle.REGULAR:
-            self.image.fill(tint_values, special_flags=pygame.BLEND_RGB_MULT)
-        else:
-            self.image.fill(tint_values, special_flags=pygame.BLEND_RGB_ADD)
+        self._apply_tint(image=self.image, tint_values=tint_values)
         
         # Record the tint value that is now applied to the sprite
         # so that we can check in the next frame if we need to reapply the
@@ -1862,6 +1984,90 @@ class SpriteObject:
 
         return replaced_image
 
+    def _apply_tint(self, image: pygame.Surface, tint_values: Tuple):
+        """
+        Tint the given image in-place with the sprite's tint style.
+        
+        Arguments:
+        
+        - image: the surface to tint.
+        
+        - tint_values: a tuple with the RGB tint values.
+        """
+        
+        # We use RGB here, instead of RGBA, to keep the alpha channel as-is.
+        if self.tint_handler.tint_style == TintStyle.REGULAR:
+            image.fill(tint_values, special_flags=pygame.BLEND_RGB_MULT)
+        else:
+            image.fill(tint_values, special_flags=pygame.BLEND_RGB_ADD)
+
+    def _get_tinted_original_image(self, tint_values: Tuple) -> pygame.Surface:
+        """
+        Return the original image (with sprite text, if any) with the
+        given tint applied to it.
+        
+        The tinted image is taken from the sprite's tint cache if it was
+        tinted before with the same tint style and value; otherwise, the
+        original image is tinted and added to the cache.
+        
+        The returned surface is shared with the cache, so any effects
+        that get applied to it after this (fade) must not draw on it.
+        
+        Arguments:
+        
+        - tint_values: a tuple with the RGB tint values.
+        """
+        
+        # The image is changing, so any effects need to be re-applied.
+        self.reset_applied_effects()
+        
+        base_image = self.original_image
+        
+        cache_key = (self.tint_handler.tint_style, tint_values[0])
+        
+        cached_tint = self.tint_cache.get(cache_key)
+        
+        # Only use the cached image if it was tinted from the sprite's
+        # current image (the sprite text could have changed or the sprite
+        # could have been flipped).
+        if cached_tint and cached_tint[0] is base_image:
+            self.tint_cache.move_to_end(cache_key)
+            tinted_image = cached_tint[1]
+            
+            # A fade might have been applied to this image the last time
+            # it was used. The fade (if any) will get re-applied after this.
+            tinted_image.set_alpha(None)
+            
+            return tinted_image
+        
+        tinted_image = base_image.copy()
+        self._apply_tint(image=tinted_image, tint_values=tint_values)
+        
+        # Replace any older tinted image with the same key.
+        if cached_tint:
+            self.tint_cache_bytes -= self._get_surface_size(cached_tint[1])
+        
+        self.tint_cache[cache_key] = (base_image, tinted_image)
+        self.tint_cache.move_to_end(cache_key)
+        self.tint_cache_bytes += self._get_surface_size(tinted_image)
+        
+        # Remove the least recently used tinted images, but always
+        # keep the one we just added.
+        while self.tint_cache_bytes > self.TINT_CACHE_MAX_BYTES \
+              and len(self.tint_cache) > 1:
+            removed_key, removed_tint = self.tint_cache.popitem(last=False)
+            self.tint_cache_bytes -= self._get_surface_size(removed_tint[1])
+        
+        return tinted_image
+
+    @staticmethod
+    def _get_surface_size(surface: pygame.Surface) -> int:
+        """
+        Return the approximate number of bytes the given surface's
+        pixels use.
+        """
+        return surface.get_pitch() * surface.get_height()
+
     def _fade_sprite(self, skip_copy_original_image: bool = False):
         """
         Fade the sprite to the current fade value.
@@ -1999,8 +2205,10 @@ class SpriteObject:
         # dirty with a scale.
         # Or has a rotate value that is greater than 0? Consider it
         # dirty with a rotate.
-        if (self.scale_current_value and self.scale_current_value != 1) \
-           or (self.rotate_current_value and self.rotate_current_value > 0):
+        if (self.scale_current_value
+            and self.scale_current_value.scale_current_value != 1) \
+           or (self.rotate_current_value
+               and self.rotate_current_value.rotate_current_value != 0):
                 return True
             
         else:
@@ -2081,6 +2289,39 @@ class SpriteObject:
         self.applied_scale_value = None
         self.tint_handler.applied_tint_value = None
 
+    def set_base_image(self, base_image: pygame.Surface):
+        """
+        Replace the sprite's image (the version without text or effects)
+        with the given surface, keeping the sprite's current center position.
+
+        Purpose: used by sequence animations to change the frame of a
+        visible sprite in-place, by pointing the sprite to a different
+        region of the sequence's atlas surface, instead of swapping the
+        whole sprite out with another sprite.
+
+        The given surface is shared, not copied, so it must be treated as
+        read-only (effects and text are drawn on copies of it).
+
+        Arguments:
+
+        - base_image: the surface to use as the sprite's new image.
+        """
+        current_center = self.rect.center
+
+        self.original_image_before_text = base_image
+        self.original_image = base_image
+        self.image = base_image
+
+        self.original_rect = base_image.get_rect()
+        self.rect = base_image.get_rect(center=current_center)
+
+        self._refresh_half_size_dimensions()
+
+        # The new image doesn't have any effects applied to it yet,
+        # so any scale/rotate/tint/fade will get re-applied
+        # in the next update.
+        self.reset_applied_effects()
+
     def _animate_movement(self):
         """
         Move the sprite (if required) based on the sprite's movement speed.
@@ -2306,12 +2547,83 @@ class SpriteObject:
                 int(self.calculated_pos_moving_y + self.half_height)
 
 
+class MouseHitGrid:
+    """
+    A uniform grid of sprite rects, used for quickly finding which sprites
+    could be under the mouse pointer.
+    
+    Each cell of the grid holds the sprites whose rects overlap that cell,
+    so finding the sprites under the mouse pointer is one dictionary lookup
+    instead of checking the rect of every sprite.
+    """
+    
+    # The width/height (in pixels) of each cell in the grid.
+    CELL_SIZE = 128
+    
+    def __init__(self):
+        
+        # Key: (column, row) tuple
+        # Value: list of SpriteObject
+        self.cells = {}
+        
+        # What the grid was last built from, so the group knows when
+        # the grid needs to be rebuilt.
+        self.signature = None
+        
+    def rebuild(self, sprites, signature: Tuple):
+        """
+        Place the given sprites into the cells that their rects overlap.
+        
+        Arguments:
+        
+        - sprites: the sprites to add to the grid.
+        
+        - signature: what the grid is being built from. The group compares
+        this with the next frame's signature to know if the grid needs to be
+        rebuilt.
+        """
+        self.cells.clear()
+        self.signature = signature
+        
+        sprite: SpriteObject
+        for sprite in sprites:
+            
+            # The range of cells that the sprite's rect overlaps.
+            first_column = sprite.rect.left // MouseHitGrid.CELL_SIZE
+            last_column = (sprite.rect.right - 1) // MouseHitGrid.CELL_SIZE
+            first_row = sprite.rect.top // MouseHitGrid.CELL_SIZE
+            last_row = (sprite.rect.bottom - 1) // MouseHitGrid.CELL_SIZE
+            
+            for column in range(first_column, last_column + 1):
+                for row in range(first_row, last_row + 1):
+                    self.cells.setdefault((column, row), []).append(sprite)
+                    
+    def get_candidates(self, point: Tuple[int, int]) -> set:
+        """
+        Return the sprites whose rects overlap the cell that the given
+        point is in. The point still needs to be checked against each
+        sprite's rect/mask; this just narrows down which sprites to check.
+        """
+        cell = (point[0] // MouseHitGrid.CELL_SIZE,
+                point[1] // MouseHitGrid.CELL_SIZE)
+        
+        return set(self.cells.get(cell, ()))
+
+
 class SpriteGroup:
 
     def __init__(self):
         # Key: sprite name (str)
         # Value: sprite object (SpriteObject)
         self.sprites = {}
+        
+        # Used for finding the sprites under the mouse pointer.
+        self.mouse_grid = MouseHitGrid()
+        
+        # The mouse position that was last checked for mouse events.
+        # If the mouse hasn't moved (and nothing else has changed),
+        # there's no need to check the sprites again.
+        self.last_mouse_pos = None
 
     def add(self, name: str, sprite: SpriteObject):
         if name not in self.sprites:
@@ -2358,6 +2670,54 @@ class SpriteGroup:
             # Get a regular animation update rect
             # This will be one rect for multiple animations (fade,scale, etc.)
             sprite.update()
+            
+        # Now that the sprites have moved/changed, check for mouse events.
+        self._handle_mouse_events()
+            
+    def _handle_mouse_events(self):
+        """
+        Work out which sprites the mouse pointer is over and let each
+        sprite that has mouse scripts run its enter/leave/click scripts.
+        
+        Only visible sprites that have at least one mouse script are
+        checked. Nothing is checked if the mouse hasn't moved or clicked
+        and none of those sprites have moved or changed their image.
+        """
+        
+        # Only sprites with a mouse script can react to the mouse.
+        sprite: SpriteObject
+        interactive_sprites = [sprite for sprite in self.sprites.values()
+                               if sprite.visible and sprite.has_mouse_scripts()]
+        
+        # Rebuild the hit grid if any of the interactive sprites
+        # have moved, changed their image, or been shown/hidden.
+        signature = tuple((sprite, tuple(sprite.rect), sprite.image)
+                          for sprite in interactive_sprites)
+        
+        grid_changed = signature != self.mouse_grid.signature
+        if grid_changed:
+            self.mouse_grid.rebuild(sprites=interactive_sprites,
+                                    signature=signature)
+            
+        mouse_pos = MouseActionsAndCoordinates.MOUSE_POS
+        
+        # Nothing has changed since the last check? Then the mouse status
+        # of each sprite is still correct, so there's nothing to do.
+        if not grid_changed \
+           and mouse_pos == self.last_mouse_pos \
+           and not MouseActionsAndCoordinates.MOUSE_UP:
+            return
+        
+        self.last_mouse_pos = mouse_pos
+        
+        # The sprites whose rects could be under the mouse pointer.
+        candidates = self.mouse_grid.get_candidates(mouse_pos)
+        
+        for sprite in interactive_sprites:
+            mouse_over_sprite = sprite in candidates \
+                and sprite.is_point_on_sprite(mouse_pos)
+            
+            sprite.handle_mouse_events(mouse_over_sprite=mouse_over_sprite)
 
     def draw(self, surface: pygame.Surface):
 
@@ -2366,6 +2726,24 @@ class SpriteGroup:
             if sprite.visible:
                 surface.blit(sprite.image, sprite.rect)
 
+    def get_draw_signature(self) -> Tuple:
+        """
+        Return a tuple that describes what draw() will draw: the image,
+        rect and opacity of each visible sprite in this group.
+        
+        Purpose: if the signature is the same as last frame, the sprites
+        in this group look exactly the same as last frame, so the camera
+        doesn't need to rescale the screen.
+        
+        The image surfaces themselves are part of the signature (not their
+        ids), because sprite effects replace self.image with a new surface
+        instead of changing it in place (except for set_alpha(), which is
+        why the alpha is included).
+        """
+        
+        return tuple((sprite.image, tuple(sprite.rect), sprite.image.get_alpha())
+                     for sprite in self.sprites.values() if sprite.visible)
+
 
 class Character(SpriteObject):
     def __init__(self, name, image, general_alias):
@@ -2410,3 +2788,80 @@ class Groups:
     background_group = SpriteGroup()
     object_group = SpriteGroup()
     dialog_group = SpriteGroup()
+
+
+def get_surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Return roughly how many bytes of pixel data the given surface uses.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+def get_memory_report() -> str:
+    """
+    Return a text report of how much memory the loaded sprites in the
+    current scene use for their images.
+    
+    For each sprite group, it shows the number of loaded sprites,
+    the memory used by their images (shared surfaces are only counted once)
+    and how much memory the same sprites would use if each sprite kept
+    three separate copies of its image (the way sprites used to be loaded).
+    
+    Purpose: used in draft-mode (the 'm' key) to see how much memory
+    a scene's sprites are using.
+    """
+    
+    report_lines = []
+    
+    total_used = 0
+    total_unshared = 0
+    
+    for group_name, sprite_group in (("Backgrounds", Groups.background_group),
+                                     ("Characters", Groups.character_group),
+                                     ("Objects", Groups.object_group),
+                                     ("Dialogue sprites", Groups.dialog_group)):
+        
+        # Key: id of the surface, Value: bytes.
+        # A dictionary so that surfaces shared between sprites (or between
+        # the images of the same sprite) are only counted once.
+        unique_surfaces = {}
+        
+        # The number of bytes if each sprite had 3 separate image copies.
+        unshared_bytes = 0
+        
+        font_handlers = 0
+        
+        sprite: SpriteObject
+        for sprite in sprite_group.sprites.values():
+            
+            for surface in (sprite.image,
+                            sprite.original_image,
+                            sprite.original_image_before_text):
+                
+                unshared_bytes += get_surface_bytes(surface)
+                
+                # Frames of a sequence animation are regions of
+                # an atlas surface, so count the atlas itself (once).
+                surface = surface.get_abs_parent()
+                
+                unique_surfaces[id(surface)] = get_surface_bytes(surface)
+                
+            if sprite.has_font_handler():
+                font_handlers += 1
+                
+        used_bytes = sum(unique_surfaces.values())
+        
+        total_used += used_bytes
+        total_unshared += unshared_bytes
+        
+        report_lines.append(f"{group_name}: {len(sprite_group.sprites)} loaded, "
+                            f"{used_bytes / 1048576:.1f} MB used "
+                            f"(unshared: {unshared_bytes / 1048576:.1f} MB), "
+                            f"{font_handlers} with sprite text")
+        
+    saved_bytes = total_unshared - total_used
+    
+    report_lines.append(f"Total: {total_used / 1048576:.1f} MB used, "
+                        f"{saved_bytes / 1048576:.1f} MB saved by sharing images")
+    
+    return "\n".join(report_lines)
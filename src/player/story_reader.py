@@ -953,6 +953,9 @@ class StoryReader:
         elif command_name in ("remote_save", "remote_get", "remote_call"):
             self._remote(command_name=command_name, arguments=arguments)
 
+        elif command_name == "remote_get_cache":
+            self._remote_get_cache(arguments=arguments)
+
         elif command_name in ("case", "or_case"):
             self._condition_read(command_name=command_name, arguments=arguments)
 
@@ -980,6 +983,18 @@ class StoryReader:
                 arguments=arguments, audio_channel=audio_player.AudioChannel.MUSIC
             )
 
+        elif command_name == "load_audio":
+            self._load_audio(arguments=arguments)
+
+        elif command_name == "load_music":
+            self._load_music(arguments=arguments)
+
+        elif command_name == "queue_music":
+            self._queue_music(arguments=arguments)
+
+        elif command_name == "music_crossfade":
+            self._music_crossfade(arguments=arguments)
+
         elif command_name == "sprite_text":
             self._sprite_text(arguments=arguments)
 
@@ -1277,6 +1292,14 @@ class StoryReader:
             This is used when transitioning between scenes.
             """
             self._scene_with_fade(arguments=arguments)
+
+        elif command_name == "scene_with_dissolve":
+            """
+            Take a snapshot of the current screen, play a specific scene
+            and gradually fade out the snapshot so the current scene
+            cross-dissolves into the new scene.
+            """
+            self._scene_with_dissolve(arguments=arguments)
             
         elif command_name == "camera_start_moving":
             """
@@ -1314,6 +1337,20 @@ class StoryReader:
             # Zoom to the original size instantly.
             self._camera_start_moving(arguments="0, 0, 1, 0, constant speed")
 
+        elif command_name == "camera_quality_fast_while_moving":
+            """
+            Use a faster, but blockier, scale while the camera is
+            zooming/panning. The final frame will still be smooth.
+            """
+            self.story.camera.fast_scale_while_moving = True
+
+        elif command_name == "camera_quality_smooth_always":
+            """
+            Always use a smooth scale when the camera is zoomed in or out.
+            This is the default.
+            """
+            self.story.camera.fast_scale_while_moving = False
+
         elif command_name == "variable_set":
             """
             Create a new variable or update an existing variable.
@@ -4958,6 +4995,31 @@ class StoryReader:
             data=data, purpose=purpose, callback_method=on_server_callback_method
         )
 
+    def _remote_get_cache(self, arguments: str):
+        """
+        Set how many seconds a <remote_get> response can be used again
+        without asking the server. 0 means don't cache <remote_get>
+        responses (the default).
+
+        <remote_get_cache: seconds>
+        """
+
+        remote_get_cache: cc.RemoteGetCache
+        remote_get_cache = self._get_arguments(
+            class_namedtuple=cc.RemoteGetCache, given_arguments=arguments
+        )
+
+        if not remote_get_cache:
+            return
+
+        # Make sure the number of seconds is a float.
+        try:
+            seconds = float(remote_get_cache.number_of_seconds)
+        except ValueError:
+            return
+
+        Passer.web_handler.remote_get_cache_seconds = max(seconds, 0)
+
     def on_web_request_finished(self, 
                                 receipt: ServerResponseReceipt, 
                                 put_into_variable: str = None):
@@ -5104,6 +5166,90 @@ class StoryReader:
                        audio_channel=audio_channel,
                        loop_music=loop_music)
 
+    def _load_audio(self, arguments: str):
+        """
+        Decode a sound ahead of time and keep it in the audio player's
+        sound cache, so it plays without a delay the first time.
+
+        <load_audio: name>
+        """
+
+        load_audio: cc.PlayAudio
+        load_audio = self._get_arguments(
+            class_namedtuple=cc.PlayAudio, given_arguments=arguments
+        )
+
+        if not load_audio:
+            return
+
+        # Use the main story reader's audio player, which is the one
+        # that plays the sounds.
+        self.get_main_story_reader().story.audio_player.\
+            preload_audio(audio_name=load_audio.audio_name)
+
+    def _load_music(self, arguments: str):
+        """
+        Decode a music track in the background, so that it's ready
+        to cross-fade in (see <music_crossfade>).
+
+        <load_music: name>
+        """
+
+        load_music: cc.PlayAudio
+        load_music = self._get_arguments(
+            class_namedtuple=cc.PlayAudio, given_arguments=arguments
+        )
+
+        if not load_music:
+            return
+
+        self.get_main_story_reader().story.audio_player.\
+            prepare_music(audio_name=load_music.audio_name)
+
+    def _queue_music(self, arguments: str):
+        """
+        Play a music track right after the current track ends,
+        with no gap between them.
+
+        <queue_music: name>
+        """
+
+        queue_music: cc.PlayAudio
+        queue_music = self._get_arguments(
+            class_namedtuple=cc.PlayAudio, given_arguments=arguments
+        )
+
+        if not queue_music:
+            return
+
+        self.get_main_story_reader().story.audio_player.\
+            queue_music(audio_name=queue_music.audio_name)
+
+    def _music_crossfade(self, arguments: str):
+        """
+        Set how many seconds <play_music> should cross-fade for,
+        when it changes tracks. 0 turns off cross-fading.
+
+        <music_crossfade: seconds>
+        """
+
+        music_crossfade: cc.MusicCrossfade
+        music_crossfade = self._get_arguments(
+            class_namedtuple=cc.MusicCrossfade, given_arguments=arguments
+        )
+
+        if not music_crossfade:
+            return
+
+        # Make sure the number of seconds is a float.
+        try:
+            seconds = float(music_crossfade.number_of_seconds)
+        except ValueError:
+            return
+
+        self.get_main_story_reader().story.audio_player.\
+            set_music_crossfade(seconds=seconds)
+
     def _halt_auto(self, arguments: str):
         """
         Use a timed <halt> command which is like a normal <halt> command
@@ -5574,6 +5720,45 @@ class StoryReader:
             fade_direction=direction,
         )
 
+    def _scene_with_dissolve(self, arguments: str):
+        """
+        Cross-dissolve the current scene into a specific scene.
+        
+        A snapshot of the current screen is taken once, then the new scene
+        is played underneath the snapshot and the snapshot gradually
+        fades out.
+        """
+        scene_with_dissolve: cc.SceneWithDissolve
+        scene_with_dissolve = self._get_arguments(
+            class_namedtuple=cc.SceneWithDissolve, given_arguments=arguments
+        )
+
+        if not scene_with_dissolve:
+            return
+
+        # Get the story reader that's not a reusable script reader,
+        # because everything in this method involves the main reader only.
+        main_reader = self.get_main_story_reader()
+
+        incremental_dissolve_speed =\
+            self._sprite_fade_speed_get_value_from_percent(
+            percent=scene_with_dissolve.dissolve_speed,
+            fade_direction="fade out")
+
+        # None and zero are not proper values and will result to an exception.
+        if not incremental_dissolve_speed:
+            return
+
+        # So the main reader does not continue reading while
+        # the screen is dissolving. (a new scene will be shown soon).
+        main_reader.story_finished = True
+
+        main_reader.story.cover_screen_handler.start_dissolving_screen(
+            dissolve_speed_incremental=incremental_dissolve_speed,
+            chapter_name=scene_with_dissolve.chapter_name,
+            scene_name=scene_with_dissolve.scene_name,
+        )
+
     def _sprite_hide(self, arguments: str, sprite_type: file_reader.ContentType):
         """
         Hide a sprite (any sprite, such as character, name)
@@ -5768,7 +5953,7 @@ class StoryReader:
             # rather than the newly swapped-in sprite, and then text
             # won't display on the new sprite.
             if (
-                copied_visible_sprite.active_font_handler
+                copied_visible_sprite.has_font_handler()
                 and copied_visible_sprite.active_font_handler.sprite_object
             ):
 
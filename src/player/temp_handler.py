@@ -18,7 +18,9 @@ along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import os
+import shutil
 import tempfile
+from io import RawIOBase
 from pathlib import Path
 from enum import Enum
 
@@ -80,3 +82,85 @@ class TempHandler:
         """
 
         return Path(tempfile.gettempdir())
+
+
+class MusicFile:
+    """
+    A copy of a music track that SDL can open by its path.
+    
+    pygame can also stream music from a Python file-like object, but then
+    SDL's audio thread calls back into Python (and needs the GIL) each time
+    it reads the next part of the track. If the main thread is in a long
+    call that holds the GIL (for example: scaling a full-screen surface),
+    the audio thread has to wait and the music drops out. When SDL opens
+    the track by its path, it reads the track without Python.
+    
+    On Linux, the copy is an anonymous file in memory (memfd), so nothing
+    is written to the disk. Elsewhere, the copy is a temporary file.
+    
+    A music file is made once per track and re-used each time the track
+    is played, until it's closed.
+    """
+    
+    def __init__(self, music_stream: RawIOBase, file_extension: str):
+        """
+        Arguments:
+        
+        - music_stream: a file-like object that reads the music data.
+        
+        - file_extension: such as ".ogg". pygame needs the extension as
+        a hint to know the type of audio it is.
+        """
+        self.file_extension = file_extension
+        
+        # The memfd file descriptor (Linux only).
+        self.fd = None
+        
+        # The full path that SDL can open the music file with.
+        self.path = self._create(music_stream)
+        
+        # The size of the music file, in bytes.
+        self.size = os.path.getsize(self.path)
+        
+    def _create(self, music_stream: RawIOBase) -> str:
+        """
+        Copy the music into a file and return the file's path.
+        """
+        music_stream.seek(0)
+        
+        if hasattr(os, "memfd_create") and Path("/proc/self/fd").is_dir():
+            
+            self.fd = os.memfd_create("lvnauth_music")
+            
+            with open(self.fd, "wb", closefd=False) as f:
+                shutil.copyfileobj(music_stream, f)
+                
+            # SDL can open the memory file through /proc, like a regular file.
+            return f"/proc/self/fd/{self.fd}"
+        
+        with tempfile.NamedTemporaryFile(
+            delete=False,
+            prefix=f"lvnauth_tmp_{TempContentType.MUSIC_FILE.value}_",
+            dir=TempHandler.get_temp_dir()) as f:
+            
+            shutil.copyfileobj(music_stream, f)
+            
+        return f.name
+    
+    def close(self):
+        """
+        Remove the music file. If SDL is still playing the track, it keeps
+        its own handle to it, so the music doesn't stop.
+        
+        On Windows, a temporary file that is still playing can't be deleted,
+        so it's left for TempHandler.cleanup_temp_files() to delete later.
+        """
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+            
+        else:
+            try:
+                Path(self.path).unlink(missing_ok=True)
+            except OSError:
+                pass
@@ -0,0 +1,218 @@
+"""
+Copyright 2023-2026 Jobin Rezai
+
+This file is part of LVNAuth.
+
+LVNAuth is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LVNAuth is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Tests for playing music from the story's data while the main thread
+is busy, using SDL's dummy audio driver.
+
+Run from the src/player folder:
+python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import io
+import time
+import wave
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+from file_reader import BytesRangeReader
+from audio_player import AudioPlayer, AudioChannel
+from shared_components import Passer
+
+
+# The mixer settings pygame uses by default.
+FREQUENCY = 44100
+
+# How much later than its length a track can end and still count as
+# having played without dropping out.
+END_TOLERANCE_SECONDS = 0.3
+
+
+def create_track(seconds: float) -> BytesRangeReader:
+    """
+    Return a reader over a .wav track of the given length, the same kind
+    of reader FileReader.get_audio_stream() returns.
+    """
+    wav_data = io.BytesIO()
+
+    with wave.open(wav_data, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(FREQUENCY)
+        wav.writeframes(b"\x10\x00\x10\x00" * int(FREQUENCY * seconds))
+
+    return BytesRangeReader(memoryview(wav_data.getvalue()))
+
+
+def hold_gil(seconds: float):
+    """
+    Keep the main thread busy for about the given number of seconds with
+    calls into C that hold the GIL the whole time they run.
+    """
+    screen = pygame.Surface((1920, 1080))
+
+    started = time.monotonic()
+    while time.monotonic() - started < seconds:
+
+        # A long call that never lets another thread take the GIL.
+        sum(range(20_000_000))
+
+        # A full-screen scale, like the camera does when zoomed.
+        pygame.transform.smoothscale(screen, (3840, 2160))
+
+
+class MusicWhileBusyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.mixer.init(frequency=FREQUENCY)
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.mixer.quit()
+
+    def setUp(self):
+        self.audio_player = AudioPlayer()
+
+        # The story's music tracks.
+        # Key: music name, Value: BytesRangeReader
+        self.tracks = {}
+
+        # How many times each track was read from the story's data.
+        self.track_reads = {}
+
+        self.active_story = Passer.active_story
+        Passer.active_story = SimpleNamespace(
+            data_requester=SimpleNamespace(get_audio_stream=self._get_audio_stream))
+
+    def tearDown(self):
+        pygame.mixer.music.stop()
+        Passer.active_story = self.active_story
+
+    def _get_audio_stream(self, content_type, item_name: str):
+        if item_name not in self.tracks:
+            return
+
+        self.track_reads[item_name] = self.track_reads.get(item_name, 0) + 1
+        return self.tracks[item_name], ".wav"
+
+    def _play(self, audio_name: str, music_stream: BytesRangeReader = None):
+        if music_stream:
+            self.tracks[audio_name] = music_stream
+
+        self.audio_player.play_audio(audio_name=audio_name,
+                                     audio_channel=AudioChannel.MUSIC)
+
+    def _wait_for_end(self) -> float:
+        """
+        Wait for the music to finish, calling update() once per frame
+        like the player does, and return when it finished
+        (time.monotonic()).
+        """
+        deadline = time.monotonic() + 10
+        while self.audio_player.is_music_playing():
+            self.assertLess(time.monotonic(), deadline)
+            self.audio_player.update()
+            time.sleep(0.005)
+
+        return time.monotonic()
+
+    def test_music_keeps_playing_while_gil_is_held(self):
+        track_seconds = 2
+
+        self._play("track", create_track(track_seconds))
+        started = time.monotonic()
+
+        hold_gil(seconds=1.5)
+
+        # The music kept playing while the main thread held the GIL.
+        elapsed = time.monotonic() - started
+        self.assertTrue(pygame.mixer.music.get_busy())
+        self.assertGreater(pygame.mixer.music.get_pos() / 1000,
+                           elapsed - END_TOLERANCE_SECONDS)
+
+        # And it ends on time, instead of being held up by the main thread.
+        ended = self._wait_for_end()
+        self.assertGreater(ended - started, track_seconds - END_TOLERANCE_SECONDS)
+        self.assertLess(ended - started, track_seconds + END_TOLERANCE_SECONDS)
+
+    def test_queued_music_plays_after_current_track(self):
+        self.tracks["second"] = create_track(0.5)
+
+        self._play("first", create_track(0.5))
+        self.audio_player.queue_music("second")
+
+        self.assertEqual(self.audio_player.loaded_music, "first")
+
+        started = time.monotonic()
+        while time.monotonic() - started < 1:
+            self.audio_player.update()
+            time.sleep(0.005)
+
+        self.assertEqual(self.audio_player.loaded_music, "second")
+        self._wait_for_end()
+
+    def test_music_stream_is_not_kept_open(self):
+        music_stream = create_track(1)
+
+        self._play("track", music_stream)
+        hold_gil(seconds=0.2)
+
+        # SDL reads its own copy of the track, so the story's data can
+        # be released while the music plays.
+        music_stream.close()
+        self.assertTrue(pygame.mixer.music.get_busy())
+        self._wait_for_end()
+
+    def test_music_file_is_reused(self):
+        self._play("first", create_track(0.2))
+        self._wait_for_end()
+
+        music_file = self.audio_player.music_files["first"]
+
+        # Playing and queueing the same track again re-uses its music file.
+        self._play("first")
+        self.audio_player.queue_music("first")
+        self._wait_for_end()
+
+        self.assertEqual(self.track_reads["first"], 1)
+        self.assertIs(self.audio_player.music_files["first"], music_file)
+
+    @patch.object(AudioPlayer, "MAX_MUSIC_FILE_BYTES", 150_000)
+    def test_least_recently_used_music_files_are_closed(self):
+        for audio_name in ("first", "second", "third"):
+            self._play(audio_name, create_track(0.5))
+
+        # Each track is about 88 KB, so only the newest one fits.
+        self.assertEqual(list(self.audio_player.music_files), ["third"])
+        self._wait_for_end()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Copyright 2023-2026 Jobin Rezai
+
+This file is part of LVNAuth.
+
+LVNAuth is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LVNAuth is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Tests for compiling font sprite kerning rules, which the story compiler
+and the player's font handler share.
+
+Run from the src/player folder:
+python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kerning_table import compile_kerning_table
+
+
+class CompileKerningTableTest(unittest.TestCase):
+
+    def test_each_previous_letter_gets_its_own_entry(self):
+        kerning_table = compile_kerning_table({"a": [("tes", -2, 0)]})
+
+        self.assertEqual({("t", "a"): (-2, 0),
+                          ("e", "a"): (-2, 0),
+                          ("s", "a"): (-2, 0)},
+                         kerning_table)
+
+    def test_any_rule_replaces_only_the_rules_before_it(self):
+        kerning_table = compile_kerning_table(
+            {"a": [("tes", -2, 0), ("(Any)", 1, 0), ("e", -3, 1)]})
+
+        self.assertEqual({("(Any)", "a"): (1, 0),
+                          ("e", "a"): (-3, 1)},
+                         kerning_table)
+
+    def test_later_rule_wins(self):
+        kerning_table = compile_kerning_table(
+            {"a": [("t", -2, 0), ("t", -1, 0)],
+             "b": []})
+
+        self.assertEqual({("t", "a"): (-1, 0)}, kerning_table)
+
+
+if __name__ == "__main__":
+    unittest.main()
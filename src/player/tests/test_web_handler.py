@@ -0,0 +1,399 @@
+"""
+Copyright 2023-2026 Jobin Rezai
+
+This file is part of LVNAuth.
+
+LVNAuth is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LVNAuth is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Tests for <remote_save> and <remote_get>, using a local stub server
+in place of the visual novel server.
+
+Run from the src/player folder:
+python -m unittest discover -s tests
+"""
+
+import sys
+import json
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from queue import Empty
+from threading import Thread, Lock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from web_handler import WebHandler, WebWorker, WebRequestPurpose, WebLicenseType
+from response_code import ServerResponseCode
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    A stub visual novel server that keeps saved key/values in memory.
+    Saves are slow on purpose, so a <remote_get> that doesn't wait for
+    a <remote_save> gets the old value.
+    """
+
+    daemon_threads = True
+
+    # The number of seconds each /remote_save request takes.
+    SAVE_SECONDS = 0.3
+
+    def __init__(self, request_handler_class=None):
+        super().__init__(("127.0.0.1", 0),
+                         request_handler_class or StubRequestHandler)
+
+        self.values = {}
+        self.values_lock = Lock()
+
+        # If set, saves get this reply instead of being saved.
+        # For example: "error-license_key_locked"
+        self.save_reply = None
+
+        # The addresses that were requested, in the order they finished.
+        self.requested = []
+
+        # The number of seconds each /remote_call request takes.
+        self.call_seconds = 0
+
+        # The number of /remote_call requests being handled right now,
+        # and the most there has been at the same time.
+        self.active_calls = 0
+        self.most_active_calls = 0
+
+        # The client (address, port) of each connection that was used.
+        self.connections = set()
+
+    @property
+    def address(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length) or b"{}")
+        vn_data = data.get("vn_data") or {}
+
+        if self.path == "/remote_save" and self.server.save_reply:
+            reply = self.server.save_reply
+
+        elif self.path == "/remote_save":
+            time.sleep(StubServer.SAVE_SECONDS)
+            with self.server.values_lock:
+                self.server.values |= vn_data
+            reply = "ok-save"
+
+        elif self.path == "/remote_call":
+            with self.server.values_lock:
+                self.server.values |= vn_data
+                self.server.active_calls += 1
+                self.server.most_active_calls = max(self.server.most_active_calls,
+                                                    self.server.active_calls)
+
+            time.sleep(self.server.call_seconds)
+
+            with self.server.values_lock:
+                self.server.active_calls -= 1
+            reply = "ok-script-done"
+
+        elif self.path == "/remote_get":
+            with self.server.values_lock:
+                value = self.server.values.get(vn_data.get("GetKeyValue"))
+            reply = f"ok-script-{value}"
+
+        else:
+            reply = "ok"
+
+        self.server.requested.append(self.path)
+        self.server.connections.add(self.client_address)
+
+        body = json.dumps(reply).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class KeepAliveRequestHandler(StubRequestHandler):
+    """
+    Keeps connections open between requests (HTTP/1.1), so we can check
+    that the web workers re-use them.
+    """
+    protocol_version = "HTTP/1.1"
+
+
+class StubServerTestCase(unittest.TestCase):
+
+    # The request handler for the stub server (None for the default).
+    request_handler_class = None
+
+    def setUp(self):
+        self.server = StubServer(self.request_handler_class)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+
+        self.web_handler = WebHandler(web_key="test-key",
+                                      web_address=self.server.address,
+                                      web_public_certificate=None,
+                                      web_bypass_certificate=False,
+                                      web_license_type=WebLicenseType.SHARED,
+                                      web_enabled=True,
+                                      vn_name="test_vn",
+                                      vn_episode="1")
+
+        self.web_handler.start_remote_save_journal(
+            journal_file_path=Path(self.temp_folder.name) / "vn_remote_saves")
+
+        # Don't let receipts from another test get mixed in.
+        self._clear_receipts()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_folder.cleanup()
+
+    def _clear_receipts(self):
+        while True:
+            try:
+                WebHandler.the_queue.get_nowait()
+            except Empty:
+                return
+
+    def _save(self, **vn_data):
+        self.web_handler.send_request(data={"vn_data": vn_data},
+                                      callback_method=self._on_save_finished,
+                                      purpose=WebRequestPurpose.REMOTE_SAVE,
+                                      increment_usage_count=False)
+
+    def _on_save_finished(self, receipt):
+        pass
+
+    def _get(self, save_key: str) -> str:
+        """
+        Send a <remote_get> and return the reply that the main thread
+        would receive.
+        """
+        self.web_handler.send_request(data={"vn_data": {"GetKeyValue": save_key}},
+                                      callback_method=None,
+                                      purpose=WebRequestPurpose.REMOTE_GET,
+                                      increment_usage_count=False)
+
+        receipt = WebHandler.the_queue.get(timeout=10)
+        self.assertEqual(receipt.response_code, ServerResponseCode.SUCCESS)
+        return receipt.response_text
+
+    def _wait_for_journal(self):
+        deadline = time.monotonic() + 10
+        while self.web_handler.remote_save_journal.get_pending_count():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+
+class RemoteSaveThenGetTest(StubServerTestCase):
+
+    def test_get_after_save_returns_new_value(self):
+        self._save(score="old")
+        self._wait_for_journal()
+
+        self._save(score="new")
+        self.assertEqual(self._get("score"), "ok-script-new")
+
+        # The save needs to have reached the server before the get.
+        self.assertEqual(self.server.requested[-2:],
+                         ["/remote_save", "/remote_get"])
+
+    def test_get_of_other_key_does_not_wait(self):
+        self._save(score="old")
+        self._wait_for_journal()
+
+        self._save(score="new")
+        self.assertEqual(self._get("name"), "ok-script-None")
+
+        # The get didn't wait for the slow save.
+        self.assertTrue(self.web_handler.remote_save_journal.has_pending_key("score"))
+        self._wait_for_journal()
+
+    def test_get_does_not_wait_for_unreachable_server(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+        self._save(score="new")
+
+        started = time.monotonic()
+        self.web_handler.send_request(data={"vn_data": {"GetKeyValue": "score"}},
+                                      callback_method=None,
+                                      purpose=WebRequestPurpose.REMOTE_GET,
+                                      increment_usage_count=False)
+        receipt = WebHandler.the_queue.get(timeout=10)
+
+        self.assertEqual(receipt.response_code, ServerResponseCode.CONNECTION_ERROR)
+        self.assertLess(time.monotonic() - started, 5)
+
+        # The save is still kept in the journal.
+        self.assertTrue(self.web_handler.remote_save_journal.has_pending_key("score"))
+
+    def test_get_is_not_cached_by_default(self):
+        self._save(score="old")
+        self._wait_for_journal()
+
+        self.assertEqual(self._get("score"), "ok-script-old")
+        self.assertEqual(self._get("score"), "ok-script-old")
+
+        self.assertEqual(self.server.requested.count("/remote_get"), 2)
+        self.assertFalse(self.web_handler.remote_get_cache)
+
+    def test_remote_call_clears_cache(self):
+        self.web_handler.remote_get_cache_seconds = 60
+
+        self._save(score="old")
+        self._wait_for_journal()
+
+        self.assertEqual(self._get("score"), "ok-script-old")
+        self.assertEqual(self._get("score"), "ok-script-old")
+        self.assertEqual(self.server.requested.count("/remote_get"), 1)
+
+        # A remote script changes the value on the server.
+        self.web_handler.send_request(data={"vn_data": {"score": "called"}},
+                                      callback_method=None,
+                                      purpose=WebRequestPurpose.REMOTE_CALL,
+                                      increment_usage_count=False)
+        WebHandler.the_queue.get(timeout=10)
+
+        self.assertEqual(self._get("score"), "ok-script-called")
+
+    def test_get_of_unsent_key_is_not_cached(self):
+        self.web_handler.remote_get_cache_seconds = 60
+
+        self._save(score="old")
+        self._wait_for_journal()
+
+        # The server is busy, so the new value stays in the journal
+        # and the server still has the old value.
+        self.server.save_reply = "busy"
+        self._save(score="new")
+
+        self.assertEqual(self._get("score"), "ok-script-old")
+        self.assertNotIn(("test_vn", "score"), self.web_handler.remote_get_cache)
+
+        # Once the journal has sent the new value, the get returns it.
+        self.server.save_reply = None
+        self._save(other="value")
+        self._wait_for_journal()
+
+        self.assertEqual(self._get("score"), "ok-script-new")
+
+    def test_saves_are_sent_together(self):
+        # The first save is sent right away. The others are saved while
+        # the server is busy with it, so they're sent as one request.
+        self._save(a="1")
+        time.sleep(0.05)
+        self._save(b="2")
+        self._save(c="3")
+        self._save(a="4")
+        self._wait_for_journal()
+
+        self.assertEqual(self.server.requested.count("/remote_save"), 2)
+        self.assertEqual(self.server.values, {"a": "4", "b": "2", "c": "3"})
+
+    def test_refused_save_does_not_block_later_saves(self):
+        self.server.save_reply = "error-license_key_locked"
+        self._save(score="bad")
+
+        # The story is told that the save was refused.
+        receipt = WebHandler.the_queue.get(timeout=10)
+        self.assertEqual(receipt.response_code,
+                         ServerResponseCode.LICENSE_KEY_LOCKED)
+
+        # The refused save was moved out of the journal.
+        journal = self.web_handler.remote_save_journal
+        self._wait_for_journal()
+        self.assertFalse(journal.has_pending_key("score"))
+
+        rejected_path = journal.journal_file_path.with_name(
+            journal.journal_file_path.name + ".rejected")
+        self.assertIn('"score": "bad"', rejected_path.read_text(encoding="utf-8"))
+
+        # A later save reaches the server on its own.
+        self.server.save_reply = None
+        self._save(score="good")
+        self._wait_for_journal()
+
+        self.assertEqual(self.server.values, {"score": "good"})
+        self.assertEqual(self._get("score"), "ok-script-good")
+
+
+class WebWorkerPoolTest(StubServerTestCase):
+
+    request_handler_class = KeepAliveRequestHandler
+
+    def _call(self, callback_method, **vn_data):
+        self.web_handler.send_request(data={"vn_data": vn_data},
+                                      callback_method=callback_method,
+                                      purpose=WebRequestPurpose.REMOTE_CALL,
+                                      increment_usage_count=False)
+
+    def _get_receipts(self, count: int) -> list:
+        return [WebHandler.the_queue.get(timeout=10) for _ in range(count)]
+
+    def test_each_request_gets_its_own_receipt(self):
+        callback_methods = [lambda receipt, number=number: number
+                            for number in range(10)]
+
+        for number, callback_method in enumerate(callback_methods):
+            self._call(callback_method, **{f"key{number}": str(number)})
+
+        receipts = self._get_receipts(len(callback_methods))
+
+        self.assertCountEqual([receipt.callback_method for receipt in receipts],
+                              callback_methods)
+        self.assertTrue(all(receipt.response_code == ServerResponseCode.SUCCESS
+                            for receipt in receipts))
+        self.assertEqual(self.server.requested.count("/remote_call"), 10)
+
+    def test_requests_are_limited_to_max_workers(self):
+        self.server.call_seconds = 0.2
+
+        for number in range(WebWorker.MAX_WORKERS * 3):
+            self._call(None)
+
+        self._get_receipts(WebWorker.MAX_WORKERS * 3)
+
+        self.assertLessEqual(len(WebWorker.workers), WebWorker.MAX_WORKERS)
+        self.assertLessEqual(self.server.most_active_calls, WebWorker.MAX_WORKERS)
+
+        # The requests were sent at the same time, not one by one.
+        self.assertGreater(self.server.most_active_calls, 1)
+
+    def test_connections_are_reused(self):
+        for number in range(20):
+            self.assertEqual(self._get("score"), "ok-script-None")
+
+        # The requests went through the shared session's kept-alive
+        # connections instead of connecting again each time.
+        self.assertEqual(self.server.requested.count("/remote_get"), 20)
+        self.assertLessEqual(len(self.server.connections), WebWorker.MAX_WORKERS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -49,6 +49,13 @@ class TintHandler:
     The speed is user-definable.
     """
     
+    # While a tint is animating, the tint value is rounded to one of
+    # these many levels (0-255), so that the sprite only needs to be
+    # re-tinted when the tint value reaches the next level and so that
+    # tinted images can be re-used from the sprite's tint cache.
+    # The destination tint value is always applied exactly.
+    TINT_LEVELS = 64
+    
     def __init__(self):
 
         self.status = TintStatus.ORIGINAL_UNTINTED
@@ -116,7 +123,7 @@ class TintHandler:
             reapply_tint =\
                 (self.applied_tint_value is None \
                 or \
-                self.applied_tint_value != self.current_tint_value)
+                self.applied_tint_value != self.get_tint_value())
             
         return reapply_tint
     
@@ -273,6 +280,26 @@ class TintHandler:
         # Set flag to indicate that a tint animation has started.
         self.status = TintStatus.ANIMATING
         
+    def get_tint_value(self) -> int | None:
+        """
+        Return the tint value that should be applied to the sprite.
+        
+        While the tint is animating, the current tint value is rounded to
+        the nearest tint level (see TINT_LEVELS). Otherwise, the current
+        tint value is returned as-is.
+        """
+        
+        if self.current_tint_value is None \
+           or self.status != TintStatus.ANIMATING:
+            return self.current_tint_value
+        
+        level_size = 256 // self.TINT_LEVELS
+        
+        tint_value =\
+            round(self.current_tint_value / level_size) * level_size
+        
+        return min(tint_value, 255)
+        
     def get_tint_values(self) -> Tuple | None:
         """
         Return a tuple with the current RGB tint values.
@@ -284,9 +311,11 @@ class TintHandler:
             # Regular, untinted
             return
         
-        return (self.current_tint_value,
-                self.current_tint_value,
-                self.current_tint_value)
+        tint_value = self.get_tint_value()
+        
+        return (tint_value,
+                tint_value,
+                tint_value)
         
     def animate_tint(self) -> bool | None:
         """
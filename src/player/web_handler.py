@@ -22,13 +22,17 @@ along with LVNAuth.  If not, see <https://www.gnu.org/licenses/>.
 proxy.verify_license() because each remote request will need the license key checked.
 """
 
+import time
 import niquests as requests
 from queue import Queue
-from threading import Thread
+from threading import Thread, Lock
 from enum import Enum, auto
-from dataclasses import dataclass
+from functools import partial
+from dataclasses import dataclass, field
+from pathlib import Path
 from response_code import ServerResponseReceipt, ServerResponseCode
-from typing import ClassVar, Callable, Dict, Optional
+from remote_save_journal import RemoteSaveJournal
+from typing import ClassVar, Callable, Dict, Optional, Tuple
 
 
 
@@ -62,41 +66,102 @@ class WebRequestPurpose(Enum):
     REDEEM_OR_UPDATE_LICENSE_KEY = "REDEEM"
     
 
+@dataclass
+class RemoteGetCacheEntry:
+    """
+    The last response the server gave for a <remote_get> key.
+    
+    The web worker fills in the response once the server replies.
+    Until then, response_text and stored_time are None and the entry
+    is not used.
+    """
+    
+    # The server's response (for example: "ok-script-blue")
+    response_text: object = None
+    
+    # The ETag header the server sent with the response (if any), so we
+    # can ask the server whether the value has changed (If-None-Match).
+    etag: str = None
+    
+    # time.monotonic() of when the server last sent or confirmed
+    # the response.
+    stored_time: float = None
+    
+    def is_fresh(self, max_seconds: float) -> bool:
+        """
+        Return whether the response was received or confirmed by the
+        server within the last max_seconds seconds.
+        """
+        
+        if self.response_text is None or self.stored_time is None:
+            return False
+        
+        return time.monotonic() - self.stored_time < max_seconds
+
+
+@dataclass
+class WebRequest:
+    """
+    A request that is waiting to be sent to the server by a web worker.
+    """
+    uri: str
+    data: Dict
+    purpose: "WebRequestPurpose"
+    callback_method: Callable
+    
+    # Used for <remote_get> requests. The server's response gets stored
+    # in this cache entry.
+    cache_entry: Optional[RemoteGetCacheEntry] = None
+    
+    # Used for <remote_get> requests of a key that is still in the remote
+    # save journal. The web worker runs this method before sending the
+    # request, so the request waits until the server has the new value.
+    wait_method: Optional[Callable] = None
+
+
 class WebWorker(Thread):
     """
     This class is used for submitting data to the server in a worker thread.
     A callback method is run on the main thread when it's finished.
+    
+    A small number of web workers are started the first time a request
+    is sent and they keep running for as long as the player is running.
+    All the web workers share one HTTP session, so connections to the
+    server are kept alive and re-used instead of connecting again
+    (TCP + TLS handshake) for every request.
     """
     
+    # Requests (WebRequest objects) waiting to be sent to the server.
     the_queue = Queue()
     
-    # Keep count of the number of web worker instances because
-    # if there are any running, the main script reader must be paused.
+    # The maximum number of requests that can be sent at the same time.
+    MAX_WORKERS = 4
+    
+    # The web worker threads that have been started.
+    workers = []
+    
+    # The HTTP session shared by all the web workers.
+    session: requests.Session = None
+    
+    # The number of web workers that are waiting for a request.
+    idle_count = 0
+    
+    # Used for making sure two threads don't start web workers or create
+    # the HTTP session at the same time.
+    lock = Lock()
+    
+    # Keep count of the number of web requests that haven't finished yet
+    # because if there are any, the main script reader must be paused.
     active_count = 0
     
-    def __init__(self,
-                 uri: str, 
-                 data: Dict,
-                 callback_method: Callable):
+    def __init__(self):
         Thread.__init__(self, daemon=True)
         
-        self.uri = uri
-        
-        self.data = data
-        self.callback_method = callback_method
-        
-        # If the request takes a long time, an outside thread might want to 
-        # cancel this thread, so we use this flag to indicate that another 
-        # thread wants this thread cancelled.
-        # So even if this thread ends up completing successfully, it won't run 
-        # the callback method.
-        self.cancelled = False
-        
     @classmethod
     def increase_usage_count(cls):
         """
         Increment the counter variable that keeps track of the number
-        of web worker threads that are actively running.
+        of web requests that are actively running.
         
         We have a method for this so we can more easily debug
         when this value changes.
@@ -107,37 +172,167 @@ class WebWorker(Thread):
     def decrease_usage_count(cls):
         """
         Decrement the counter variable that keeps track of the number
-        of web worker threads that are actively running.
+        of web requests that are actively running.
         
         We have a method for this so we can more easily debug
         when this value changes.
         """        
         cls.active_count -= 1
         
+    @classmethod
+    def submit(cls,
+               uri: str,
+               data: Dict,
+               purpose: "WebRequestPurpose",
+               callback_method: Callable,
+               cache_entry: RemoteGetCacheEntry = None,
+               wait_method: Callable = None):
+        """
+        Queue a request so it gets sent to the server by the next
+        available web worker. Start the web workers if they haven't been
+        started yet.
+        
+        This method is run from the main thread.
+        
+        Arguments:
+        
+        - uri: the full address to send the request to.
+        
+        - data: dictionary data to send to FastAPI
+        
+        - purpose: the type of request (save, get, etc.)
+        
+        - callback_method: the method to run when we receive a response
+        from the server.
+        
+        - cache_entry: used for <remote_get> requests, so the server's
+        response gets cached.
+        
+        - wait_method: a method to run on the web worker thread before
+        the request is sent (see WebRequest.wait_method).
+        """
+        
+        with cls.lock:
+            
+            web_request = WebRequest(uri=uri,
+                                     data=data,
+                                     purpose=purpose,
+                                     callback_method=callback_method,
+                                     cache_entry=cache_entry,
+                                     wait_method=wait_method)
+            
+            cls.the_queue.put(web_request)
+            
+            # Start another web worker if all the web workers are busy
+            # and we haven't reached the limit yet.
+            # Web workers are only started when they're needed.
+            if cls.idle_count < cls.the_queue.qsize() \
+               and len(cls.workers) < cls.MAX_WORKERS:
+                worker = WebWorker()
+                cls.workers.append(worker)
+                worker.start()
+                
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Return the HTTP session that is shared by all the web workers.
+        The session is created the first time it's needed.
+        """
+        
+        with cls.lock:
+            
+            if not cls.session:
+                cls.session =\
+                    requests.Session(pool_maxsize=cls.MAX_WORKERS)
+                
+            return cls.session
 
     def run(self):
         """
-        Send the request to the web server.
+        Send queued requests to the web server, one at a time.
         
         This method is executed on a worker thread (secondary thread).
         """
         
-        # Has an outside thread cancelled this thread?
-        # Don't bother doing anything with the results that we just got 
-        # from the server, because an outside thread has 
-        # cancelled this thread.
-        if self.cancelled:
+        while True:
             
-            # Decrease the worker thread count.
-            self.active_count -= 1
+            with WebWorker.lock:
+                WebWorker.idle_count += 1
             
-            return
+            web_request: WebRequest
+            web_request = WebWorker.the_queue.get()
+            
+            with WebWorker.lock:
+                WebWorker.idle_count -= 1
+                    
+            self._send(web_request)
+
+    def _send(self, web_request: WebRequest):
+        """
+        Send a request to the web server and put a ServerResponseReceipt
+        in WebHandler's queue for the request's callback method.
+        
+        This method is executed on a worker thread (secondary thread).
+        
+        Arguments:
+        
+        - web_request: the request to send to the server.
+        """
+        
+        # Wait for anything that needs to reach the server first
+        # (for example: a <remote_save> of the key we're about to get).
+        if web_request.wait_method:
+            web_request.wait_method()
+        
+        response, result = WebWorker.post(uri=web_request.uri,
+                                          data=web_request.data,
+                                          cache_entry=web_request.cache_entry)
+
+        # Send the response to the main GUI thread.
+        receipt =\
+            ServerResponseReceipt(
+                callback_method=web_request.callback_method,
+                response_code=response,
+                response_text=result)
+        WebHandler.the_queue.put(receipt)
+            
+    @classmethod
+    def post(cls,
+             uri: str,
+             data: Dict,
+             cache_entry: RemoteGetCacheEntry = None) -> Tuple[ServerResponseCode,
+                                                              object]:
+        """
+        Send data to the web server using the shared HTTP session
+        and return the response code and the response text.
+        
+        This method is executed on a worker thread (secondary thread).
+        
+        Arguments:
+        
+        - uri: the full address to send the request to.
+        
+        - data: dictionary data to send to FastAPI, including the
+        certificate keys (which are removed before the data is sent).
+        
+        - cache_entry: if provided, a successful response gets stored in it.
+        If it already has a response with an ETag, the server is asked
+        whether the response has changed (If-None-Match) and if it hasn't
+        (304 Not Modified), the cached response is used.
+        """
         
+        # Ask the server to only send the response if it has changed?
+        if cache_entry and cache_entry.etag \
+           and cache_entry.response_text is not None:
+            headers = {"If-None-Match": cache_entry.etag}
+        else:
+            headers = None
+
         # Send the request to the server.
         try:
                 
-            web_public_certificate = self.data.pop("web_public_certificate")
-            bypass_certificate = self.data.pop("web_bypass_certificate")
+            web_public_certificate = data.pop("web_public_certificate")
+            bypass_certificate = data.pop("web_bypass_certificate")
             
             if bypass_certificate:
                 # Don't verify the certificate.
@@ -153,7 +348,10 @@ class WebWorker(Thread):
                 # Attempt to verify using regular/stock certificates.
                 verify = True
             
-            result = requests.post(self.uri, verify=verify, json=self.data)
+            result = cls.get_session().post(uri,
+                                            verify=verify,
+                                            json=data,
+                                            headers=headers)
         
         except requests.exceptions.SSLError:
             
@@ -164,26 +362,42 @@ class WebWorker(Thread):
             
             result = None
             response = ServerResponseCode.CONNECTION_ERROR
+            
+        except requests.exceptions.RequestException:
+            
+            # For example: a timeout. The web worker needs to keep
+            # running for the next requests, so don't let it stop here.
+            result = None
+            response = ServerResponseCode.CONNECTION_ERROR
         
         else:
+            
+            http_response = result
+            
+            if headers and http_response.status_code == 304:
+                
+                # The value hasn't changed on the server since we cached it.
+                cache_entry.stored_time = time.monotonic()
+                
+                return ServerResponseCode.SUCCESS, cache_entry.response_text
         
             # We're only interested in the text represetation.
-            result = result.json()
-    
-            # Send a remote request.
-            # result = proxy.verify_license(self.data)
+            try:
+                result = http_response.json()
+            except ValueError:
+                # Not a JSON response (for example: an html error page).
+                result = http_response.text
     
             response =\
                 ServerResponseCode.get_response_code_from_text(msg=result)
-    
-
-        # Send the response to the main GUI thread
-        receipt =\
-            ServerResponseReceipt(
-                callback_method=self.callback_method,
-                response_code=response,
-                response_text=result)
-        WebHandler.the_queue.put(receipt)                
+            
+            # Cache a successful response.
+            if cache_entry and response == ServerResponseCode.SUCCESS:
+                cache_entry.response_text = result
+                cache_entry.etag = http_response.headers.get("ETag")
+                cache_entry.stored_time = time.monotonic()
+            
+        return response, result
     
 
 
@@ -213,6 +427,115 @@ class WebHandler:
     # we need to set the callback method later on.
     callback_method_finished: Optional[Callable[[ServerResponseReceipt], None]] = None
     
+    # Keeps <remote_save> key/values on the disk until the server has
+    # received them. If this is not set, <remote_save> requests are sent
+    # like any other request and the main reader waits for them.
+    remote_save_journal: Optional[RemoteSaveJournal] = None
+    
+    # The callback method of the latest <remote_save>. It's used for
+    # letting the story know when the server refuses journal key/values.
+    remote_save_callback_method: Optional[Callable] = None
+    
+    # The number of seconds a <remote_get> response can be used again
+    # without asking the server. After that, the server is asked whether
+    # the value has changed (using the response's ETag, if it had one).
+    # 0 means <remote_get> responses are not cached (the default).
+    # Caching is turned on with <remote_get_cache: seconds>
+    remote_get_cache_seconds: float = 0
+    
+    # The latest <remote_get> responses.
+    # Key: (vn_name, save key) tuple
+    # Value: RemoteGetCacheEntry object
+    remote_get_cache: Dict = field(default_factory=dict)
+    
+    def start_remote_save_journal(self, journal_file_path: Path):
+        """
+        Start keeping <remote_save> key/values in a journal file, so the
+        story doesn't need to wait for the server and so the key/values
+        don't get lost if the server can't be reached.
+        
+        Arguments:
+        
+        - journal_file_path: the full path to the journal file.
+        """
+        self.remote_save_journal =\
+            RemoteSaveJournal(journal_file_path=journal_file_path,
+                              vn_name=self.vn_name,
+                              send_method=self._send_remote_save,
+                              rejected_method=self._on_remote_save_rejected)
+        
+    def _on_remote_save_rejected(self,
+                                 response_code: ServerResponseCode,
+                                 response_text: object):
+        """
+        Let the story know that the server refused <remote_save>
+        key/values, the same way a failed request is reported.
+        
+        This method is run on the remote save journal's worker thread.
+        
+        Arguments:
+        
+        - response_code: the server's response code.
+        
+        - response_text: the server's response text.
+        """
+        
+        if not self.remote_save_callback_method:
+            # Key/values left from the last time the visual novel was
+            # played, before this session's first <remote_save>.
+            print(f"Remote save not accepted by the server: {response_text}")
+            return
+        
+        WebHandler.the_queue.put(
+            ServerResponseReceipt(
+                callback_method=partial(self._report_rejected_save,
+                                        callback_method=self.remote_save_callback_method),
+                response_code=response_code,
+                response_text=response_text))
+        
+    @staticmethod
+    def _report_rejected_save(receipt: ServerResponseReceipt,
+                              callback_method: Callable):
+        """
+        Run a <remote_save>'s callback method with the server's refusal.
+        
+        Journal saves don't increment the web worker count (the story
+        doesn't wait for them), but the callback method decrements it,
+        so increment it first.
+        
+        This method is run on the main thread.
+        """
+        WebWorker.increase_usage_count()
+        callback_method(receipt)
+        
+    def _send_remote_save(self, vn_data: Dict) -> Tuple[ServerResponseCode,
+                                                         object]:
+        """
+        Send <remote_save> key/values to the server and return the
+        response code and response text.
+        
+        This method is run on the remote save journal's worker thread.
+        
+        Arguments:
+        
+        - vn_data: the key/values to save on the server.
+        """
+        
+        data = self._get_required_data() | {"vn_data": vn_data}
+        
+        return WebWorker.post(
+            uri=self._get_address(purpose=WebRequestPurpose.REMOTE_SAVE),
+            data=data)
+        
+    def _get_required_data(self) -> Dict:
+        """
+        Return the data that needs to be sent with every request.
+        """
+        return {"license_key": self.web_key,
+                "vn_name": self.vn_name,
+                "web_public_certificate": self.web_public_certificate,
+                "web_bypass_certificate": self.web_bypass_certificate,}
+    
     def send_request(self,
                      data: Dict,
                      callback_method: Callable,
@@ -220,7 +543,8 @@ class WebHandler:
                      increment_usage_count=True):
         """
         Send data to the remote server and get a response back.
-        This method is run from the main thread, but spawns a worker thread.
+        This method is run from the main thread, but the request is sent
+        by a web worker thread.
         
         Arguments:
         
@@ -244,12 +568,89 @@ class WebHandler:
         during a license check.
         """
         
+        vn_data = (data or {}).get("vn_data") or {}
+        
+        if purpose == WebRequestPurpose.REMOTE_SAVE:
+            
+            # The saved keys will have new values on the server,
+            # so the cached values of those keys are out of date.
+            for save_key in vn_data:
+                self.remote_get_cache.pop((self.vn_name, save_key), None)
+                
+        elif purpose == WebRequestPurpose.REMOTE_CALL:
+            
+            # A remote script can change any value on the server,
+            # so none of the cached values can be trusted anymore.
+            self.remote_get_cache.clear()
+                
+        # Is this a <remote_get> of a key that was saved with <remote_save>
+        # but hasn't reached the server yet?
+        get_key_pending = purpose == WebRequestPurpose.REMOTE_GET \
+            and self.remote_save_journal \
+            and self.remote_save_journal.has_pending_key(
+                vn_data.get("GetKeyValue"))
+                
+        # Used for caching <remote_get> responses.
+        # The response of a key that is still in the journal is not cached,
+        # because if the journal can't reach the server, the server will
+        # reply with the key's old value.
+        cache_entry = None
+        
+        if purpose == WebRequestPurpose.REMOTE_GET \
+           and self.remote_get_cache_seconds > 0 \
+           and not get_key_pending \
+           and vn_data.get("GetKeyValue"):
+            
+            cache_key = (self.vn_name, vn_data.get("GetKeyValue"))
+            cache_entry = self.remote_get_cache.get(cache_key)
+            
+            if cache_entry \
+               and cache_entry.is_fresh(self.remote_get_cache_seconds):
+                
+                # Use the cached response without asking the server.
+                # The callback method runs on the next frame,
+                # the same way it does when the server replies.
+                if increment_usage_count:
+                    WebWorker.increase_usage_count()
+                    
+                WebHandler.the_queue.put(
+                    ServerResponseReceipt(
+                        callback_method=callback_method,
+                        response_code=ServerResponseCode.SUCCESS,
+                        response_text=cache_entry.response_text))
+                return
+            
+            if not cache_entry:
+                cache_entry = RemoteGetCacheEntry()
+                self.remote_get_cache[cache_key] = cache_entry
+        
+        # Save requests go to the journal, which sends them to the server
+        # in the background. The story doesn't need to wait for them,
+        # so the web worker count is not incremented either.
+        if purpose == WebRequestPurpose.REMOTE_SAVE \
+           and self.remote_save_journal:
+            self.remote_save_callback_method = callback_method
+            self.remote_save_journal.append(vn_data=vn_data)
+            return
+        
+        # Send any saves that were left in the journal (for example: from
+        # the last time the visual novel was played), now that the story
+        # is talking to the server.
+        if self.remote_save_journal:
+            self.remote_save_journal.flush()
+        
+        # A <remote_get> of a key that hasn't reached the server yet needs
+        # to wait until the journal has sent the key, or the server will
+        # reply with the key's old value.
+        wait_method = None
+        
+        if get_key_pending:
+            wait_method =\
+                partial(self.remote_save_journal.wait_until_sent,
+                        save_key=vn_data.get("GetKeyValue"))
+        
         # Required data to send to the remote server.
-        default_required_data =\
-            {"license_key": self.web_key,
-             "vn_name": self.vn_name,
-             "web_public_certificate": self.web_public_certificate,
-             "web_bypass_certificate": self.web_bypass_certificate,}        
+        default_required_data = self._get_required_data()
 
         # Is there optional data to send? Combine it with the required data.
         if data:
@@ -264,16 +665,31 @@ class WebHandler:
         if increment_usage_count:
             WebWorker.increase_usage_count()
 
-        t = Thread(target=self._send_request,
-                   daemon=True,
-                   args=(data, purpose, callback_method))
-        t.start()
+        self._send_request(data=data,
+                           purpose=purpose,
+                           callback_method=callback_method,
+                           cache_entry=cache_entry,
+                           wait_method=wait_method)
         
     def _send_request(self, data: Dict, purpose: WebRequestPurpose,
-                      callback_method: Callable):
+                      callback_method: Callable,
+                      cache_entry: RemoteGetCacheEntry = None,
+                      wait_method: Callable = None):
+        """
+        Queue a request so it gets sent to the server by a web worker.
+        """
+        
+        WebWorker.submit(uri=self._get_address(purpose=purpose),
+                         data=data,
+                         purpose=purpose,
+                         callback_method=callback_method,
+                         cache_entry=cache_entry,
+                         wait_method=wait_method)
+        
+    def _get_address(self, purpose: WebRequestPurpose) -> str:
         """
-        Send a request to the server. This method is run in a
-        worker thread.
+        Return the full address to send a request to,
+        based on the purpose of the request.
         """
         
         if purpose == WebRequestPurpose.VERIFY_LICENSE:
@@ -290,9 +706,5 @@ class WebHandler:
             
         elif purpose == WebRequestPurpose.REDEEM_OR_UPDATE_LICENSE_KEY:
             address = self.web_address + "/redeem_process"
-        
-        reader = WebWorker(uri=address,
-                           data=data,
-                           callback_method=callback_method)     
-        
-        reader.start()        
+            
+        return address
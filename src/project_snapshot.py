@@ -413,6 +413,41 @@ class FontSprite:
             
         return data
 
+    @staticmethod
+    def from_dict_data(property_details: Dict):
+        """
+        Create a FontSprite object from a dictionary that was made
+        by _get_dict_data() (from a project file or a .json file made by
+        the font sprite builder).
+
+        Arguments:
+
+        - property_details: a dict with the keys: "Width", "Height",
+        "PaddingLetters", "PaddingLines", "DetectLetterEdges", "Letters"
+
+        Return: a FontSprite object.
+        """
+        letters: Dict = property_details.get("Letters", {})
+
+        # Put the kerning and rect_crop info into a LetterProperties object,
+        # and update a new dictionary with the new LetterProperties objects.
+        load_letters = {}
+        for letter, details in letters.items():
+            rect_crop = details.get("rect_crop")
+            kerning_rules = details.get("kerning_rules")
+            letter_properties = LetterProperties(rect_crop=rect_crop,
+                                                 kerning_rules=kerning_rules)
+            # New dictionary that will contain the LetterProperties
+            load_letters[letter] = letter_properties
+
+        return FontSprite(
+            width=property_details.get("Width", 0),
+            height=property_details.get("Height", 0),
+            padding_letters=property_details.get("PaddingLetters", 0),
+            padding_lines=property_details.get("PaddingLines", 0),
+            detect_letter_edges=property_details.get("DetectLetterEdges", False),
+            letters=load_letters)
+
     def _get_dict_data(self) -> Dict:
         """
         Convert the data in this FontSprite object to a dictionary which
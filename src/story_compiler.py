@@ -23,10 +23,12 @@ from tkinter import messagebox
 from tkinter import ttk
 
 from project_snapshot import ProjectSnapshot, SubPaths, FontSprite
+from PIL import Image
 from enum import Enum, auto
 from pathlib import Path
 from typing import Dict, List
 from re import search
+from kerning_table import compile_kerning_table
 
 
 def extract_arguments(command_line: str):
@@ -305,6 +307,12 @@ class StoryCompiler:
             #                         'PaddingLetters': 0, 'PaddingLines': 0,
             #                        'Letters': {'A': LetterProperties object..)
             font_sprite_properties = FontSprite.get_all_font_properties()
+            
+            # Measure the letters and compile the kerning rules now,
+            # so the player doesn't have to do it when loading a font.
+            self._bake_font_metrics(font_sprite_properties=font_sprite_properties,
+                                    font_sprite_files=font_sprite_files)
+            
             detail_header["FontSpriteProperties"] = font_sprite_properties
 
             general_header["StoryInfo"] = ProjectSnapshot.details
@@ -347,6 +355,103 @@ class StoryCompiler:
 
         print("Done creating .lvna file.")
 
+    @staticmethod
+    def _bake_font_metrics(font_sprite_properties: Dict,
+                           font_sprite_files: Dict[str, str]):
+        """
+        Add letter metrics and a compiled kerning table to the properties
+        of each font sprite that is included in the story.
+        
+        Two keys get added to each font's properties dictionary:
+        
+        - "LetterMetrics": key: letter, value: a dict with the letter's
+        "Width", "Height", the first and last X positions that have
+        non-transparent pixels ("EdgeLeft", "EdgeRight") and the
+        "Advance" (how far the next letter starts from this letter,
+        before letter padding and kerning).
+        
+        - "KerningTable": a list of [previous letter, letter, left trim,
+        right trim]. The previous letter can be "(Any)".
+        
+        The player uses these instead of scanning the letters' pixels and
+        going through the kerning rules when a font is loaded.
+        
+        Arguments:
+        
+        - font_sprite_properties: key: font name, value: the font's
+        properties dict (from FontSprite.get_all_font_properties()).
+        This dictionary gets changed in-place.
+        
+        - font_sprite_files: key: font name, value: the full path
+        of the font's sprite sheet image.
+        """
+        
+        for font_name, font_properties in font_sprite_properties.items():
+            
+            letters = font_properties.get("Letters")
+            if not letters:
+                continue
+            
+            # A list of [previous letter, letter, left trim, right trim]
+            kerning_table = compile_kerning_table(
+                {letter: letter_details.get("kerning_rules")
+                 for letter, letter_details in letters.items()})
+            font_properties["KerningTable"] =\
+                [[previous_letter, letter, left_trim, right_trim]
+                 for (previous_letter, letter), (left_trim, right_trim)
+                 in kerning_table.items()]
+            
+            sheet_path = font_sprite_files.get(font_name)
+            if not sheet_path:
+                # The font isn't used in the story.
+                continue
+            
+            with Image.open(sheet_path) as sheet_image:
+                alpha_channel = sheet_image.convert("RGBA").getchannel("A")
+                
+            detect_letter_edges = font_properties.get("DetectLetterEdges")
+                
+            letter_metrics = {}
+            for letter, letter_details in letters.items():
+                
+                # (left, upper, right, lower)
+                left, upper, right, lower = letter_details.get("rect_crop")
+                
+                # The player can't cut out letters that are
+                # beyond the sprite sheet, so skip them here too.
+                if left < 0 or upper < 0 \
+                   or right > alpha_channel.width or lower > alpha_channel.height \
+                   or right < left or lower < upper:
+                    continue
+                
+                width = right - left
+                height = lower - upper
+                
+                # The box of the non-transparent pixels (alpha > 0).
+                opaque_box =\
+                    alpha_channel.crop((left, upper, right, lower)).getbbox()
+                
+                if opaque_box:
+                    edge_left = opaque_box[0]
+                    edge_right = opaque_box[2]
+                else:
+                    # A fully transparent letter.
+                    edge_left = 0
+                    edge_right = 0
+                    
+                if detect_letter_edges and letter != " ":
+                    advance = edge_right
+                else:
+                    advance = width
+                    
+                letter_metrics[letter] = {"Width": width,
+                                          "Height": height,
+                                          "EdgeLeft": edge_left,
+                                          "EdgeRight": edge_right,
+                                          "Advance": advance}
+                
+            font_properties["LetterMetrics"] = letter_metrics
+            
     @staticmethod
     def _get_right_padded_text(text: str, pad_character: str = "X", expected_length: int = 25) -> str:
         """
@@ -1900,6 +1900,38 @@ class WizardWindow:
                          command_name="play_music",
                          purpose_line="Play audio in the music channel.",
                          group_name=GroupName.PLAY)
+
+        page_audio_queue_music =\
+            AudioPlay(parent_frame=self.frame_contents_outer,
+                         header_label=self.lbl_header,
+                         purpose_label=self.lbl_purpose,
+                         treeview_commands=self.treeview_commands,
+                         parent_display_text="Audio",
+                         sub_display_text="queue_music",
+                         command_name="queue_music",
+                         purpose_line="Play music right after the current music ends, with no gap.\n"
+                         "If no music is playing, the music plays now.\n"
+                         "Music that is looping never ends, so nothing can be queued after it.",
+                         group_name=GroupName.PLAY)
+
+        page_audio_music_crossfade =\
+            AudioMusicCrossfade(parent_frame=self.frame_contents_outer,
+                         header_label=self.lbl_header,
+                         purpose_label=self.lbl_purpose,
+                         treeview_commands=self.treeview_commands,
+                         parent_display_text="Audio",
+                         sub_display_text="music_crossfade",
+                         command_name="music_crossfade",
+                         purpose_line="Sets how long <play_music> cross-fades from the current music\n"
+                         "into the new music.\n\n"
+                         "0 = no cross-fade (the default).\n"
+                         "Use <load_music> beforehand so the new music is ready to fade in.",
+                         scale_instructions="Choose the number of seconds to cross-fade:",
+                         scale_from_value=0,
+                         scale_to_value=60,
+                         scale_default_value=2,
+                         scale_type=float,
+                         group_name=GroupName.PLAY)
         
         page_audio_play_sound =\
             AudioPlay(parent_frame=self.frame_contents_outer,
@@ -2131,6 +2163,33 @@ class WizardWindow:
                         "Note: this command does not stop a camera shaking effect.\n"
                         "Use <camera_stop_shaking> for that.",
                         group_name=GroupName.ZOOM_PAN)
+        
+        page_camera_quality_fast = \
+            CommandOnly(parent_frame=self.frame_contents_outer,
+                        header_label=self.lbl_header,
+                        purpose_label=self.lbl_purpose,
+                        treeview_commands=self.treeview_commands,
+                        parent_display_text="Camera",
+                        sub_display_text="camera_quality_fast_while_moving",
+                        command_name="camera_quality_fast_while_moving",
+                        purpose_line="Uses a faster, but less smooth, zoom quality while the\n"
+                        "camera is zooming or panning.\n\n"
+                        "Once the camera stops moving, the final view will be smooth.",
+                        when_to_use="When zooming or panning looks choppy on slower computers.",
+                        group_name=GroupName.ZOOM_PAN)
+        
+        page_camera_quality_smooth = \
+            CommandOnly(parent_frame=self.frame_contents_outer,
+                        header_label=self.lbl_header,
+                        purpose_label=self.lbl_purpose,
+                        treeview_commands=self.treeview_commands,
+                        parent_display_text="Camera",
+                        sub_display_text="camera_quality_smooth_always",
+                        command_name="camera_quality_smooth_always",
+                        purpose_line="Uses a smooth zoom quality at all times, even while the\n"
+                        "camera is zooming or panning. This is the default.",
+                        when_to_use="To undo <camera_quality_fast_while_moving>.",
+                        group_name=GroupName.ZOOM_PAN)
 
 
         """
@@ -2593,6 +2652,18 @@ class WizardWindow:
                                        "Provides a fade effect when transitioning between scenes.",
                           group_name=GroupName.RUN_SCRIPT)
 
+        page_general_scene_with_dissolve = \
+            SceneWithDissolve(parent_frame=self.frame_contents_outer,
+                              header_label=self.lbl_header,
+                              purpose_label=self.lbl_purpose,
+                              treeview_commands=self.treeview_commands,
+                              parent_display_text="General",
+                              sub_display_text="scene_with_dissolve",
+                              command_name="scene_with_dissolve",
+                              purpose_line="Cross-dissolve into another scene.\n"
+                                           "The current screen fades out while the new scene plays underneath it.",
+                              group_name=GroupName.RUN_SCRIPT)
+
         page_wait_for_animation = \
             WaitForAnimation(parent_frame=self.frame_contents_outer,
                              header_label=self.lbl_header,
@@ -2772,6 +2843,24 @@ class WizardWindow:
                         sub_display_text="remote_call",
                         command_name="remote_call",
                         purpose_line="Runs a custom script on the server.")
+
+        page_remote_get_cache = \
+            RemoteGetCache(parent_frame=self.frame_contents_outer,
+                           header_label=self.lbl_header,
+                           purpose_label=self.lbl_purpose,
+                           treeview_commands=self.treeview_commands,
+                           parent_display_text="Web",
+                           sub_display_text="remote_get_cache",
+                           command_name="remote_get_cache",
+                           purpose_line="Re-uses <remote_get> values for a number of seconds\n"
+                           "instead of asking the server every time.\n\n"
+                           "0 = don't re-use values (the default).\n"
+                           "A <remote_save> to the same key clears the re-used value.",
+                           scale_instructions="Choose the number of seconds to re-use a value:",
+                           scale_from_value=0,
+                           scale_to_value=86400,
+                           scale_default_value=60,
+                           scale_type=float)
         
 
 
@@ -2783,6 +2872,8 @@ class WizardWindow:
         self.pages["play_music"] = page_audio_play_music
         self.pages["play_sound"] = page_audio_play_sound
         self.pages["play_voice"] = page_audio_play_voice
+        self.pages["queue_music"] = page_audio_queue_music
+        self.pages["music_crossfade"] = page_audio_music_crossfade
         
         self.pages["stop_all_audio"] = page_audio_stop_all_audio
         self.pages["stop_fx"] = page_audio_stop_fx
@@ -2859,6 +2950,7 @@ class WizardWindow:
         self.pages["exit"] = page_exit
 
         self.pages["scene_with_fade"] = page_general_scene_with_fade
+        self.pages["scene_with_dissolve"] = page_general_scene_with_dissolve
         
         """
         Object
@@ -2996,6 +3088,7 @@ class WizardWindow:
         self.pages["remote_get"] = page_remote_get
         self.pages["remote_save"] = page_remote_save
         self.pages["remote_call"] = page_remote_call
+        self.pages["remote_get_cache"] = page_remote_get_cache
         
         """
         Camera
@@ -3006,6 +3099,8 @@ class WizardWindow:
         self.pages["camera_start_moving"] = page_camera_move_start
         self.pages["camera_stop_moving"] = page_camera_move_stop
         self.pages["camera_reset"] = page_camera_reset
+        self.pages["camera_quality_fast_while_moving"] = page_camera_quality_fast
+        self.pages["camera_quality_smooth_always"] = page_camera_quality_smooth
         
         """
         Sequence
@@ -5463,7 +5558,9 @@ class SharedPages:
                 case cc.Volume(scale_value) | cc.HaltAuto(scale_value) | \
                     cc.FontTextDelay(scale_value) | \
                     cc.FontTextFadeSpeed(scale_value) | \
-                    cc.Rest(scale_value):
+                    cc.Rest(scale_value) | \
+                    cc.MusicCrossfade(scale_value) | \
+                    cc.RemoteGetCache(scale_value):
                     
                     # We've now extracted the scale value.
                     pass
@@ -7786,6 +7883,21 @@ class Audio_Volume(SharedPages.SpeedOnly):
                          purpose_line, **kwargs)
 
 
+class AudioMusicCrossfade(SharedPages.SpeedOnly):
+    """
+    <music_crossfade: number of seconds>
+    """
+
+    def __init__(self, parent_frame, header_label, purpose_label,
+                treeview_commands, parent_display_text, sub_display_text,
+                command_name, purpose_line, **kwargs):
+
+        super().__init__(parent_frame, header_label, purpose_label,
+                         treeview_commands, parent_display_text,
+                         sub_display_text, command_name,
+                         purpose_line, **kwargs)
+
+
 class AudioLoad(SharedPages.LoadSpriteNoAlias):
     
     def __init__(self, parent_frame, header_label, purpose_label,
@@ -8615,6 +8727,125 @@ class SceneWithFade(WizardListing):
         return f"<{self.command_name}: {fade_color}, {fade_in_speed}, {fade_out_speed}, {hold_seconds}, {chapter_name}, {scene_name}>"
 
 
+class SceneWithDissolve(SharedPages.SceneScriptSelect):
+    """
+    <scene_with_dissolve: dissolve speed (1-100), chapter name, scene name>
+    
+    1 Label (Dissolve speed)
+    1 Spinbox
+    
+    1 Label (Chapters)
+    1 Combobox
+    
+    1 Label (Scenes)
+    1 Combobox
+    """
+
+    def __init__(self, parent_frame, header_label, purpose_label,
+                 treeview_commands, parent_display_text, sub_display_text,
+                 command_name, purpose_line, **kwargs):
+        super().__init__(parent_frame, header_label, purpose_label,
+                         treeview_commands, parent_display_text,
+                         sub_display_text, command_name, purpose_line, **kwargs)
+
+    def create_content_frame(self) -> ttk.Frame:
+        """
+        Create the chapter and scene widgets, then add
+        a dissolve speed spinbox below them.
+        """
+
+        frame_content = super().create_content_frame()
+
+        # Same default speed as the fade in/out of <scene_with_fade>
+        self.default_dissolve_speed = 10
+        self.v_dissolve_speed = tk.IntVar(value=self.default_dissolve_speed)
+
+        self.lbl_dissolve_speed = ttk.Label(frame_content,
+                                            text="Dissolve speed (1 to 100):")
+        self.spinbox_dissolve_speed = ttk.Spinbox(frame_content,
+                                                  from_=1,
+                                                  to=100,
+                                                  increment=1,
+                                                  textvariable=self.v_dissolve_speed)
+
+        self.lbl_dissolve_speed.grid(row=4, column=0, sticky="w", pady=(15, 0))
+        self.spinbox_dissolve_speed.grid(row=5, column=0, sticky="w")
+
+        return frame_content
+
+    def _edit_populate(self, command_class_object: cc.SceneWithDissolve):
+        """
+        Populate the widgets with the arguments for editing.
+        """
+        
+        # No arguments? return.
+        if not command_class_object:
+            return
+        
+        # Chapter and scene names
+        super()._edit_populate(command_class_object)
+        
+        try:
+            dissolve_speed = int(command_class_object.dissolve_speed)
+        except ValueError:
+            dissolve_speed = self.default_dissolve_speed
+        self.v_dissolve_speed.set(dissolve_speed)
+
+    def check_inputs(self) -> Dict | None:
+        """
+        Check whether the user has inputted sufficient information
+        to use this command.
+        
+        Return: a dict with the chapter name, scene name and dissolve speed.
+        Example:
+        {"ChapterName": "some chapter name",
+         "SceneName": "some scene name",
+         "DissolveSpeed": 10}
+        or None if insufficient information was provided by the user.
+        """
+
+        user_input = super().check_inputs()
+        if not user_input:
+            return
+
+        try:
+            dissolve_speed = self.v_dissolve_speed.get()
+        except tk.TclError:
+            dissolve_speed = None
+
+        if not dissolve_speed or not 1 <= dissolve_speed <= 100:
+            messagebox.showwarning(parent=self.treeview_commands.winfo_toplevel(),
+                                   title="Dissolve speed",
+                                   message="Enter a dissolve speed from 1 to 100.")
+            self.spinbox_dissolve_speed.focus()
+            return
+
+        user_input["DissolveSpeed"] = dissolve_speed
+
+        return user_input
+
+    def generate_command(self) -> str | None:
+        """
+        Return the command based on the user's configuration/selection.
+        """
+
+        # The user input will be a dictionary like this:
+        # {"ChapterName": "some chapter name",
+        #  "SceneName": "some scene name",
+        #  "DissolveSpeed": 10}
+        user_inputs = self.check_inputs()
+
+        if not user_inputs:
+            return
+
+        chapter_name = user_inputs.get("ChapterName")
+        scene_name = user_inputs.get("SceneName")
+        dissolve_speed = user_inputs.get("DissolveSpeed")
+
+        # <scene_with_dissolve: dissolve speed, chapter name, scene name>
+        return f"<{self.command_name}: {dissolve_speed}, {chapter_name}, {scene_name}>"
+
+
 class SequencePlayFrame:
     def __init__(self, master=None):
         self.builder = builder = pygubu.Builder()
@@ -11916,8 +12147,23 @@ class RemoteGet(WizardListing):
                 
                 self.remote_frame.v_get_save_slot.set(save_key)
                 self.remote_frame.v_get_variable.set(variable_name)
-                
-                
+
+
+class RemoteGetCache(SharedPages.SpeedOnly):
+    """
+    <remote_get_cache: number of seconds>
+    """
+
+    def __init__(self, parent_frame, header_label, purpose_label,
+                treeview_commands, parent_display_text, sub_display_text,
+                command_name, purpose_line, **kwargs):
+
+        super().__init__(parent_frame, header_label, purpose_label,
+                         treeview_commands, parent_display_text,
+                         sub_display_text, command_name,
+                         purpose_line, **kwargs)
+
+
 
 
 if __name__ == "__main__":